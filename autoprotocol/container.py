@@ -9,6 +9,7 @@ Container, Well, WellGroup objects and associated functions
 import json
 import warnings
 
+from array import array
 from dataclasses import dataclass
 from typing import Dict, Optional, Union
 
@@ -19,10 +20,24 @@ from .container_type import _CONTAINER_TYPES, ContainerType
 from .unit import Unit, UnitError
 
 
+# Well indices computed by `Container.wells_from_shape`, by (well_count,
+# col_count, origin, rows, columns, format)
+_SHAPE_INDICES = {}
+
+
+def clear_shape_indices():
+    """Clears the well indices cached by `Container.wells_from_shape`"""
+    _SHAPE_INDICES.clear()
+
+
 SEAL_TYPES = ["ultra-clear", "foil", "breathable"]
 COVER_TYPES = ["standard", "low_evaporation", "universal"]
 
 
+# property values that are JSON serializable without being serialized
+_JSON_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
 class EntityPropertiesMixin:
     """
     The mixin for Container and Well entities used to mutate the entity instance
@@ -44,6 +59,8 @@ class EntityPropertiesMixin:
                     f"{str(entity)} property {key} : {value} has a key of type "
                     f"{type(key)}, it should be a 'str'."
                 )
+            if type(value) in _JSON_SCALAR_TYPES:
+                continue
             try:
                 json.dumps(value)
             except TypeError as e:
@@ -68,7 +85,13 @@ class EntityPropertiesMixin:
             Container or Well with modified properties
         """
         self.validate_properties(properties)
-        self.properties = properties.copy()
+        return self._set_properties(properties)
+
+    def _set_properties(self, properties):
+        """Sets properties that already passed validation, see set_properties"""
+        self.properties = _TrackedProperties(properties)
+        self.__dict__["_properties_validated"] = self.__dict__["properties"]
+        self.__dict__.pop("_owned_properties", None)
         return self
 
     def add_properties(self, properties):
@@ -91,19 +114,70 @@ class EntityPropertiesMixin:
         """
 
         self.validate_properties(properties)
+        return self._add_properties(properties)
+
+    def _add_properties(self, properties):
+        """
+        Adds properties that already passed validation, see add_properties.
+
+        Values are shared with the properties they're added from, so lists are
+        copied the first time they're extended, after which they're owned by
+        this entity and extended in place.
+        """
+        validated = self._validated_properties() is not None
+        # lists created by this entity, by property key
+        owned = self.__dict__.setdefault("_owned_properties", {})
+        current_properties = self.properties
         for key, new_value in properties.items():
-            current_value = self.properties.get(key)
-            if key in self.properties:
+            if key in current_properties:
+                current_value = current_properties[key]
                 if isinstance(current_value, list) and isinstance(new_value, list):
-                    current_value.extend(new_value)
+                    if owned.get(key) is current_value:
+                        current_value.extend(new_value)
+                    else:
+                        current_properties[key] = current_value + new_value
+                        owned[key] = current_properties[key]
                 else:
                     message = f"Overwriting existing property {key} for {self}."
                     warnings.warn(message=message)
-                    self.properties[key] = new_value
+                    current_properties[key] = new_value
             else:
-                self.properties[key] = new_value
+                current_properties[key] = new_value
+        if validated:
+            self.__dict__["_properties_validated"] = current_properties
         return self
 
+    def _validated_properties(self):
+        """
+        Gets the properties if they can't have changed since they passed
+        validation, None otherwise. Entities that don't track changes to their
+        properties never know them to be valid.
+        """
+        return None
+
+    def _propagate_properties(self, source):
+        """
+        Adds the properties of another entity, which are only validated again
+        if they could have changed since they last passed validation.
+
+        Parameters
+        ----------
+        source : EntityPropertiesMixin
+            The entity the properties are added from
+
+        Returns
+        -------
+        self
+            Container or Well with modified properties
+        """
+        # pragma pylint: disable=protected-access
+        properties = source._validated_properties()
+        # the lists of the source are shared from now on
+        source.__dict__.pop("_owned_properties", None)
+        if properties is None:
+            return self.add_properties(source.properties)
+        return self._add_properties(properties)
+
     def set_ctx_properties(self, dict_: Dict):
         """
         Sets custom_contextual_properties for an entity (ie: Container or Well).
@@ -161,6 +235,296 @@ class EntityPropertiesMixin:
         return self
 
 
+def _is_container_well(well):
+    """Whether a Well was created by its Container, see Container._well"""
+    # pragma pylint: disable=protected-access
+    return well.container._wells.get(well.index) is well
+
+
+class _WellColumn(object):
+    """
+    A Well attribute that's stored in a column of its Container's well store,
+    see Container._well_store. Wells that weren't created by their Container,
+    e.g. copies, keep the attribute themselves.
+
+    The columns hold the Units that were set, in their own units, so reading
+    the attribute returns them as they were set without building a Unit.
+    Plate-wide queries convert them with one factor per distinct unit, see
+    Container._microliters.
+    """
+
+    def __init__(self, column):
+        self.column = column
+
+    def __get__(self, well, owner=None):
+        if well is None:
+            # the default of the dataclass field, so that Wells created on
+            # access don't overwrite the stored value
+            return self
+        if not _is_container_well(well):
+            return well.__dict__.get(self.column)
+        # pragma pylint: disable=protected-access
+        store = well.container._well_store
+        if store is None:
+            return None
+        return store[self.column][well.index]
+
+    def __set__(self, well, value):
+        if value is self:
+            return
+        if not _is_container_well(well):
+            well.__dict__[self.column] = value
+            return
+        # pragma pylint: disable=protected-access
+        store = getattr(well.container, "_well_store", None)
+        if store is None:
+            if value is None:
+                return
+            store = well.container._create_well_store()
+        store[self.column][well.index] = value
+
+    def __repr__(self):
+        return "None"
+
+
+class _WellAnnotation(object):
+    """
+    A Well attribute that's included in a protocol's "outs". The Well is
+    registered with its Container once the attribute is set or, for mutable
+    attributes, accessed, see Container._annotated_wells. Changes to tracked
+    attributes also mark the Well as stale in the Container's property index,
+    see _PropertyIndex, and as no longer validated, see
+    Well._validated_properties.
+    """
+
+    def __init__(self, attribute, factory=None, tracked=False):
+        self.attribute = attribute
+        self.factory = factory
+        self.tracked = tracked
+
+    @staticmethod
+    def _register(well):
+        """
+        Registers the Well with its Container. Wells that weren't created by
+        their Container, e.g. copies, aren't part of "outs".
+        """
+        if _is_container_well(well):
+            # pragma pylint: disable=protected-access
+            well.container._annotated_wells.add(well.index)
+
+    def _bind(self, well, value):
+        """Notifies the Well of in-place mutations of a tracked attribute"""
+        # pragma pylint: disable=protected-access
+        if (
+            self.tracked
+            and isinstance(value, _TrackedProperties)
+            and not value._tracker
+        ):
+            value._tracker = self, well
+
+    def _track(self, well):
+        """Marks the tracked attribute of the Well as changed"""
+        # pragma pylint: disable=protected-access
+        well.__dict__.pop(f"_{self.attribute}_validated", None)
+        if well.container._property_index is not None:
+            well.container._property_index.stale.add(well.index)
+
+    def __get__(self, well, owner=None):
+        if well is None:
+            # the default of the dataclass field, see _WellColumn
+            return self
+        value = well.__dict__.get(self.attribute)
+        if self.factory is not None:
+            if value is None:
+                value = self.factory()
+                well.__dict__[self.attribute] = value
+                self._bind(well, value)
+            # the value could be mutated in place
+            self._register(well)
+            if self.tracked:
+                self._track(well)
+        return value
+
+    def __set__(self, well, value):
+        if value is self:
+            value = None
+        well.__dict__[self.attribute] = value
+        self._bind(well, value)
+        if self.tracked:
+            self._track(well)
+        if value is not None:
+            self._register(well)
+
+    def __repr__(self):
+        return "None"
+
+
+class _TrackedProperties(dict):
+    """
+    The properties of a Well, which mark the Well as changed when they're
+    mutated in place, see _WellAnnotation._track. Copies are plain
+    dictionaries.
+    """
+
+    __slots__ = ("_tracker",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        #: (annotation, well) that's notified of mutations, see _bind
+        self._tracker = ()
+
+    def _changed(self):
+        # pragma pylint: disable=protected-access
+        if self._tracker:
+            self._tracker[0]._track(self._tracker[1])
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class _PropertyIndex(object):
+    """
+    Inverted index from the property keys and values of a Container's wells
+    to their well indices, see Container.wells_with.
+
+    Wells whose properties were set, accessed or mutated in place since they
+    were indexed are stale, see _WellAnnotation, and are indexed again on the
+    next lookup. Wells whose properties aren't a _TrackedProperties of their
+    own, e.g. a dictionary that was assigned directly, are volatile and are
+    indexed again on every lookup. Values that aren't hashable, e.g. lists,
+    could be mutated without their Well knowing, so they're compared on
+    every lookup for their key.
+    """
+
+    def __init__(self, container):
+        self.container = container
+        #: well indices by property key
+        self.keys = {}
+        #: well indices by (property key, value)
+        self.values = {}
+        #: well indices by property key, for values that aren't hashable
+        self.unhashable = {}
+        #: (property key, value or None) pairs by well index
+        self.entries = {}
+        # pragma pylint: disable=protected-access
+        self.stale = set(container._annotated_wells)
+        #: indices of the wells whose properties aren't tracked
+        self.volatile = set()
+
+    def _properties(self, index):
+        """Gets the properties of a well without marking it as stale"""
+        # pragma pylint: disable=protected-access
+        well = self.container._wells.get(index)
+        return None if well is None else well.__dict__.get("properties")
+
+    def refresh(self):
+        """Indexes the stale and volatile wells again"""
+        # pragma pylint: disable=protected-access
+        self.stale |= self.volatile
+        for index in self.stale:
+            for key, value in self.entries.pop(index, ()):
+                self.keys[key].discard(index)
+                if value is None:
+                    self.unhashable[key].discard(index)
+                else:
+                    self.values[value].discard(index)
+            properties = self._properties(index)
+            if properties is None or (
+                isinstance(properties, _TrackedProperties)
+                and properties._tracker
+                and properties._tracker[1] is self.container._wells.get(index)
+            ):
+                self.volatile.discard(index)
+            else:
+                self.volatile.add(index)
+            entries = []
+            for key, value in (properties or {}).items():
+                self.keys.setdefault(key, set()).add(index)
+                try:
+                    value = (key, value)
+                    hash(value)
+                except TypeError:
+                    value = None
+                    self.unhashable.setdefault(key, set()).add(index)
+                else:
+                    self.values.setdefault(value, set()).add(index)
+                entries.append((key, value))
+            self.entries[index] = entries
+        self.stale.clear()
+
+    def lookup(self, key, value=None):
+        """
+        Gets the indices of the wells with a property.
+
+        Parameters
+        ----------
+        key : str
+            The property key
+        value : optional
+            The value of the property, any value if None
+
+        Returns
+        -------
+        list(int)
+            The matching well indices, in order
+        """
+        self.refresh()
+        candidates = self.keys.get(key, ())
+        if value is not None:
+            try:
+                candidates = self.values.get((key, value), set()) | self.unhashable.get(
+                    key, set()
+                )
+            except TypeError:
+                pass
+        # the candidates are confirmed against the current properties, whether
+        # values match is decided by comparing them, as WellGroup.wells_with
+        # always did
+        matches = []
+        for index in candidates:
+            properties = self._properties(index)
+            if not properties or key not in properties:
+                continue
+            if value is None or properties[key] == value:
+                matches.append(index)
+        return sorted(matches)
+
+
 @dataclass(eq=False)
 class Well(EntityPropertiesMixin):
     """
@@ -184,12 +548,14 @@ class Well(EntityPropertiesMixin):
 
     container: "Container"  # Forward references
     index: int
-    volume: Optional[Union[str, Unit]] = None
-    mass: Optional[Union[str, Unit]] = None
-    name: Optional[str] = None
+    volume: Optional[Union[str, Unit]] = _WellColumn("volume")
+    mass: Optional[Union[str, Unit]] = _WellColumn("mass")
+    name: Optional[str] = _WellAnnotation("name")
     compounds: Optional[list] = None
-    properties: Optional[dict] = None
-    ctx_properties: Optional[dict] = None
+    properties: Optional[dict] = _WellAnnotation(
+        "properties", _TrackedProperties, tracked=True
+    )
+    ctx_properties: Optional[dict] = _WellAnnotation("ctx_properties", dict)
 
     def __post_init__(self):
         if not isinstance(self.container, Container):
@@ -198,11 +564,29 @@ class Well(EntityPropertiesMixin):
                 f"is not valid: {self.container}"
             )
 
-        if not isinstance(self.properties, dict):
-            self.properties = dict()
-
-        if not isinstance(self.ctx_properties, dict):
-            self.ctx_properties = dict()
+        # empty properties are only created when they're first accessed
+        for attribute in ["properties", "ctx_properties"]:
+            if not isinstance(self.__dict__[attribute], (dict, type(None))):
+                self.__dict__[attribute] = None
+
+    def __copy__(self):
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        # the copy isn't the Container's Well, so it keeps its own volume and
+        # mass instead of sharing the Container's well store, see _WellColumn
+        copied.__dict__["volume"] = self.volume
+        copied.__dict__["mass"] = self.mass
+        return copied
+
+    def _validated_properties(self):
+        properties = self.__dict__.get("properties")
+        if not properties:
+            return {}
+        # the properties are no longer validated once they're handed out, as
+        # they could be mutated in place, see _WellAnnotation
+        if properties is self.__dict__.get("_properties_validated"):
+            return properties
+        return None
 
     def set_mass(self, mass):
         """
@@ -459,19 +843,132 @@ class WellGroup(object):
         if isinstance(wells, Well):
             wells = [wells]
         elif isinstance(wells, WellGroup):
-            wells = wells.wells
+            wells = wells._wells
         elif isinstance(wells, list):
             if not all(isinstance(well, Well) for well in wells):
                 raise TypeError("All elements in list must be wells")
         else:
             raise TypeError("Wells must be Well, list of wells, WellGroup.")
 
-        self.wells = wells
+        self._wells = wells
         self.name = None
+        # first position of each well by identity, see `_well_positions`
+        self._positions = None
+        self._indexed_length = 0
+
+    @classmethod
+    def _from_wells(cls, wells):
+        """
+        Creates a WellGroup from a list of Wells that are known to be Wells,
+        without checking each of them.
+        """
+        group = cls.__new__(cls)
+        # pragma pylint: disable=protected-access
+        group._wells = wells
+        group.name = None
+        group._positions = None
+        group._indexed_length = 0
+        return group
+
+    @classmethod
+    def _from_indices(cls, container, indices):
+        """
+        Creates a WellGroup of the Wells at robotized indices of a Container,
+        e.g. an array of indices, without checking each of them.
+        """
+        # pragma pylint: disable=protected-access
+        well = container._well
+        return cls._from_wells([well(index) for index in indices])
+
+    @property
+    def wells(self):
+        """
+        list(Well): The Wells of this WellGroup. Changes to the list are
+        reflected by the WellGroup.
+        """
+        # the list can be mutated by the caller, which invalidates the index
+        self._positions = None
+        return self._wells
+
+    @wells.setter
+    def wells(self, wells):
+        self._wells = wells
+        self._positions = None
+
+    def _well_positions(self):
+        """
+        Returns
+        -------
+        dict(int, int)
+            The first position of each Well by its id, which is built on first
+            use and kept up to date by appending methods.
+        """
+        if self._positions is None or self._indexed_length != len(self._wells):
+            positions = {}
+            for position, well in enumerate(self._wells):
+                positions.setdefault(id(well), position)
+            self._positions = positions
+            self._indexed_length = len(self._wells)
+        return self._positions
+
+    def _index_appended(self, start):
+        """Indexes the Wells that were appended from position `start`"""
+        if self._positions is not None and self._indexed_length == start:
+            positions = self._positions
+            for position in range(start, len(self._wells)):
+                positions.setdefault(id(self._wells[position]), position)
+            self._indexed_length = len(self._wells)
+        else:
+            self._positions = None
+
+    def index(self, well):
+        """
+        Return the position of the first occurrence of a Well in this
+        WellGroup.
+
+        Parameters
+        ----------
+        well : Well
+            Well to search for
+
+        Returns
+        -------
+        int
+            Position of the Well
+
+        Raises
+        ------
+        ValueError
+            Well is not in this WellGroup
+        """
+        position = self._well_positions().get(id(well))
+        if position is not None and self._wells[position] is not well:
+            # the list was changed through another WellGroup sharing it
+            self._positions = None
+            position = self._well_positions().get(id(well))
+        if position is None:
+            raise ValueError(f"{well} is not in WellGroup")
+        return position
+
+    def __contains__(self, item):
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._wells)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # copies of the Wells have different ids
+        state["_positions"] = None
+        return state
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._wells == other._wells and self.name == other.name
         else:
             return False
 
@@ -490,8 +987,11 @@ class WellGroup(object):
             WellGroup with modified properties
 
         """
-        for w in self.wells:
-            w.set_properties(properties)
+        if self._wells:
+            Well.validate_properties(properties)
+        for w in self._wells:
+            # pragma pylint: disable=protected-access
+            w._set_properties(properties)
         return self
 
     def add_properties(self, properties):
@@ -509,8 +1009,11 @@ class WellGroup(object):
             WellGroup with modified properties
 
         """
-        for w in self.wells:
-            w.add_properties(properties)
+        if self._wells:
+            Well.validate_properties(properties)
+        for w in self._wells:
+            # pragma pylint: disable=protected-access
+            w._add_properties(properties)
         return self
 
     def set_volume(self, vol):
@@ -528,7 +1031,7 @@ class WellGroup(object):
             WellGroup with modified volume
 
         """
-        for w in self.wells:
+        for w in self._wells:
             w.set_volume(vol)
         return self
 
@@ -543,8 +1046,8 @@ class WellGroup(object):
             List of humanized indices from this WellGroup
         """
         indices = []
-        for w in self.wells:
-            assert w.container == self.wells[0].container, (
+        for w in self._wells:
+            assert w.container == self._wells[0].container, (
                 "All wells in WellGroup must belong to the same container to "
                 "get their indices."
             )
@@ -552,7 +1055,8 @@ class WellGroup(object):
 
         return indices
 
-    def append(self, other):
+    # like list.append, this returns None
+    def append(self, other):  # pylint: disable=redundant-returns-doc
         """
         Append another well to this WellGroup.
 
@@ -575,9 +1079,11 @@ class WellGroup(object):
         if not isinstance(other, Well):
             raise TypeError("Input given is not of type 'Well'.")
         else:
-            return self.wells.append(other)
+            self._wells.append(other)
+            self._index_appended(len(self._wells) - 1)
 
-    def extend(self, other):
+    # like list.extend, this returns None
+    def extend(self, other):  # pylint: disable=redundant-returns-doc
         """
         Extend this WellGroup with another WellGroup.
 
@@ -602,7 +1108,10 @@ class WellGroup(object):
         else:
             if not all(isinstance(well, Well) for well in other):
                 raise TypeError("Input given is not of type 'Well'.")
-            return self.wells.extend(WellGroup(other).wells)
+            start = len(self._wells)
+            # pragma pylint: disable=protected-access
+            self._wells.extend(WellGroup(other)._wells)
+            self._index_appended(start)
 
     def set_group_name(self, name):
         """
@@ -646,15 +1155,17 @@ class WellGroup(object):
         if not isinstance(prop, str):
             raise TypeError(f"property is not a string: {prop!r}")
         if val is not None:
-            return WellGroup(
+            return WellGroup._from_wells(
                 [
                     w
-                    for w in self.wells
+                    for w in self._wells
                     if prop in w.properties and w.properties[prop] == val
                 ]
             )
         else:
-            return WellGroup([w for w in self.wells if prop in w.properties])
+            return WellGroup._from_wells(
+                [w for w in self._wells if prop in w.properties]
+            )
 
     def pop(self, index=-1):
         """
@@ -674,7 +1185,9 @@ class WellGroup(object):
             Well with selected index from WellGroup
 
         """
-        return self.wells.pop(index)
+        well = self._wells.pop(index)
+        self._positions = None
+        return well
 
     def insert(self, i, well):
         """
@@ -703,11 +1216,15 @@ class WellGroup(object):
         if not isinstance(well, Well):
             raise TypeError("Input given is not of type 'Well'")
 
-        if i >= len(self.wells):
-            return self.wells.append(well)
+        if i >= len(self._wells):
+            self._wells.append(well)
+            self._index_appended(len(self._wells) - 1)
+            return None
         else:
-            self.wells = self.wells[:i] + [well] + self.wells[i:]
-            return self.wells
+            # a new list, the current one can be shared with other WellGroups
+            self._wells = self._wells[:i] + [well] + self._wells[i:]
+            self._positions = None
+            return self._wells
 
     def __setitem__(self, key, item):
         """
@@ -727,7 +1244,8 @@ class WellGroup(object):
         """
         if not isinstance(item, Well):
             raise TypeError("Input given is not of type 'Well'.")
-        self.wells[key] = item
+        self._wells[key] = item
+        self._positions = None
 
     def __getitem__(self, key):
         """
@@ -743,21 +1261,21 @@ class WellGroup(object):
         Well
             Specified well from given key
         """
-        return self.wells[key]
+        return self._wells[key]
 
     def __len__(self):
         """
         Return the number of Wells in a WellGroup.
 
         """
-        return len(self.wells)
+        return len(self._wells)
 
     def __repr__(self):
         """
         Return a string representation of a WellGroup.
 
         """
-        return "WellGroup(%s)" % (str(self.wells))
+        return "WellGroup(%s)" % (str(self._wells))
 
     def __add__(self, other):
         """
@@ -781,9 +1299,9 @@ class WellGroup(object):
         if not isinstance(other, (Well, WellGroup)):
             raise TypeError("You can only add a Well or WellGroups " "together.")
         if isinstance(other, Well):
-            return WellGroup(self.wells + [other])
+            return WellGroup._from_wells(self._wells + [other])
         else:
-            return WellGroup(self.wells + other.wells)
+            return WellGroup._from_wells(self._wells + other._wells)
 
 
 # pylint: disable=redefined-builtin
@@ -868,7 +1386,106 @@ class Container(EntityPropertiesMixin):
         if not isinstance(self.ctx_properties, dict):
             self.ctx_properties = dict()
 
-        self._wells = [Well(self, idx) for idx in range(self.container_type.well_count)]
+        # Wells by index, which are only created when they're first accessed
+        self._wells = {}
+        # Columns of well volumes and masses by well index, which are only
+        # created when a volume or mass is first set
+        self._well_store = None
+        # Indices of wells whose name, properties or ctx_properties were set
+        # or accessed, which are the only ones that can be part of "outs"
+        self._annotated_wells = set()
+        # Inverted index of well properties, which is only built when wells
+        # are first queried by their properties
+        self._property_index = None
+
+    def _create_well_store(self):
+        """
+        Creates the columns that back the volume and mass of each Well, which
+        are lists of Units or None by well index, see _WellColumn
+        """
+        well_count = self.container_type.well_count
+        self._well_store = {"volume": [None] * well_count, "mass": [None] * well_count}
+        return self._well_store
+
+    def _well(self, index):
+        """
+        Gets the Well at a robotized index, creating it on first access so
+        that it's the same Well object for the lifetime of the Container.
+        """
+        try:
+            return self._wells[index]
+        except KeyError:
+            well = Well(self, index)
+            self._wells[index] = well
+            return well
+
+    def _materialized_wells(self):
+        """
+        Returns
+        -------
+        list(Well)
+            The Wells that were accessed so far, ordered by index. Other
+            wells don't have any state yet.
+        """
+        return [self._wells[index] for index in sorted(self._wells)]
+
+    def _annotated_wells_sorted(self):
+        """
+        Returns
+        -------
+        list(Well)
+            The Wells that could have a name, properties or ctx_properties,
+            ordered by index. Other wells don't have any of them.
+        """
+        return [self._wells[index] for index in sorted(self._annotated_wells)]
+
+    def _wells_with_indices(self, prop, val=None):
+        """
+        Gets the indices of the wells with a property from the property
+        index, see `wells_with`.
+        """
+        if self._property_index is None:
+            self._property_index = _PropertyIndex(self)
+        return self._property_index.lookup(prop, val)
+
+    def wells_with(self, prop, val=None):
+        """
+        Returns a WellGroup of the wells of this Container with the specified
+        property and value.
+
+        The wells are looked up in an inverted index of the well properties,
+        which is built on the first call and kept up to date as properties
+        are set, accessed or mutated in place. Matches are confirmed against
+        the current properties, as WellGroup.wells_with does.
+
+        Example Usage:
+
+        .. code-block:: python
+
+            plate.wells(0, 1).set_properties({"condition": "control"})
+            plate.wells_with("condition", "control")
+
+        Parameters
+        ----------
+        prop: str
+            the property you are searching for
+        val: str, optional
+            the value assigned to the property, any value if not specified
+
+        Returns
+        -------
+        WellGroup
+            The wells with the property, ordered by index
+
+        Raises
+        ------
+        TypeError
+            property is not a string
+        """
+        if not isinstance(prop, str):
+            raise TypeError(f"property is not a string: {prop!r}")
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_indices(self, self._wells_with_indices(prop, val))
 
     def well(self, i) -> Well:
         """
@@ -893,7 +1510,7 @@ class Container(EntityPropertiesMixin):
         """
         if not isinstance(i, (int, str)):
             raise TypeError("Well reference given is not of type 'int' or " "'str'.")
-        return self._wells[self.robotize(i)]
+        return self._well(self.robotize(i))
 
     def well_from_coordinates(self, row, column):
         """
@@ -975,7 +1592,8 @@ class Container(EntityPropertiesMixin):
                     "Well reference given is not of type" " 'int', 'str' or 'list'."
                 )
 
-        return WellGroup([self.well(w) for w in wells])
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_wells([self.well(w) for w in wells])
 
     def robotize(self, well_ref):
         """
@@ -1038,18 +1656,20 @@ class Container(EntityPropertiesMixin):
             WellGroup of all Wells in Container
 
         """
+        # pragma pylint: disable=protected-access
         if columnwise:
             num_cols = self.container_type.col_count
             num_rows = self.container_type.well_count // num_cols
-            return WellGroup(
-                [
-                    self._wells[row * num_cols + col]
+            return WellGroup._from_indices(
+                self,
+                (
+                    row * num_cols + col
                     for col in range(num_cols)
                     for row in range(num_rows)
-                ]
+                ),
             )
         else:
-            return WellGroup(self._wells)
+            return WellGroup._from_indices(self, range(self.container_type.well_count))
 
     def inner_wells(self, columnwise=False):
         """
@@ -1082,8 +1702,8 @@ class Container(EntityPropertiesMixin):
             for _ in range(1, num_rows - 1):
                 inner_wells.extend(range(well + 1, well + (num_cols - 1)))
                 well += num_cols
-        inner_wells = [self._wells[x] for x in inner_wells]
-        return WellGroup(inner_wells)
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_indices(self, inner_wells)
 
     def wells_from(self, start, num, columnwise=False):
         """
@@ -1125,7 +1745,10 @@ class Container(EntityPropertiesMixin):
             row, col = self.decompose(start)
             num_rows = self.container_type.row_count()
             start = col * num_rows + row
-        return WellGroup(self.all_wells(columnwise).wells[start : start + num])
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_wells(
+            self.all_wells(columnwise)._wells[start : start + num]
+        )
 
     def is_sealed(self):
         """
@@ -1187,7 +1810,7 @@ class Container(EntityPropertiesMixin):
 
         if n_wells == 96:
             if quad == 0:
-                return WellGroup(self._wells)
+                return self.all_wells()
             else:
                 raise ValueError(
                     "0 or 'A1' is the only valid quadrant for a 96-well " "plate."
@@ -1207,6 +1830,106 @@ class Container(EntityPropertiesMixin):
 
         return self.wells(wells)
 
+    def set_volume(self, vol):
+        """
+        Set the theoretical volume of liquid in all wells of this Container.
+
+        Unlike WellGroup.set_volume, this doesn't need to create a Well
+        object for every well.
+
+        Parameters
+        ----------
+        vol : str, Unit
+            Theoretical volume to indicate for all wells.
+
+        Returns
+        -------
+        Container
+            Container with modified well volumes
+
+        Raises
+        ------
+        TypeError
+            Incorrect input-type given
+        ValueError
+            Volume set exceeds maximum well volume
+        """
+        if not isinstance(vol, str) and not isinstance(vol, Unit):
+            raise TypeError(
+                f"Volume {vol} is of type {type(vol)}, it should be either "
+                f"'str' or 'Unit'."
+            )
+
+        v = Unit(vol)
+        max_vol = self.container_type.true_max_vol_ul
+        if v > max_vol:
+            containerIdInfo = ""
+            if self.id:
+                containerIdInfo = f" with container ID: {self.id}"
+
+            raise ValueError(
+                f"Theoretical volume [{v}] to be set exceeds maximum well "
+                f"volume [{max_vol}] for container '{self.name}'{containerIdInfo} "
+                f"when setting the volume for all wells."
+            )
+
+        store = self._well_store or self._create_well_store()
+        store["volume"] = [v] * self.container_type.well_count
+        return self
+
+    def total_volume(self):
+        """
+        Sums the theoretical volumes of all wells of this Container. Wells
+        without a volume are ignored.
+
+        Returns
+        -------
+        Unit
+            Total volume in microliters
+        """
+        total = sum(magnitude for _, magnitude in self._microliters())
+        return Unit(total, "microliter")
+
+    def wells_below_dead_volume(self):
+        """
+        Gets the wells whose theoretical volume is below the dead volume of
+        the ContainerType. Wells without a volume are ignored.
+
+        Returns
+        -------
+        WellGroup
+            Wells with less volume than the dead volume, ordered by index
+        """
+        dead_volume = self.container_type.dead_volume_ul.to("microliter").magnitude
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_indices(
+            self,
+            (
+                index
+                for index, magnitude in self._microliters()
+                if magnitude < dead_volume
+            ),
+        )
+
+    def _microliters(self):
+        """
+        Yields the index and volume in microliters of each well with a
+        volume, converting with a single factor per distinct unit.
+        """
+        if self._well_store is None:
+            return
+        factors = {}
+        for index, volume in enumerate(self._well_store["volume"]):
+            if volume is None:
+                continue
+            # pragma pylint: disable=protected-access
+            try:
+                factor = factors[volume._units]
+            except KeyError:
+                factor = Unit(1, volume._units).to("microliter").magnitude
+                factors[volume._units] = factor
+            yield index, volume.magnitude * factor
+
     def set_storage(self, storage):
         """
         Set the storage condition of a container, will overwrite
@@ -1302,6 +2025,37 @@ class Container(EntityPropertiesMixin):
         shape = Instruction.builders.shape(**shape)
         origin = self.well(origin)
 
+        key = (
+            self.container_type.well_count,
+            self.container_type.col_count,
+            origin.index,
+            shape["rows"],
+            shape["columns"],
+            shape["format"],
+        )
+        try:
+            indices = _SHAPE_INDICES[key]
+        except KeyError:
+            indices = self._shape_indices(origin, shape)
+            _SHAPE_INDICES[key] = indices
+
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_indices(self, indices)
+
+    def _shape_indices(self, origin, shape):
+        """
+        Computes the well indices of `wells_from_shape`, see there.
+
+        Returns
+        -------
+        array.array
+            The well indices distributed in `shape` from the `origin`
+
+        Raises
+        ------
+        ValueError
+            if the shape exceeds the extents of the container
+        """
         # unpacking container and shape format properties
         container_rows = self.container_type.row_count()
         container_cols = self.container_type.col_count
@@ -1336,8 +2090,8 @@ class Container(EntityPropertiesMixin):
                 f"container: {self}"
             )
 
-        return WellGroup(
-            [self.well_from_coordinates(x, y) for x in well_rows for y in well_cols]
+        return array(
+            "I", (x * container_cols + y for x in well_rows for y in well_cols)
         )
 
     def __repr__(self):
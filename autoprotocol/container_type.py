@@ -182,6 +182,21 @@ class ContainerType(
 
     @staticmethod
     def robotize_static(well_ref, well_count, col_count):
+        table = _well_index_table(well_count, col_count)
+        if isinstance(well_ref, list):
+            try:
+                # answers lists of well names in a single pass
+                return [table.indices[well] for well in well_ref]
+            except (KeyError, TypeError):
+                return [table.robotize(well) for well in well_ref]
+        return table.robotize(well_ref)
+
+    @staticmethod
+    def _parse_well_ref(well_ref, well_count, col_count):
+        """
+        Parses a well reference that isn't in the well index table, e.g.
+        "a01", or raises the appropriate error for it.
+        """
         from .container import Well
 
         if isinstance(well_ref, list):
@@ -272,6 +287,17 @@ class ContainerType(
 
     @staticmethod
     def humanize_static(well_ref, well_count, col_count):
+        table = _well_index_table(well_count, col_count)
+        if isinstance(well_ref, list):
+            return [table.humanize(well) for well in well_ref]
+        return table.humanize(well_ref)
+
+    @staticmethod
+    def _format_well_ref(well_ref, well_count, col_count):
+        """
+        Humanizes a well reference that isn't in the well index table, e.g.
+        "05", or raises the appropriate error for it.
+        """
         ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
         if isinstance(well_ref, list):
             return [
@@ -370,7 +396,7 @@ class ContainerType(
         if not isinstance(idx, (int, str, Well)):
             raise TypeError("Well index given is not of type 'int' or " "'str'.")
         idx = self.robotize(idx)
-        return (idx // self.col_count, idx % self.col_count)
+        return _well_index_table(self.well_count, self.col_count).coordinates[idx]
 
     def row_count(self):
         """
@@ -380,6 +406,85 @@ class ContainerType(
         return self.well_count // self.col_count
 
 
+class _WellIndexTable(object):
+    """
+    Dense lookup tables between well names, indices and coordinates for a
+    well layout. See `_well_index_table`.
+    """
+
+    ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+    def __init__(self, well_count, col_count):
+        self.well_count = well_count
+        self.col_count = col_count
+        #: (row, column) by well index
+        self.coordinates = [divmod(idx, col_count) for idx in range(well_count)]
+        #: human readable name by well index
+        self.names = [self._name(row, col) for row, col in self.coordinates]
+        #: well index by human readable name and by integer string
+        self.indices = {name: idx for idx, name in enumerate(self.names)}
+        self.indices.update((str(idx), idx) for idx in range(well_count))
+        self.indices.update((name.lower(), idx) for idx, name in enumerate(self.names))
+
+    def _name(self, row, col):
+        if row >= len(self.ALPHABET):
+            return self.ALPHABET[row // 26 - 1] + self.ALPHABET[row % 26] + str(col + 1)
+        return self.ALPHABET[row] + str(col + 1)
+
+    def robotize(self, well_ref):
+        """See ContainerType.robotize"""
+        if type(well_ref) is str:
+            try:
+                return self.indices[well_ref]
+            except KeyError:
+                pass
+        elif type(well_ref) is int and 0 <= well_ref < self.well_count:
+            return well_ref
+        # pragma pylint: disable=protected-access
+        return ContainerType._parse_well_ref(well_ref, self.well_count, self.col_count)
+
+    def humanize(self, well_ref):
+        """See ContainerType.humanize"""
+        if type(well_ref) is int:
+            if 0 <= well_ref < self.well_count:
+                return self.names[well_ref]
+        elif type(well_ref) is str:
+            idx = self.indices.get(well_ref)
+            if idx is not None and well_ref.isdigit():
+                return self.names[idx]
+        # pragma pylint: disable=protected-access
+        return ContainerType._format_well_ref(well_ref, self.well_count, self.col_count)
+
+
+# Well index tables by (well_count, col_count), which are built on first use
+_WELL_INDEX_TABLES = {}
+
+
+def _well_index_table(well_count, col_count):
+    """
+    Gets the well index table for a well layout, which is shared by all
+    ContainerTypes with the same layout.
+
+    Parameters
+    ----------
+    well_count : int
+        Number of wells of the layout
+    col_count : int
+        Number of columns of the layout
+
+    Returns
+    -------
+    _WellIndexTable
+        The lookup tables for the layout
+    """
+    try:
+        return _WELL_INDEX_TABLES[well_count, col_count]
+    except KeyError:
+        table = _WellIndexTable(well_count, col_count)
+        _WELL_INDEX_TABLES[well_count, col_count] = table
+        return table
+
+
 #:
 FLAT384 = ContainerType(
     name="384-well UV flat-bottom plate",
@@ -10,6 +10,7 @@ Module containing the harness module which helps with Manifest interpretation
 import argparse
 import io
 import json
+import sys
 
 from . import UserError
 from .compound import Compound, CompoundError
@@ -608,7 +609,10 @@ def run(fn, protocol_name=None, seal_after_run=True, protocol_class=None):
         )
         return
 
-    print(json.dumps(protocol.as_dict(), indent=2))
+    # written piece by piece so large protocols don't need to be held in
+    # memory as a whole
+    protocol.write_json(sys.stdout, indent=2)
+    print()
 
 
 def _add_dye_to_preview_refs(protocol, rs=_DYE_TEST_RS["dye4000"]):
@@ -12,6 +12,7 @@ from .builders import *  # pylint: disable=unused-wildcard-import
 from .constants import PROVISION_MEASUREMENT_MODES
 from .container import Container
 from .informatics import AttachCompounds, Informatics
+from .util import _remove_empty_fields
 
 
 class Instruction(object):
@@ -25,11 +26,9 @@ class Instruction(object):
         if informatics is None:
             informatics = []
         self.op = op
-        self.data = self._remove_empty_fields(self._remove_empty_fields(data))
+        self.data = _remove_empty_fields(data, passes=2)
         self.__dict__.update(self.data)
-        self.informatics = self._remove_empty_fields(
-            self._remove_empty_fields(informatics)
-        )
+        self.informatics = _remove_empty_fields(informatics, passes=2)
 
         if len(self.informatics) > 0:
             self._check_informatics()
@@ -81,27 +80,7 @@ class Instruction(object):
             Dictionary or list without fields with None values
 
         """
-        # We're not checking against the generic not since there are values
-        # such as `0` or False which are valid.
-        def filter_criteria(item):
-            # Workaround for Unit equality comparison issues
-            if isinstance(item, Unit):
-                return False
-            return item is None or item == [] or item == {}
-
-        if isinstance(data, dict):
-            return {
-                k: Instruction._remove_empty_fields(v)
-                for k, v in data.items()
-                if not filter_criteria(v)
-            }
-        if isinstance(data, list):
-            return [
-                Instruction._remove_empty_fields(_)
-                for _ in data
-                if not filter_criteria(_)
-            ]
-        return data
+        return _remove_empty_fields(data)
 
     def _check_informatics(self):
         """
@@ -119,11 +98,14 @@ class Instruction(object):
             raise TypeError(
                 f"informatics: {self.informatics} must be provided in a list."
             )
+        # the wells of the data are indexed once for all informatics
+        available_wells = None
         for info in self.informatics:
             if not isinstance(info, Informatics):
                 raise TypeError("informatics must be Informatics type.")
             if isinstance(info, AttachCompounds):
-                available_wells = self.get_wells(self.data)
+                if available_wells is None:
+                    available_wells = self._index_wells(self.data)
                 self._check_info_wells(info, available_wells)
 
     @staticmethod
@@ -132,6 +114,13 @@ class Instruction(object):
         validates Informatics wells are included in the wells associated with
         the instruction.
 
+        Parameters
+        ----------
+        info : Informatics
+            Informatics whose wells are validated
+        available_wells : dict(int, Well) or list(Well)
+            Wells of the instruction, either by their id or as a list
+
         Raises
         -------
         ValueError
@@ -141,6 +130,8 @@ class Instruction(object):
         ValueError
             Informatics wells are part of wells Instruction is operating on
         """
+        if not isinstance(available_wells, dict):
+            available_wells = {id(well): well for well in available_wells}
         if not info.wells:
             raise ValueError(
                 f"Informatics: {info} must have wells to run this validation."
@@ -153,7 +144,7 @@ class Instruction(object):
         wells = WellGroup(info_wells)
 
         for well in wells.wells:
-            if well not in available_wells:
+            if id(well) not in available_wells:
                 raise ValueError(
                     f"informatics well: {wells} must be one of the wells "
                     f"used in this instruction."
@@ -176,25 +167,42 @@ class Instruction(object):
             List of all wells associated with the instruction. Note this contains
             all source and destination wells for instructions such as `liquid_handle`.
         """
-        all_wells = []
-        if isinstance(op_data, dict):
-            for k, v in op_data.items():
-                all_wells.append(self.get_wells(v))
-        elif isinstance(op_data, list):
-            for i in op_data:
-                all_wells.extend([self.get_wells(i)])
-        # if container is provided, all wells in the container are included
-        elif isinstance(op_data, Container):
-            all_wells.append(op_data.all_wells())
-        elif is_valid_well(op_data):
-            all_wells.append(WellGroup(op_data))
-
-        flattened_wells = [item for sublist in all_wells for item in sublist]
-        # remove any duplicate values in the list
-        unique_wells = []
-        [unique_wells.append(x) for x in flattened_wells if x not in unique_wells]
-
-        return unique_wells
+        return list(self._index_wells(op_data).values())
+
+    @staticmethod
+    def _index_wells(op_data):
+        """
+        Collects the unique wells of instruction data by identity in the order
+        they first occur in, see `get_wells`.
+
+        Parameters
+        ----------
+        op_data: dict
+            Instruction data containing all the operational parameters
+
+        Returns
+        -------
+        dict(int, Well)
+            All wells associated with the data by their id
+        """
+        wells = {}
+        stack = [op_data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
+            # if container is provided, all wells in the container are included
+            elif isinstance(item, Container):
+                for well in item.all_wells().wells:
+                    wells.setdefault(id(well), well)
+            elif isinstance(item, Well):
+                wells.setdefault(id(item), item)
+            elif isinstance(item, WellGroup):
+                for well in item.wells:
+                    wells.setdefault(id(well), well)
+        return wells
 
 
 class MagneticTransfer(Instruction):
@@ -9,7 +9,7 @@ from typing import List, Optional, Union
 from ..instruction import LiquidHandle
 from ..unit import Unit
 from ..util import parse_unit
-from .liquid_handle_method import LiquidHandleMethod
+from .liquid_handle_method import LiquidHandleMethod, _memoize_transports
 
 
 # pylint: disable=protected-access
@@ -102,6 +102,7 @@ class Dispense(LiquidHandleMethod):
             )
         )
 
+    @_memoize_transports
     def _aspirate_transports(self, volume: Unit) -> List[dict]:
         """Generates source well transports
 
@@ -127,6 +128,7 @@ class Dispense(LiquidHandleMethod):
         self._transport_aspirate_target_volume(total_aspirate_volume)
         return self._transports
 
+    @_memoize_transports
     def _dispense_transports(self, volume: Unit) -> List[dict]:
         """Generates destination well transports
 
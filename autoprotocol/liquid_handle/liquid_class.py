@@ -8,6 +8,7 @@ intrinsic to specific types of liquids.
     :license: BSD, see LICENSE for more details
 
 """
+from bisect import bisect_left
 from collections import namedtuple
 from dataclasses import dataclass
 from numbers import Number
@@ -249,6 +250,52 @@ class LiquidClass:
             flowrate = None
         return flowrate
 
+    def _calibration_bins(self, volume, tip_type):
+        """Gets the calibration bins that a volume falls into
+
+        Volumes that fall into the same bins share their flowrates and the
+        slope and intercept of their calibrated volumes.
+
+        Parameters
+        ----------
+        volume : Unit
+            the volume to be binned
+        tip_type : str
+            liquid handling device to be used for the transfer
+
+        Returns
+        -------
+        tuple or None
+            the position of the bin in each calibration curve that is used,
+            or None if a subclass overrides how calibrations are looked up
+
+        Raises
+        ------
+        KeyError
+            if a calibration curve doesn't support the tip_type
+        RuntimeError
+            if there is no suitably large calibration bin
+        """
+        lookups = (
+            "_get_calibrated_volume",
+            "_get_aspirate_flowrate",
+            "_get_dispense_flowrate",
+        )
+        if any(getattr(type(self), _) is not getattr(LiquidClass, _) for _ in lookups):
+            return None
+        calibrations = [
+            (self.calibrated_volume, self.volume_calibration_curve),
+            (self.aspirate_flowrate, self.aspirate_flowrate_calibration_curve),
+            (self.dispense_flowrate, self.dispense_flowrate_calibration_curve),
+        ]
+        # pylint: disable=unsubscriptable-object, protected-access
+        return tuple(
+            curve[tip_type]._bin_position(parse_unit(volume, "microliter"))
+            if override is None and curve is not None
+            else None
+            for override, curve in calibrations
+        )
+
 
 class VolumeCalibrationBin(namedtuple("VolumeCalibrationBin", ["slope", "intercept"])):
     """Wrapper for slope and intercept parameters for linear fitting
@@ -325,6 +372,32 @@ class VolumeCalibration(object):
         sorted_curve = list(sorted(calibration_curve, key=lambda k: k[0]))
 
         self.calibration_curve = sorted_curve
+        # the curve is compiled into the upper bounds of its bins in
+        # microliters, which are searched with bisect
+        self._bin_bounds = [self._microliters(bin) for bin, _ in sorted_curve]
+        self._bin_points = [point for _, point in sorted_curve]
+
+    @staticmethod
+    def _microliters(volume):
+        """Gets the magnitude of a volume in microliters"""
+        if volume.units != "microliter":
+            volume = volume.to("microliter")
+        return volume.magnitude
+
+    def _bin_position(self, volume):
+        """Gets the position of the smallest suitable bin for a volume parsed
+        as a Unit"""
+        position = bisect_left(self._bin_bounds, self._microliters(volume))
+        if position == len(self._bin_points):
+            raise RuntimeError(
+                f"No volume calibration bin in {self.calibration_curve} is "
+                f"large enough to accommodate {volume}."
+            )
+        return position
+
+    def _bin_for(self, volume):
+        """Gets the smallest suitable bin for a volume parsed as a Unit"""
+        return self._bin_points[self._bin_position(volume)]
 
     def binned_calibration_for_volume(self, volume):
         """Gets the smallest suitable bin in the calibration curve
@@ -346,16 +419,26 @@ class VolumeCalibration(object):
         RuntimeError
             No suitably large calibration bin
         """
-        volume = parse_unit(volume, "microliter")
+        return self._bin_for(parse_unit(volume, "microliter"))
 
-        valid_bins = list(
-            point
-            for _, point in filter(lambda b: b[0] >= volume, self.calibration_curve)
-        )
-        if not valid_bins:
-            raise RuntimeError(
-                f"No volume calibration bin in {self.calibration_curve} is "
-                f"large enough to accommodate {volume}."
-            )
+    def binned_calibrations_for_volumes(self, volumes):
+        """Gets the smallest suitable bins in the calibration curve
+        Finds the smallest suitable bin for each of the specified values, see
+        `binned_calibration_for_volume`.
 
-        return valid_bins[0]
+        Parameters
+        ----------
+        volumes: UnitList or list(Unit or str)
+            the values to be binned
+
+        Returns
+        -------
+        list(dict)
+            the target bin of each value
+
+        Raises
+        ------
+        RuntimeError
+            No suitably large calibration bin
+        """
+        return [self._bin_for(parse_unit(_, "microliter")) for _ in volumes]
@@ -18,17 +18,823 @@ extended by other methods depending on desired behavior.
 
 When creating a vendor-specific library it's likely desirable to monkey patch
 `LiquidHandleMethod._get_tip_types` to reference TipTypes that the vendor
-supports.
+supports. TipTypes are cached per shape, see TipTypesCache, which vendor
+libraries can also register their TipTypes with.
+
+The transports generated by the entry points of LiquidHandleMethods are
+memoized, see TransportsCache. Subclasses with `default_*` hooks that depend on
+anything else than the arguments and the attributes of the method and its
+class should set `_memoize_transports` to False.
+
+Protocol.transfer and Protocol.mix compile the transports of stock
+LiquidHandleMethods into TransportTemplates, which are shared by all volumes
+that fall into the same calibration bins.
 """
-from dataclasses import dataclass
+import functools
+
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, is_dataclass
+from decimal import Decimal
+from operator import is_
 from typing import Optional
 
 from ..instruction import LiquidHandle
 from ..unit import Unit
 from ..util import parse_unit
+from .liquid_class import VolumeCalibration
 from .tip_type import TipType
 
 
+TransportsCacheInfo = namedtuple(
+    "TransportsCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class TransportsCache(object):
+    """
+    A bounded LRU cache of the transports generated by the entry points of
+    LiquidHandleMethods, e.g. Transfer._aspirate_transports.
+
+    Transports only depend on the class of the method, its hooks and class
+    attributes, the attributes of the method, including its LiquidClasses,
+    shape and tip_type, and the arguments of the entry point, which are all
+    part of the key.
+    Hooks and class attributes are fingerprinted once per class, and the
+    method, its LiquidClasses and their VolumeCalibrations once per instance,
+    until they're assigned other attributes, see `_class_members` and
+    `_instance_fingerprint`. Attributes that are changed in place, e.g. a dict
+    of flowrate parameters, have to be assigned again to be picked up.
+    Transports returned from the cache are shared between all callers, so
+    they must be treated as immutable. Each call gets a new list of them.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            from autoprotocol.liquid_handle.liquid_handle_method import (
+                TRANSPORTS_CACHE
+            )
+
+            TRANSPORTS_CACHE.clear()
+            protocol.transfer(source_wells, destination_wells, "5:uL")
+            print(TRANSPORTS_CACHE.info())
+
+            # disable caching, e.g. for benchmarking
+            TRANSPORTS_CACHE.enabled = False
+
+    Returns
+    -------
+    TransportsCacheInfo
+
+        .. code-block:: none
+
+            TransportsCacheInfo(hits=766, misses=2, maxsize=1024, currsize=2)
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of distinct entry point calls kept in the cache.
+    enabled : bool, optional
+        Whether entry points should use the cache.
+    """
+
+    def __init__(self, maxsize=1024, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._transports = OrderedDict()
+
+    @staticmethod
+    def key(method, entry_point, args, kwargs):
+        """
+        Generates the cache key for a call of an entry point.
+
+        Parameters
+        ----------
+        method : LiquidHandleMethod
+            The method the entry point is called on
+        entry_point : function
+            The entry point that's called
+        args : tuple
+            The positional arguments of the call
+        kwargs : dict
+            The keyword arguments of the call
+
+        Returns
+        -------
+        tuple or None
+            The key or None if the call can't be cached, because the method
+            opted out or its attributes, class attributes or the arguments
+            can't be fingerprinted.
+        """
+        # pylint: disable=protected-access
+        if not method._memoize_transports:
+            return None
+        # overridden or monkey patched hooks change the transports
+        hooks, class_attributes = _class_members(type(method))
+        if class_attributes is None:
+            return None
+        try:
+            return (
+                hooks,
+                entry_point.__qualname__,
+                # e.g. configuration that hooks read from the class
+                class_attributes,
+                _fingerprint(method),
+                _fingerprint(args),
+                _fingerprint(kwargs),
+            )
+        except (TypeError, RecursionError):
+            return None
+
+    def get(self, key):
+        """
+        Gets cached transports and marks them as the most recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            See Also TransportsCache.key
+
+        Returns
+        -------
+        tuple or None
+            The cached transports, if any
+        """
+        try:
+            transports = self._transports[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._transports.move_to_end(key)
+        self.hits += 1
+        return transports
+
+    def put(self, key, transports):
+        """
+        Adds transports to the cache, evicting the least recently used entry
+        if the cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            See Also TransportsCache.key
+        transports : tuple
+            The generated transports to be shared
+        """
+        if self.maxsize <= 0:
+            return
+        self._transports[key] = transports
+        if len(self._transports) > self.maxsize:
+            self._transports.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached transports and resets the hit and miss counters"""
+        self._transports.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns
+        -------
+        TransportsCacheInfo
+            hits, misses, maxsize and current size of the cache
+        """
+        return TransportsCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._transports)
+        )
+
+
+TRANSPORTS_CACHE = TransportsCache()
+
+# compiled TransportTemplates share the bounded LRU of TransportsCache, their
+# keys replace the volume with the _template_signature of the method
+TRANSPORT_TEMPLATES = TransportsCache(maxsize=256)
+
+# values that are their own fingerprint, see _fingerprint
+_FINGERPRINT_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+# attributes that aren't part of the fingerprint of an instance, the runtime
+# transports of LiquidHandleMethods and the fingerprint itself
+_UNFINGERPRINTED_ATTRIBUTES = frozenset(["_transports", "_cached_fingerprint"])
+
+
+def _fingerprint(value):
+    """
+    Gets a hashable fingerprint of an attribute or argument of a
+    LiquidHandleMethod, or of the method itself. Values with the same
+    fingerprint generate the same transports, see TransportsCache.key.
+
+    Parameters
+    ----------
+    value : object
+        the attribute or argument
+
+    Returns
+    -------
+    tuple
+        the type of the value and a hashable representation of it
+
+    Raises
+    ------
+    TypeError
+        The value can't be fingerprinted
+    """
+    value_type = type(value)
+    if value_type in _FINGERPRINT_SCALAR_TYPES:
+        return value_type, value
+    if value_type is Decimal:
+        # equal Decimals can be serialized differently, e.g. 5 and 5.0
+        return Decimal, str(value)
+    if isinstance(value, Unit):
+        # equal Units can be serialized differently, and their str is rounded
+        return Unit, _fingerprint(value.magnitude), str(value.units)
+    if isinstance(value, dict):
+        return value_type, tuple((k, _fingerprint(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(_fingerprint(_) for _ in value)
+    if _is_instance_fingerprinted(value):
+        return _instance_fingerprint(value)
+    raise TypeError(f"{value!r} can't be fingerprinted")
+
+
+# fingerprints shared by equal instances, see _instance_fingerprint
+_FINGERPRINTS = OrderedDict()
+_FINGERPRINTS_MAXSIZE = 1024
+
+
+class _Fingerprint(tuple):
+    """
+    The fingerprint of an instance, see _instance_fingerprint, which is hashed
+    once, as it's part of every key the instance is looked up by.
+    """
+
+    def __init__(self, *args):  # pylint: disable=unused-argument
+        super().__init__()
+        self.hash = tuple.__hash__(self)
+
+    def __hash__(self):
+        return self.hash
+
+
+def _is_instance_fingerprinted(value):
+    """
+    Whether a value is fingerprinted by its attributes, e.g. LiquidClasses,
+    VolumeCalibrations and LiquidHandleMethods, see _instance_fingerprint
+    """
+    if isinstance(value, VolumeCalibration):
+        return True
+    # Units are dataclasses too, but are fingerprinted by their magnitude
+    return (
+        is_dataclass(value)
+        and not isinstance(value, type)
+        and not isinstance(value, Unit)
+    )
+
+
+def _instance_fingerprint(instance):
+    """
+    Gets the fingerprint of an instance that is fingerprinted by its
+    attributes, see _fingerprint.
+
+    The fingerprint is computed once and kept on the instance, along with the
+    attributes it was computed from, and computed again as soon as any of them
+    is assigned, added or removed, or the fingerprint of an attribute that is
+    fingerprinted by its attributes itself changes, e.g. the LiquidClass of a
+    LiquidHandleMethod.
+    Attributes are compared by identity, so values that are changed in place,
+    e.g. a dict of flowrate parameters, have to be assigned again for the
+    change to be picked up.
+
+    Parameters
+    ----------
+    instance : object
+        the instance, e.g. a LiquidClass
+
+    Returns
+    -------
+    _Fingerprint
+        the type of the instance and the fingerprint of its attributes
+
+    Raises
+    ------
+    TypeError
+        The instance can't be fingerprinted
+    """
+    attributes = vars(instance)
+    names = tuple(_ for _ in attributes if _ not in _UNFINGERPRINTED_ATTRIBUTES)
+    values = tuple(map(attributes.__getitem__, names))
+    cached = attributes.get("_cached_fingerprint")
+    if (
+        cached is not None
+        and cached[0] == names
+        and all(map(is_, cached[1], values))
+        and all(_instance_fingerprint(v) is f for v, f in cached[2])
+    ):
+        return cached[3]
+    children = tuple(
+        (_, _instance_fingerprint(_)) for _ in values if _is_instance_fingerprinted(_)
+    )
+    fingerprint = _Fingerprint((type(instance), _fingerprint(dict(zip(names, values)))))
+    # equal instances share their fingerprint, so that keys compare by identity
+    fingerprint = _FINGERPRINTS.setdefault(fingerprint, fingerprint)
+    if len(_FINGERPRINTS) > _FINGERPRINTS_MAXSIZE:
+        _FINGERPRINTS.popitem(last=False)
+    attributes["_cached_fingerprint"] = names, values, children, fingerprint
+    return fingerprint
+
+
+def _is_hook(value):
+    """Whether a class attribute of a LiquidHandleMethod is code"""
+    return callable(value) or isinstance(value, (staticmethod, classmethod, property))
+
+
+def _method_hooks(klass):
+    """
+    Gets all functions defined on the MRO of a LiquidHandleMethod class,
+    which includes hooks that were overridden or monkey patched.
+    """
+    return tuple(
+        value
+        for base in klass.__mro__
+        for value in vars(base).values()
+        if _is_hook(value)
+    )
+
+
+def _class_attributes(klass):
+    """
+    Gets all attributes other than hooks defined on the MRO of a
+    LiquidHandleMethod class, e.g. defaults and configuration read by hooks.
+    """
+    return tuple(
+        (name, value)
+        for base in klass.__mro__
+        for name, value in vars(base).items()
+        if not name.startswith("__") and not _is_hook(value)
+    )
+
+
+# {LiquidHandleMethod class: (its MRO, the attributes of the classes of its MRO,
+# hooks, fingerprint of its class attributes)}
+_CLASS_MEMBERS = {}
+
+
+def _class_members(klass):
+    """
+    Gets the hooks and the fingerprint of the class attributes of a
+    LiquidHandleMethod class.
+
+    They're collected once per class, and collected again as soon as an
+    attribute is added to, removed from or replaced on a class of its MRO,
+    e.g. when a hook is monkey patched.
+
+    Parameters
+    ----------
+    klass : type
+        the LiquidHandleMethod class
+
+    Returns
+    -------
+    tuple(tuple, tuple or None)
+        the hooks, see _method_hooks, and the fingerprint of the class
+        attributes, see _class_attributes, or None if they can't be
+        fingerprinted
+    """
+    cached = _CLASS_MEMBERS.get(klass)
+    if (
+        cached is not None
+        and cached[0] is klass.__mro__
+        and all(
+            tuple(vars(base)) == names and all(map(is_, vars(base).values(), values))
+            for base, names, values in cached[1]
+        )
+    ):
+        return cached[2:]
+    # the attributes of object can't be replaced
+    snapshot = tuple(
+        (base, tuple(vars(base)), tuple(vars(base).values()))
+        for base in klass.__mro__[:-1]
+    )
+    try:
+        class_attributes = _fingerprint(_class_attributes(klass))
+    except (TypeError, RecursionError):
+        class_attributes = None
+    members = _method_hooks(klass), class_attributes
+    _CLASS_MEMBERS[klass] = (klass.__mro__, snapshot) + members
+    return members
+
+
+# {LiquidHandleMethod class: hooks it was registered with}
+_STOCK_METHOD_HOOKS = {}
+
+# the _template_signature of volumes whose transports can't be compiled
+_NO_TEMPLATE = object()
+
+
+def _register_stock_method(klass):
+    """
+    Registers a LiquidHandleMethod shipped with autoprotocol, whose
+    `_template_signature` describes how its transports depend on the volume.
+    Its transports are only compiled into TransportTemplates as long as none of
+    its hooks are overridden or monkey patched.
+
+    Parameters
+    ----------
+    klass : type
+        the LiquidHandleMethod class to be registered
+
+    Returns
+    -------
+    type
+        the registered class
+    """
+    _STOCK_METHOD_HOOKS[klass] = _method_hooks(klass)
+    return klass
+
+
+def _same_value(first, second):
+    """Whether two fields of a transport are serialized the same way"""
+    if isinstance(first, Unit) or isinstance(second, Unit):
+        return str(first) == str(second)
+    return type(first) is type(second) and first == second
+
+
+class TransportTemplate(object):
+    """
+    The transports generated by an entry point of a LiquidHandleMethod,
+    compiled for all volumes that share a `_template_signature`.
+
+    Within a signature everything except the target volume and the calibrated
+    volume, e.g. mode_params, flowrates and the blowout, pre buffer and prime
+    steps, is the same. The transports are compiled once into a template
+    where the fields that hold those volumes are placeholders, which are
+    filled in by every call.
+
+    Transports without placeholders are shared between all callers, so they
+    must be treated as immutable.
+
+    Parameters
+    ----------
+    transports : tuple(dict)
+        the transports generated for one of the volumes of the signature
+    slots : tuple(tuple(int, str, int))
+        (position of the transport, field, sign) of each placeholder, see
+        TransportTemplate.slot_fields
+    """
+
+    # {transport field: the volume placeholders of that field are filled with}
+    slot_fields = {"volume": "volume", "pump_override_volume": "calibrated_volume"}
+
+    def __init__(self, transports, slots):
+        self.transports = transports
+        self.slots = slots
+
+    @staticmethod
+    def _slot_value(field, sign, volumes):
+        """Fills a placeholder the same way the transport helpers fill it"""
+        volume = volumes[TransportTemplate.slot_fields[field]]
+        if not volume:
+            return None
+        return parse_unit(-volume if sign < 0 else volume, "ul")
+
+    @classmethod
+    def compile(cls, probes):
+        """
+        Compiles the transports generated for distinct volumes of the same
+        signature into a template.
+
+        Fields that are the same for all of the volumes are kept, the ones
+        that follow the target or calibrated volume become placeholders.
+
+        Parameters
+        ----------
+        probes : list(tuple(dict, list(dict)))
+            the volumes, as in TransportTemplate.fill, and the transports
+            generated for them
+
+        Returns
+        -------
+        TransportTemplate or None
+            the template or None if the transports depend on the volume in
+            any other way
+        """
+        volumes, transports = zip(*probes)
+        if len(set(len(_) for _ in transports)) != 1:
+            return None
+        slots = []
+        for position, generated in enumerate(zip(*transports)):
+            fields = set().union(*generated)
+            for field in sorted(fields):
+                values = [_.get(field) for _ in generated]
+                if all(_same_value(_, values[0]) for _ in values):
+                    continue
+                if field not in cls.slot_fields:
+                    return None
+                for sign in (-1, 1):
+                    expected = [cls._slot_value(field, sign, _) for _ in volumes]
+                    if all(_same_value(e, v) for e, v in zip(expected, values)):
+                        slots.append((position, field, sign))
+                        break
+                else:
+                    return None
+        return cls(tuple(transports[0]), tuple(slots))
+
+    def fill(self, volumes):
+        """
+        Fills in the placeholders of the template.
+
+        Parameters
+        ----------
+        volumes : dict
+            the `volume` and `calibrated_volume` of the call
+
+        Returns
+        -------
+        list(dict)
+            the transports for the volumes
+        """
+        transports = list(self.transports)
+        for position, field, sign in self.slots:
+            transports[position] = dict(
+                transports[position], **{field: self._slot_value(field, sign, volumes)}
+            )
+        return transports
+
+
+def _memoize_transports(generate):
+    """
+    Memoizes the transports generated by an entry point of a
+    LiquidHandleMethod, see TransportsCache.
+
+    Parameters
+    ----------
+    generate : function
+        the entry point to be memoized
+
+    Returns
+    -------
+    function
+        the memoized entry point
+    """
+
+    @functools.wraps(generate)
+    def memoized(self, *args, **kwargs):
+        # pylint: disable=protected-access
+        key = None
+        if TRANSPORTS_CACHE.enabled:
+            key = TRANSPORTS_CACHE.key(self, generate, args, kwargs)
+        if key is None:
+            return generate(self, *args, **kwargs)
+        transports = TRANSPORTS_CACHE.get(key)
+        if transports is None:
+            transports = tuple(generate(self, *args, **kwargs))
+            TRANSPORTS_CACHE.put(key, transports)
+        # entry points also leave the transports in _transports
+        self._transports = list(transports)
+        return list(transports)
+
+    return memoized
+
+
+TipTypesCacheInfo = namedtuple(
+    "TipTypesCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class TipTypesCache(object):
+    """
+    Caches the sorted TipTypes of LiquidHandleMethods per shape, and a
+    bounded LRU of the tip capacities and recommended tip types decided with
+    them.
+
+    TipTypes are cached per `_get_tip_types` implementation and shape, so
+    monkey patching `_get_tip_types` is picked up without invalidating the
+    cache. Vendor libraries whose `_get_tip_types` depends on anything else
+    than the shape can register their tip sets per shape instead, or clear
+    the cache whenever their tip sets change.
+
+    Tip decisions are keyed like TransportsCache.key, with the fingerprint of
+    the tip set as an additional part of the key, so they follow changes to
+    the method, its LiquidClasses and its TipTypes. Registered and cached tip
+    sets are fingerprinted once.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            from autoprotocol.instruction import LiquidHandle
+            from autoprotocol.liquid_handle.liquid_handle_method import (
+                TIP_TYPES_CACHE
+            )
+            from autoprotocol.liquid_handle.tip_type import TipType
+
+            TIP_TYPES_CACHE.register(
+                LiquidHandle.builders.shape(1, 1, "SBS96"),
+                [TipType("vendor_1_200", "200:uL")]
+            )
+
+            # after changing tip sets that aren't registered
+            TIP_TYPES_CACHE.clear()
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of tip decisions kept in the cache.
+    enabled : bool, optional
+        Whether LiquidHandleMethods should use the cache.
+    """
+
+    def __init__(self, maxsize=1024, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._registered = {}
+        self._tip_types = {}
+        self._decisions = OrderedDict()
+
+    @staticmethod
+    def _shape_key(shape):
+        """Gets the hashable rows, columns and format of a shape"""
+        return shape["rows"], shape["columns"], shape["format"]
+
+    @staticmethod
+    def _sort(tip_types):
+        """Sorts TipTypes in ascending order of volume"""
+        return tuple(sorted(tip_types, key=lambda t: t.volume))
+
+    @classmethod
+    def _fingerprinted(cls, tip_types):
+        """
+        Sorts TipTypes, along with their fingerprint for the keys of the tip
+        decisions made with them, or None if they can't be fingerprinted
+        """
+        tip_types = cls._sort(tip_types)
+        try:
+            return tip_types, _fingerprint(tip_types)
+        except (TypeError, RecursionError):
+            return tip_types, None
+
+    def register(self, shape, tip_types):
+        """
+        Registers the TipTypes for a shape, which take precedence over
+        `LiquidHandleMethod._get_tip_types`.
+
+        Parameters
+        ----------
+        shape : dict
+            See Also LiquidHandle.builders.shape
+        tip_types : list(TipType)
+            the TipTypes that support the shape
+        """
+        self._registered[self._shape_key(shape)] = self._fingerprinted(tip_types)
+
+    def unregister(self, shape):
+        """
+        Removes the TipTypes registered for a shape, if any.
+
+        Parameters
+        ----------
+        shape : dict
+            See Also LiquidHandle.builders.shape
+        """
+        self._registered.pop(self._shape_key(shape), None)
+
+    def sorted_tip_types(self, method):
+        """
+        Gets the TipTypes of a method in ascending order of volume.
+
+        Parameters
+        ----------
+        method : LiquidHandleMethod
+            the method to get the TipTypes for, based on its _shape
+
+        Returns
+        -------
+        tuple(TipType)
+            the registered or cached TipTypes
+        """
+        # pylint: disable=protected-access
+        if not self.enabled:
+            return self._sort(method._get_tip_types())
+        return self._sorted_tip_types(method)[0]
+
+    def _sorted_tip_types(self, method):
+        """
+        Gets the registered or cached TipTypes of a method, see
+        sorted_tip_types, along with their fingerprint, see _fingerprinted
+        """
+        # pylint: disable=protected-access
+        # TipTypes of a single instance aren't cached
+        if "_get_tip_types" in vars(method):
+            return self._fingerprinted(method._get_tip_types())
+        shape = self._shape_key(method._shape)
+        registered = self._registered.get(shape)
+        if registered is not None:
+            return registered
+        key = (type(method)._get_tip_types, shape)
+        try:
+            return self._tip_types[key]
+        except KeyError:
+            tip_types = self._fingerprinted(method._get_tip_types())
+            self._tip_types[key] = tip_types
+            return tip_types
+
+    def decide(self, method, decision, args):
+        """
+        Gets a memoized tip decision of a method, e.g. its tip capacity.
+
+        Parameters
+        ----------
+        method : LiquidHandleMethod
+            The method the decision is made for
+        decision : function
+            The undecorated decision, e.g. LiquidHandleMethod._tip_capacity
+        args : tuple
+            The arguments of the decision, e.g. the volume
+
+        Returns
+        -------
+        Unit or str
+            the decision
+        """
+        key = None
+        if self.enabled:
+            tip_set = self._sorted_tip_types(method)[1]
+            key = TransportsCache.key(method, decision, args, {})
+            if key is not None and tip_set is not None:
+                key += (tip_set,)
+            else:
+                key = None
+        if key is None:
+            return decision(method, *args)
+        try:
+            decided = self._decisions[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self._decisions.move_to_end(key)
+            self.hits += 1
+            return decided
+        decided = decision(method, *args)
+        if self.maxsize > 0:
+            self._decisions[key] = decided
+            if len(self._decisions) > self.maxsize:
+                self._decisions.popitem(last=False)
+        return decided
+
+    def clear(self):
+        """
+        Removes all cached TipTypes and tip decisions and resets the hit and
+        miss counters. Registered TipTypes are kept.
+        """
+        self._tip_types.clear()
+        self._decisions.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns
+        -------
+        TipTypesCacheInfo
+            hits, misses, maxsize and current size of the tip decisions
+        """
+        return TipTypesCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._decisions)
+        )
+
+
+TIP_TYPES_CACHE = TipTypesCache()
+
+
+def _memoize_tip_decision(decision):
+    """
+    Memoizes a tip decision of a LiquidHandleMethod, see TipTypesCache.
+
+    Parameters
+    ----------
+    decision : function
+        the decision to be memoized
+
+    Returns
+    -------
+    function
+        the memoized decision
+    """
+
+    @functools.wraps(decision)
+    def memoized(self, *args):
+        return TIP_TYPES_CACHE.decide(self, decision, args)
+
+    return memoized
+
+
 # pylint: disable=too-many-public-methods,protected-access
 @dataclass
 class LiquidHandleMethod:
@@ -106,6 +912,10 @@ class LiquidHandleMethod:
     Protocol : contains methods that accept LiquidHandleMethods as arguments
     """
 
+    # whether the transports generated by the entry points are memoized, see
+    # TransportsCache
+    _memoize_transports = True
+
     tip_type: Optional[TipType] = None
     blowout: bool = True
     """
@@ -126,6 +936,156 @@ class LiquidHandleMethod:
         self._shape = None
         self._transports = []
 
+    def _compiled_transports(self, entry_point: str, volume: "Unit", *args):
+        """Generates the transports of an entry point from a TransportTemplate
+
+        Stock LiquidHandleMethods compile the transports of an entry point into
+        a TransportTemplate once per _template_signature and fill in the volume
+        of each call. Any other method just calls the entry point.
+
+        Parameters
+        ----------
+        entry_point : str
+            the name of the entry point, e.g. `_aspirate_transports`
+        volume : Unit
+            the volume the entry point is called with
+        args : tuple
+            the remaining arguments of the entry point, e.g. the density
+
+        Returns
+        -------
+        list
+            the transports generated by the entry point
+
+        See Also
+        --------
+        TransportTemplate : holds compiled transports
+        _template_signature : describes how transports depend on the volume
+        """
+        volume = parse_unit(volume, "ul")
+        key = self._template_key(entry_point, volume, args)
+        if key is None:
+            return getattr(self, entry_point)(volume, *args)
+
+        template = TRANSPORT_TEMPLATES.get(key)
+        if template is None:
+            # signatures that can't be compiled are remembered as False
+            template = self._compile_transport_template(entry_point, volume, args)
+            TRANSPORT_TEMPLATES.put(key, template or False)
+        if not template:
+            return getattr(self, entry_point)(volume, *args)
+
+        self._transports = template.fill(self._template_volumes(volume))
+        return list(self._transports)
+
+    def _template_key(self, entry_point: str, volume: "Unit", args: tuple):
+        """Gets the key of the TransportTemplate for a call of an entry point
+
+        Parameters
+        ----------
+        entry_point : str
+            the name of the entry point
+        volume : Unit
+            the volume the entry point is called with
+        args : tuple
+            the remaining arguments of the entry point
+
+        Returns
+        -------
+        tuple or None
+            the key, or None if the transports can't be compiled
+        """
+        klass = type(self)
+        if not TRANSPORT_TEMPLATES.enabled or volume == Unit(0, "ul"):
+            return None
+        if _STOCK_METHOD_HOOKS.get(klass) != _class_members(klass)[0]:
+            return None
+        try:
+            signature = self._template_signature(volume)
+        except (KeyError, RuntimeError):
+            return None
+        if signature is _NO_TEMPLATE:
+            return None
+        return TRANSPORT_TEMPLATES.key(
+            self, getattr(klass, entry_point), (signature,) + tuple(args), {}
+        )
+
+    def _compile_transport_template(
+        self, entry_point: str, volume: "Unit", args: tuple
+    ):
+        """Compiles the transports of an entry point into a TransportTemplate
+
+        Generates the transports for the volume and a slightly different one
+        with the same _template_signature, and compiles the difference.
+
+        Parameters
+        ----------
+        entry_point : str
+            the name of the entry point
+        volume : Unit
+            the volume the entry point is called with
+        args : tuple
+            the remaining arguments of the entry point
+
+        Returns
+        -------
+        TransportTemplate or None
+            the template, or None if the transports can't be compiled
+        """
+        generate = getattr(type(self), entry_point)
+        # the probes shouldn't end up in the TransportsCache
+        generate = getattr(generate, "__wrapped__", generate)
+        try:
+            signature = self._template_signature(volume)
+            if signature is _NO_TEMPLATE:
+                return None
+            probes = [volume]
+            for factor in ("1.000001", "0.999999"):
+                probe = volume * Decimal(factor)
+                if self._template_signature(probe) == signature:
+                    probes.append(probe)
+                    break
+            else:
+                return None
+            return TransportTemplate.compile(
+                [(self._template_volumes(_), generate(self, _, *args)) for _ in probes]
+            )
+        except (KeyError, RuntimeError):
+            return None
+        finally:
+            self._transports = []
+
+    def _template_signature(self, volume: "Unit"):  # pylint: disable=unused-argument
+        """Describes how the transports of the method depend on the volume
+
+        Volumes that share a signature generate the same transports, except for
+        the target and calibrated volumes, see TransportTemplate.
+
+        Parameters
+        ----------
+        volume : Unit
+
+        Returns
+        -------
+        object
+            the signature, or _NO_TEMPLATE if the transports can't be compiled
+        """
+        return _NO_TEMPLATE
+
+    def _template_volumes(self, volume: "Unit"):
+        """Gets the volumes the placeholders of a TransportTemplate are filled with
+
+        Parameters
+        ----------
+        volume : Unit
+
+        Returns
+        -------
+        dict
+            the target `volume` and the `calibrated_volume`, if any
+        """
+        return {"volume": volume, "calibrated_volume": None}
+
     def _get_tip_types(self):
         """Gets a list of TipTypes based on _shape
 
@@ -176,9 +1136,11 @@ class LiquidHandleMethod:
         See Also
         --------
         _get_tip_types : vendor library-specific tip selection method
+        TipTypesCache : caches the TipTypes per shape
         """
-        return sorted(self._get_tip_types(), key=lambda t: t.volume)
+        return list(TIP_TYPES_CACHE.sorted_tip_types(self))
 
+    @_memoize_tip_decision
     def _rec_tip_type(self, volume: Unit):
         """For a given volume gets the smallest appropriate tip type
 
@@ -207,6 +1169,7 @@ class LiquidHandleMethod:
             )
         return valid_tips[0].name
 
+    @_memoize_tip_decision
     def _tip_capacity(self):
         """Gets the best estimate of tip capacity with the given information
 
@@ -10,10 +10,16 @@ movements within individual wells.
 from ..instruction import LiquidHandle
 from ..unit import Unit
 from ..util import parse_unit
+from .liquid_handle_method import (
+    _NO_TEMPLATE,
+    _memoize_transports,
+    _register_stock_method,
+)
 from .transfer import LiquidHandleMethod
 
 
 # pylint: disable=protected-access
+@_register_stock_method
 class Mix(LiquidHandleMethod):
     """LiquidHandleMethod for generating transfers within wells
 
@@ -76,6 +82,10 @@ class Mix(LiquidHandleMethod):
 
         return calibration_overage
 
+    def _template_signature(self, volume):
+        bins = self._liquid._calibration_bins(volume, self.tip_type)
+        return _NO_TEMPLATE if bins is None else bins
+
     def default_blowout(self, volume):
         return LiquidHandle.builders.blowout(
             volume=Unit("5:ul"),
@@ -83,6 +93,7 @@ class Mix(LiquidHandleMethod):
             flowrate=None,
         )
 
+    @_memoize_transports
     def _mix_transports(self, volume):
         """Generates mix transports
 
@@ -14,10 +14,16 @@ from typing import Optional, Union
 from ..instruction import LiquidHandle
 from ..unit import Unit
 from ..util import parse_unit
-from .liquid_handle_method import LiquidHandleMethod
+from .liquid_handle_method import (
+    _NO_TEMPLATE,
+    LiquidHandleMethod,
+    _memoize_transports,
+    _register_stock_method,
+)
 
 
 # pylint: disable=unused-argument,too-many-instance-attributes,protected-access
+@_register_stock_method
 @dataclasses.dataclass
 class Transfer(LiquidHandleMethod):
     """LiquidHandleMethod for generating transfers between pairs of wells
@@ -131,6 +137,22 @@ class Transfer(LiquidHandleMethod):
 
         return calibration_overage + prime_or_transit
 
+    def _template_signature(self, volume):
+        bins = self._source_liquid._calibration_bins(volume, self.tip_type)
+        if bins is None:
+            return _NO_TEMPLATE
+        # single channel blowout volumes are binned by the transfer volume
+        blowout = self.default_blowout(volume) if self.blowout is True else None
+        return bins, blowout
+
+    def _template_volumes(self, volume):
+        return {
+            "volume": volume,
+            "calibrated_volume": self._source_liquid._get_calibrated_volume(
+                volume, self.tip_type
+            ),
+        }
+
     def default_blowout(self, volume):
         if self._is_single_channel():
             if volume < Unit("10:ul"):
@@ -152,6 +174,7 @@ class Transfer(LiquidHandleMethod):
             flowrate=None,
         )
 
+    @_memoize_transports
     def _aspirate_transports(self, volume, density):
         """Generates source well transports
 
@@ -195,6 +218,7 @@ class Transfer(LiquidHandleMethod):
 
         return self._transports
 
+    @_memoize_transports
     def _dispense_transports(self, volume, density):
         """Generates destination well transports
 
@@ -606,6 +630,7 @@ class Transfer(LiquidHandleMethod):
         )
 
 
+@_register_stock_method
 class DryWellTransfer(Transfer):
     """Dispenses while tracking liquid without mix_after"""
 
@@ -635,6 +660,7 @@ class DryWellTransfer(Transfer):
         return self.default_tracked_position_z()
 
 
+@_register_stock_method
 class PreMixBlowoutTransfer(Transfer):
     """Adds an additional blowout before the mix_after step"""
 
@@ -662,6 +688,7 @@ class PreMixBlowoutTransfer(Transfer):
         )
         self.pre_mix_blowout = pre_mix_blowout
 
+    @_memoize_transports
     def _dispense_transports(self, volume=None, density=None):
         self._transports = []
         volume = parse_unit(volume, "ul")
@@ -6,13 +6,14 @@ Module containing the main `Protocol` object and associated functions
     :license: BSD, see LICENSE for more details
 
 """
+import copy
 import json
 import warnings
 
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from numbers import Number
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
 
 from .builders import LiquidHandleBuilders
 from .compound import Compound
@@ -60,6 +61,7 @@ from .instruction import (
 )
 from .liquid_handle import Dispense as DispenseMethod
 from .liquid_handle import LiquidClass, Mix, Transfer
+from .liquid_handle.liquid_handle_method import _fingerprint
 from .types import asdict
 from .types.protocol import (
     ACCELERATION,
@@ -111,9 +113,11 @@ from .types.protocol import (
     WellParam,
 )
 from .types.ref import Ref, RefOpts, StorageLocation
-from .unit import Unit, UnitError
+from .unit import Unit, UnitError, UnitList
 from .util import (
+    _as_json_compatible,
     _check_container_type_with_shape,
+    _plan_stamps,
     _validate_as_instance,
     _validate_liha_shape,
     is_valid_well,
@@ -121,12 +125,30 @@ from .util import (
 )
 
 
+# values that are Autoprotocol compliant without being refified
+_REFIFIED_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
 @dataclass
 class Protocol:
     refs: Optional[Dict[str, Ref]] = None
     instructions: List[Instruction] = field(default_factory=list)
     propagate_properties: bool = False
     time_constraints: List[TimeConstraint] = field(default_factory=list)
+    # ref names by container identity, see `_ref_for_container`
+    _ref_names: Dict[int, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (well, "name/index") by well identity, see `_ref_for_well`
+    _well_refs: Dict[int, Tuple[Well, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (instructions, transfer) of single well transfers generated with
+    # `stamp=True` by the identity of their first instruction, see
+    # `stamp_transfers`
+    _single_transfers: Dict[int, Tuple[Tuple[Instruction, ...], tuple]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     """
     A Protocol is a sequence of instructions to be executed, and a set of
     containers on which those instructions act.
@@ -224,7 +246,10 @@ class Protocol:
             self.refs: Dict[str, Ref] = {}
 
     def __repr__(self):
-        return f"Protocol({self.__dict__})"
+        # private caches and indices are excluded, see their `field` definitions
+        hidden = {_.name for _ in fields(self) if not _.repr}
+        attributes = {k: v for k, v in self.__dict__.items() if k not in hidden}
+        return f"Protocol({attributes})"
 
     def container_type(self, shortname: str):
         """
@@ -394,11 +419,15 @@ class Protocol:
             properties=properties,
             ctx_properties=ctx_properties,
         )
-        self.refs[name] = Ref(name, opts, container)
+        self._add_ref(Ref(name, opts, container))
         return container
 
     # pragma pylint: enable=redefined-builtin
 
+    def _add_ref(self, ref: Ref):
+        self.refs[ref.name] = ref
+        self._ref_names[id(ref.container)] = ref.name
+
     def add_time_constraint(
         self,
         from_dict: TimeConstraintFromToDict,
@@ -752,6 +781,48 @@ class Protocol:
             raise ValueError("Instruction index less than 0")
         return instruction_index
 
+    def wells_with(self, prop: str, val: Optional[Any] = None):
+        """
+        Returns a WellGroup of the wells of all the refs in this Protocol
+        with the specified property and value, see `Container.wells_with`.
+
+        Example Usage:
+
+        .. code-block:: python
+
+            p = Protocol()
+            plate_1 = p.ref("plate_1", cont_type="96-flat", discard=True)
+            plate_2 = p.ref("plate_2", cont_type="96-flat", discard=True)
+
+            plate_1.well(0).set_properties({"condition": "control"})
+            plate_2.well(0).set_properties({"condition": "control"})
+            controls = p.wells_with("condition", "control")
+
+        Parameters
+        ----------
+        prop : str
+            The property you are searching for
+        val : optional
+            The value assigned to the property, any value if not specified
+
+        Returns
+        -------
+        WellGroup
+            The wells with the property, ordered by ref and well index
+
+        Raises
+        ------
+        TypeError
+            property is not a string
+        """
+        if not isinstance(prop, str):
+            raise TypeError(f"property is not a string: {prop!r}")
+        wells = []
+        for ref in self.refs.values():
+            wells.extend(ref.container.wells_with(prop, val).wells)
+        # pragma pylint: disable=protected-access
+        return WellGroup._from_wells(wells)
+
     def _append_and_return(self, instructions: Union[Instruction, List[Instruction]]):
         """
         Append instruction(s) to the Protocol list and returns the
@@ -965,6 +1036,20 @@ class Protocol:
         RuntimeError
             If either refs or instructions attribute is empty
         """
+        return {
+            attr: self._refify(getattr(self, attr))
+            for attr in self._serialized_attributes()
+        }
+
+    def _serialized_attributes(self):
+        """
+        Updates the refs and outs from the state of the referenced containers.
+
+        Returns
+        -------
+        list(str)
+            The attributes that are serialized by `as_dict`, in their order
+        """
         outs = defaultdict(lambda: defaultdict(dict))
         # pragma pylint: disable=protected-access
         for n, ref in self.refs.items():
@@ -984,7 +1069,9 @@ class Protocol:
             if ref.container.ctx_properties:
                 outs[n]["contextual_custom_properties"] = ref.container.ctx_properties
 
-            for well in ref.container._wells:
+            # only wells whose names or properties were set or accessed can
+            # have any
+            for well in ref.container._annotated_wells_sorted():
                 if well.name or len(well.properties) > 0:
                     if well.name:
                         outs[n][str(well.index)]["name"] = well.name
@@ -998,7 +1085,7 @@ class Protocol:
         # pragma pylint: enable=protected-access
 
         if outs:
-            setattr(self, "outs", json.loads(json.dumps(outs)))
+            setattr(self, "outs", _as_json_compatible(outs))
 
         prop_list = [
             a
@@ -1014,11 +1101,97 @@ class Protocol:
             if getattr(self, prop):
                 explicit_props.append(prop)
 
-        return {
-            attr: self._refify(getattr(self, attr))
-            for attr in prop_list
-            if attr in explicit_props
-        }
+        return [attr for attr in prop_list if attr in explicit_props]
+
+    def iter_json_chunks(self, indent: Optional[Union[int, str]] = None):
+        """
+        Encodes the entire protocol as Autoprotocol JSON piece by piece.
+
+        Refs, instructions, time constraints and outs are refified and encoded
+        one at a time, so that the refified protocol is never held in memory
+        as a whole. The joined chunks are identical to
+        `json.dumps(p.as_dict(), indent=indent)`.
+
+        Example Usage:
+
+        .. code-block:: python
+
+            for chunk in p.iter_json_chunks(indent=2):
+                sys.stdout.write(chunk)
+
+        Parameters
+        ----------
+        indent : int or str, optional
+            Indentation of the JSON, see `json.dumps`
+
+        Yields
+        ------
+        str
+            The next piece of the JSON document
+        """
+        encoder = json.JSONEncoder(indent=indent)
+        if indent is None:
+            indent, newline, item_separator = "", "", ", "
+        else:
+            if not isinstance(indent, str):
+                indent = " " * indent
+            newline, item_separator = "\n", ","
+
+        def encode(value, level):
+            # strings are encoded with escaped newlines, so every newline is
+            # part of the indentation of a nested value
+            return encoder.encode(value).replace("\n", newline + indent * level)
+
+        def iter_collection(value, level):
+            if type(value) is dict:
+                items, brackets = value.items(), "{}"
+            elif type(value) is list:
+                items, brackets = enumerate(value), "[]"
+            else:
+                yield encode(self._refify(value), level)
+                return
+            if not value:
+                yield brackets
+                return
+            yield brackets[0]
+            for i, (key, item) in enumerate(items):
+                yield item_separator if i else ""
+                yield newline + indent * (level + 1)
+                if brackets == "{}":
+                    yield encoder.encode(key) + ": "
+                yield encode(self._refify(item), level + 1)
+            yield newline + indent * level + brackets[1]
+
+        yield "{"
+        for i, attr in enumerate(self._serialized_attributes()):
+            yield item_separator if i else ""
+            yield newline + indent + encoder.encode(attr) + ": "
+            yield from iter_collection(getattr(self, attr), 1)
+        yield newline + "}"
+
+    def write_json(self, fp: TextIO, indent: Optional[Union[int, str]] = None):
+        """
+        Writes the entire protocol as Autoprotocol JSON to a file-like object.
+
+        The protocol is written piece by piece, see `iter_json_chunks`, and
+        the output is identical to `json.dumps(p.as_dict(), indent=indent)`.
+
+        Example Usage:
+
+        .. code-block:: python
+
+            with open("protocol.json", "w") as fp:
+                p.write_json(fp, indent=2)
+
+        Parameters
+        ----------
+        fp : TextIO
+            File-like object with a `write` method that takes strings
+        indent : int or str, optional
+            Indentation of the JSON, see `json.dumps`
+        """
+        for chunk in self.iter_json_chunks(indent=indent):
+            fp.write(chunk)
 
     # pylint: disable=protected-access
     # pylint: disable=no-member
@@ -1026,7 +1199,7 @@ class Protocol:
         self,
         source: Union[Well, List[Well], List[Tuple[Well, int]]],
         destination: Union[WellParam, List[WellGroup]],
-        volume: Union[VOLUME, List[VOLUME]],
+        volume: Union[VOLUME, List[VOLUME], UnitList],
         rows: int = 8,
         columns: int = 1,
         method: DispenseMethod = DispenseMethod,
@@ -1062,7 +1235,7 @@ class Protocol:
             Well(s) to transfer liquid to. If specifying more than a Well or
             WellGroup the list of destinations must match the number of chips
             specified in the source tuple.
-        volume : str or Unit or list(str) or list(Unit)
+        volume : str or Unit or list(str) or list(Unit) or UnitList
             Volume(s) of liquid to be transferred from source well to
             destination wells. The number of volumes specified must
             correspond to the number of destination wells. If specifying more than
@@ -1331,6 +1504,12 @@ class Protocol:
         def equalize_lengths(
             vols, dest: Union[List[WellGroup], WellGroup]
         ) -> Union[List[Unit], List[List[Unit]]]:
+            if isinstance(vols, UnitList):
+                vols = parse_unit(vols, "uL")
+                # volumes of a single WellGroup are accounted as a UnitList
+                if isinstance(dest, WellGroup) and len(vols) == len(dest):
+                    return vols
+                vols = list(vols)
             if isinstance(dest, list):
                 if isinstance(vols, list):
                     vols_list = vols
@@ -1421,14 +1600,19 @@ class Protocol:
         transport_locations = []
         shape = LiquidHandle.builders.shape(rows, columns, None)
         for i, (source_location, num_dispense_chips) in enumerate(source):
-            dispense_volumes: List[Unit] = volume[i]
+            dispense_volumes: Union[List[Unit], UnitList] = volume[i]
             destination_wg: WellGroup = destination[i]
-            try:
-                sum_dispense_volumes: Unit = (
-                    sum(dispense_volumes) if dispense_volumes else Unit("0:microliter")
-                )
-            except TypeError as e:
-                raise TypeError(dispense_volumes) from e
+            if isinstance(dispense_volumes, UnitList):
+                sum_dispense_volumes: Unit = dispense_volumes.sum()
+            else:
+                try:
+                    sum_dispense_volumes: Unit = (
+                        sum(dispense_volumes)
+                        if dispense_volumes
+                        else Unit("0:microliter")
+                    )
+                except TypeError as e:
+                    raise TypeError(dispense_volumes) from e
             total_volume_dispensed: Unit = Unit("0:microliter")
 
             # Aspirate from source
@@ -1442,9 +1626,7 @@ class Protocol:
                 )
             )
             # there should be the same number of volumes as destinations
-            total_volume_dispensed += sum(
-                [rows * columns * vol for vol in dispense_volumes]
-            )
+            total_volume_dispensed += rows * columns * sum_dispense_volumes
             # Prime from source
             if method[i].prime:
                 transport_locations.append(
@@ -1628,7 +1810,7 @@ class Protocol:
             Well or WellGroup to which to transfer liquid.  The number of
             destination wells must match the number of source wells specified
             unless one_source is set to True.
-        volume : str or Unit or list
+        volume : str or Unit or list or UnitList
             The volume(s) of liquid to be transferred from source wells to
             destination wells.  Volume can be specified as a single string or
             Unit, or can be given as a list of volumes.  The length of a list
@@ -1719,6 +1901,8 @@ class Protocol:
                 volume = [Unit(volume).to("ul")] * len_source
             else:
                 volume = [Unit(volume).to("ul")] * len_dest
+        elif isinstance(volume, UnitList) and len(volume) == len_dest:
+            volume = volume.to("ul")
         elif isinstance(volume, list) and len(volume) == len_dest:
             volume = list(map(lambda x: Unit(x).to("ul"), volume))
         else:
@@ -1727,9 +1911,13 @@ class Protocol:
                 "destination well, each destination well must have a "
                 "corresponding volume in the form of a list."
             )
+        if isinstance(volume, UnitList):
+            droplets = (volume / droplet_size).magnitudes
+        else:
+            droplets = [vol_d / droplet_size for vol_d in volume]
         vol_errors = []
-        for vol_d in volume:
-            if not round(vol_d / droplet_size, max_decimal_places) % 1 == 0:
+        for vol_d, droplet_count in zip(volume, droplets):
+            if not round(droplet_count, max_decimal_places) % 1 == 0:
                 vol_errors.append(vol_d)
         if len(vol_errors) > 0:
             raise RuntimeError(
@@ -1739,7 +1927,11 @@ class Protocol:
         if one_source:
             try:
                 source_vol = [s.available_volume() for s in source.wells]
-                if sum([a for a in volume]) > sum([a for a in source_vol]):
+                if isinstance(volume, UnitList):
+                    total_volume = volume.sum()
+                else:
+                    total_volume = sum([a for a in volume])
+                if total_volume > sum([a for a in source_vol]):
                     raise RuntimeError(
                         "There is not enough volume in the source well(s) "
                         "specified to complete the transfers."
@@ -1805,7 +1997,7 @@ class Protocol:
             if v > Unit(0, "microliter"):
                 transfers.append(xfer)
             if self.propagate_properties:
-                d.add_properties(s.properties)
+                d._propagate_properties(s)
 
         if not transfers:
             raise RuntimeError(
@@ -6491,12 +6683,35 @@ class Protocol:
         )
 
     def _ref_for_well(self, well: Well):
-        return f"{self._ref_for_container(well.container)}/{well.index}"
+        try:
+            cached_well, well_ref = self._well_refs[id(well)]
+        except KeyError:
+            pass
+        else:
+            # the Ref could have been replaced in `self.refs` since
+            name = well_ref.rpartition("/")[0]
+            ref = self.refs.get(name)
+            if (
+                cached_well is well
+                and ref is not None
+                and ref.container is well.container
+            ):
+                return well_ref
+        well_ref = f"{self._ref_for_container(well.container)}/{well.index}"
+        self._well_refs[id(well)] = (well, well_ref)
+        return well_ref
 
     def _ref_for_container(self, container: Container):
+        name = self._ref_names.get(id(container))
+        if name is not None:
+            ref = self.refs.get(name)
+            if ref is not None and ref.container is container:
+                return name
+        # refs that weren't added through `ref`, e.g. Protocol(refs=...)
         for k in self.refs:
             v = self.refs[k]
             if v.container is container:
+                self._ref_names[id(container)] = k
                 return k
 
     def _remove_cover(self, container: Container, action: str):
@@ -6611,10 +6826,16 @@ class Protocol:
             Autoprotocol compliant objects
 
         """
+        # most values of Instruction ASTs are already Autoprotocol compliant
         if type(op_data) is dict:
-            return {k: self._refify(v) for k, v in op_data.items()}
+            return {
+                k: v if type(v) in _REFIFIED_TYPES else self._refify(v)
+                for k, v in op_data.items()
+            }
         elif type(op_data) is list:
-            return [self._refify(i) for i in op_data]
+            return [
+                i if type(i) in _REFIFIED_TYPES else self._refify(i) for i in op_data
+            ]
         elif isinstance(op_data, Well):
             return self._ref_for_well(op_data)
         elif isinstance(op_data, WellGroup):
@@ -7324,7 +7545,7 @@ class Protocol:
         self,
         source: WellParam,
         destination: WellParam,
-        volume: Union[VOLUME, List[VOLUME]],
+        volume: Union[VOLUME, List[VOLUME], UnitList],
         rows: int = 1,
         columns: int = 1,
         source_liquid: LiquidClass = LiquidClass,
@@ -7334,6 +7555,7 @@ class Protocol:
         density: Optional[DENSITY] = None,
         mode: Optional[str] = None,
         informatics: Optional[List[Informatics]] = None,
+        stamp: bool = False,
     ):
         """Generates LiquidHandle instructions between wells
 
@@ -7345,7 +7567,7 @@ class Protocol:
             Well(s) to transfer liquid from.
         destination : Well or WellGroup or list(Well)
             Well(s) to transfer liquid to.
-        volume : str or Unit or list(str) or list(Unit)
+        volume : str or Unit or list(str) or list(Unit) or UnitList
             Volume(s) of liquid to be transferred from source wells to
             destination wells. The number of volumes specified must
             correspond to the number of destination wells.
@@ -7372,6 +7594,17 @@ class Protocol:
         informatics : list(Informatics), optional
             List of Informatics describing the intended aliquot effects upon
             completion of this instruction.
+        stamp : bool, optional
+            If True then single well transfers whose source and destination
+            wells form full SBS96 columns or rows, or full plates, with the
+            same volume, density, LiquidClasses and method are combined into
+            multi channel transfers. These use the multi channel defaults of
+            the method. Transfers are only stamped if no well is both a
+            source and a destination, and never with one_tip, informatics or
+            methods with a tip_type. Transfers that remain single well
+            transfers are recorded so that Protocol.stamp_transfers can
+            stamp them together with later transfers.
+            See Also Protocol.stamp_transfers
         Returns
         -------
         list(LiquidHandle)
@@ -7446,6 +7679,18 @@ class Protocol:
                 )
             )
 
+        Stamp single well transfers into multi channel transfers
+
+        .. code-block:: python
+
+            # a single LiquidHandle with shape rows=8, columns=1
+            p.transfer(
+                source.wells_from(0, 8, columnwise=True),
+                destination.wells_from(0, 8, columnwise=True),
+                "5:ul",
+                stamp=True
+            )
+
         Transfer using other built in Transfer methods
 
         .. code-block:: python
@@ -7492,18 +7737,9 @@ class Protocol:
             self._remove_cover(destination.container, "liquid_handle into")
             self._transfer_volume(source, destination, volume, method._shape)
 
-            return [
-                LiquidHandle.builders.location(
-                    location=source,
-                    # pylint: disable=protected-access
-                    transports=method._aspirate_transports(volume, density),
-                ),
-                LiquidHandle.builders.location(
-                    location=destination,
-                    # pylint: disable=protected-access
-                    transports=method._dispense_transports(volume, density),
-                ),
-            ]
+            return self._transfer_locations(
+                source, destination, volume, method, density
+            )
 
         def informatics_helper(informatics, dest, multi_src):
             """
@@ -7829,7 +8065,7 @@ class Protocol:
                     # sort informatics_list by the destination order
                     wells_compounds_dict = sorted(
                         wells_compounds_dict.items(),
-                        key=lambda pair: destination.wells.index(pair[0]),
+                        key=lambda pair: destination.index(pair[0]),
                     )
                     for k, v in wells_compounds_dict:
                         informatics_list.append(AttachCompounds(k, v))
@@ -7853,9 +8089,12 @@ class Protocol:
         if len(destination) == 1:
             destination = WellGroup([destination[0]] * count)
 
-        if not isinstance(volume, list):
-            volume = [volume] * count
-        volume = [parse_unit(_, "uL") for _ in volume]
+        if isinstance(volume, UnitList):
+            volume = list(parse_unit(volume, "uL"))
+        else:
+            if not isinstance(volume, list):
+                volume = [volume] * count
+            volume = [parse_unit(_, "uL") for _ in volume]
 
         if density:
             if not isinstance(density, list):
@@ -7943,43 +8182,47 @@ class Protocol:
                     f"If one_tip is true and any tip_type is set, then all tip types must be the same but {tip_types} was specified."
                 )
 
+        transfers = list(
+            zip(source, destination, volume, method, density, informatics_list)
+        )
+
+        # rewrite single well transfers into multi channel stamps
+        if stamp is True and one_tip is not True and not informatics:
+            stamped = self._stamp_transfers(
+                [
+                    (src, des, vol, met, dens, mode)
+                    for src, des, vol, met, dens, _ in transfers
+                ]
+            )
+            transfers = [
+                (src, des, vol, met, dens, None)
+                for (src, des, vol, met, dens, _), _ in stamped
+            ]
+
         # generate either a LiquidHandle location or instruction list
         locations, instructions = [], []
-        for src, des, vol, met, dens, informatics in zip(
-            source, destination, volume, method, density, informatics_list
-        ):
-            max_tip_capacity = met._tip_capacity()
-            remaining_vol = vol
-            while remaining_vol > Unit(0, "ul"):
-                transfer_vol = min(remaining_vol, max_tip_capacity)
-                if one_tip is True:
+        for src, des, vol, met, dens, informatics in transfers:
+            if one_tip is True:
+                max_tip_capacity = met._tip_capacity()
+                remaining_vol = vol
+                while remaining_vol > Unit(0, "ul"):
+                    transfer_vol = min(remaining_vol, max_tip_capacity)
                     locations += location_helper(src, des, transfer_vol, met, dens)
-                else:
-                    location_transports = location_helper(
-                        src, des, transfer_vol, met, dens
-                    )
-                    source_transports = location_transports[0]["transports"]
-                    instruction_mode = mode
-                    if not instruction_mode:
-                        instruction_mode = LiquidHandle.builders.desired_mode(
-                            source_transports, mode
-                        )
-                    if not isinstance(informatics, list):
-                        informatics = [informatics]
-                    instructions.append(
-                        LiquidHandle(
-                            location_transports,
-                            shape=met._shape,
-                            mode=instruction_mode,
-                            mode_params=(
-                                LiquidHandle.builders.instruction_mode_params(
-                                    tip_type=met.tip_type
-                                )
-                            ),
-                            informatics=informatics,
-                        )
+                    remaining_vol -= transfer_vol
+            elif vol > Unit(0, "ul"):
+                self._remove_cover(src.container, "liquid_handle from")
+                self._remove_cover(des.container, "liquid_handle into")
+                self._transfer_volume(src, des, vol, met._shape)
+                transfer_instructions = self._transfer_instructions(
+                    src, des, vol, met, dens, mode, informatics
+                )
+                if stamp is True:
+                    self._record_single_transfer(
+                        transfer_instructions,
+                        (src, des, vol, met, dens, mode),
+                        informatics,
                     )
-                remaining_vol -= transfer_vol
+                instructions += transfer_instructions
 
         # if one tip is true then there's a locations list
         if locations:
@@ -7998,11 +8241,100 @@ class Protocol:
             )
         return self._append_and_return(instructions)
 
+    def stamp_transfers(self):
+        """Stamps consecutive single well transfers into multi channel transfers
+
+        Rewrites runs of consecutive single well LiquidHandle instructions
+        generated by `Protocol.transfer` with `stamp=True` into multi channel
+        transfers wherever their source and destination wells form full SBS96
+        columns or rows, or full plates, and they share the same volume,
+        density, LiquidClasses and method. Instructions referenced by integer marks
+        of time constraints, and all instructions before them, are never
+        rewritten.
+
+        Example Usage:
+
+        .. code-block:: python
+
+            p = Protocol()
+            source = p.ref("source", cont_type="96-flat", discard=True)
+            destination = p.ref("destination", cont_type="96-flat", discard=True)
+            for index in range(8):
+                p.transfer(
+                    source.well(index * 12),
+                    destination.well(index * 12),
+                    "5:ul",
+                    stamp=True
+                )
+            # the eight instructions are replaced by a single LiquidHandle
+            # with shape rows=8, columns=1
+            p.stamp_transfers()
+
+        Returns
+        -------
+        list(LiquidHandle)
+            the multi channel LiquidHandle instructions that replaced single
+            well transfers
+
+        See Also
+        --------
+        Protocol.transfer : the `stamp` parameter stamps within one call
+        """
+        marks = [-1]
+        for constraint in self.time_constraints:
+            if not isinstance(constraint, dict):
+                continue
+            for time_point in (constraint.get("from"), constraint.get("to")):
+                if isinstance(time_point, dict):
+                    marks += [_ for _ in time_point.values() if isinstance(_, int)]
+        start = max(marks) + 1
+
+        kept = self.instructions[:start]
+        stamps = []
+        run = []
+
+        def flush():
+            transfers = [transfer for _, transfer in run]
+            for transfer, positions in self._stamp_transfers(transfers):
+                if len(positions) == 1:
+                    kept.extend(run[positions[0]][0])
+                    continue
+                for position in positions:
+                    del self._single_transfers[id(run[position][0][0])]
+                src, des, vol, met, dens, mode = transfer
+                generated = self._transfer_instructions(
+                    src, des, vol, met, dens, mode, None
+                )
+                kept.extend(generated)
+                stamps.extend(generated)
+            run.clear()
+
+        index = start
+        while index < len(self.instructions):
+            instruction = self.instructions[index]
+            record = self._single_transfers.get(id(instruction))
+            if record is not None:
+                recorded, transfer = record
+                candidate = self.instructions[index : index + len(recorded)]
+                if len(candidate) == len(recorded) and all(
+                    a is b for a, b in zip(candidate, recorded)
+                ):
+                    run.append((recorded, transfer))
+                    index += len(recorded)
+                    continue
+            flush()
+            kept.append(instruction)
+            index += 1
+        flush()
+
+        self.instructions[:] = kept
+        return stamps
+
     # pylint: disable=protected-access
     def mix(
         self,
         well: WellParam,
-        volume: Union[VOLUME, List[VOLUME]],
+        volume: Union[VOLUME, List[VOLUME], UnitList],
         rows: int = 1,
         columns: int = 1,
         liquid: LiquidClass = LiquidClass,
@@ -8018,7 +8350,7 @@ class Protocol:
         ----------
         well : Well or WellGroup or list(Well)
             Well(s) to be mixed.
-        volume : str or Unit or list(str) or list(Unit)
+        volume : str or Unit or list(str) or list(Unit) or UnitList
             Volume(s) of liquid to be mixed within the specified well(s).
             The number of volume(s) specified must correspond with the number
             of well(s).
@@ -8136,7 +8468,8 @@ class Protocol:
 
             return [
                 LiquidHandle.builders.location(
-                    location=aliquot, transports=method._mix_transports(volume)
+                    location=aliquot,
+                    transports=method._compiled_transports("_mix_transports", volume),
                 )
             ]
 
@@ -8144,9 +8477,12 @@ class Protocol:
         well = WellGroup(well)
         count = len(well)
 
-        if not isinstance(volume, list):
-            volume = [volume] * count
-        volume = [parse_unit(_, "uL") for _ in volume]
+        if isinstance(volume, UnitList):
+            volume = list(parse_unit(volume, "uL"))
+        else:
+            if not isinstance(volume, list):
+                volume = [volume] * count
+            volume = [parse_unit(_, "uL") for _ in volume]
 
         if not isinstance(liquid, list):
             liquid = [liquid] * count
@@ -8430,7 +8766,7 @@ class Protocol:
             )
         for source_well, dest_well in zip(source_wells, dest_wells):
             if self.propagate_properties:
-                dest_well.add_properties(source_well.properties)
+                dest_well._propagate_properties(source_well)
 
             if source_well.volume is not None:
                 source_well.volume -= volume
@@ -8440,6 +8776,231 @@ class Protocol:
             else:
                 dest_well.volume = volume
 
+    @staticmethod
+    def _transfer_locations(
+        source: Well,
+        destination: Well,
+        volume: Unit,
+        method: Transfer,
+        density: Optional[Unit],
+    ):
+        """
+        Generates the LiquidHandle locations of a single transfer.
+
+        Parameters
+        ----------
+        source : Well
+            The shape origin to be transferred from
+        destination : Well
+            The shape origin to be transferred to
+        volume : Unit
+            The volume to be transferred, at most the method's tip capacity
+        method : Transfer
+            The method generating the transports
+        density : Unit or None
+            The density of the liquid to be transferred
+
+        Returns
+        -------
+        list(dict)
+            the source and destination LiquidHandle locations
+        """
+        # pylint: disable=protected-access
+        return [
+            LiquidHandle.builders.location(
+                location=source,
+                transports=method._compiled_transports(
+                    "_aspirate_transports", volume, density
+                ),
+            ),
+            LiquidHandle.builders.location(
+                location=destination,
+                transports=method._compiled_transports(
+                    "_dispense_transports", volume, density
+                ),
+            ),
+        ]
+
+    def _transfer_instructions(
+        self,
+        source: Well,
+        destination: Well,
+        volume: Unit,
+        method: Transfer,
+        density: Optional[Unit],
+        mode: Optional[str],
+        informatics: Optional[Informatics],
+    ):
+        """
+        Generates the LiquidHandle instructions of a transfer.
+
+        The volume is split across as many instructions as the method's tip
+        capacity requires. Neither covers nor aliquot volumes are updated.
+
+        Parameters
+        ----------
+        source : Well
+            The shape origin to be transferred from
+        destination : Well
+            The shape origin to be transferred to
+        volume : Unit
+            The volume to be transferred
+        method : Transfer
+            The method generating the transports
+        density : Unit or None
+            The density of the liquid to be transferred
+        mode : str or None
+            The mode of the instructions, inferred from the transports if
+            None
+        informatics : Informatics or list(Informatics) or None
+            The Informatics of the instructions
+
+        Returns
+        -------
+        list(LiquidHandle)
+            the generated instructions
+        """
+        # pylint: disable=protected-access
+        if not isinstance(informatics, list):
+            informatics = [informatics]
+        instructions = []
+        max_tip_capacity = method._tip_capacity()
+        remaining_vol = volume
+        while remaining_vol > Unit(0, "ul"):
+            transfer_vol = min(remaining_vol, max_tip_capacity)
+            location_transports = self._transfer_locations(
+                source, destination, transfer_vol, method, density
+            )
+            instruction_mode = mode
+            if not instruction_mode:
+                instruction_mode = LiquidHandle.builders.desired_mode(
+                    location_transports[0]["transports"], mode
+                )
+            instructions.append(
+                LiquidHandle(
+                    location_transports,
+                    shape=method._shape,
+                    mode=instruction_mode,
+                    mode_params=LiquidHandle.builders.instruction_mode_params(
+                        tip_type=method.tip_type
+                    ),
+                    informatics=informatics,
+                )
+            )
+            remaining_vol -= transfer_vol
+        return instructions
+
+    def _record_single_transfer(
+        self,
+        instructions: List[LiquidHandle],
+        transfer: tuple,
+        informatics: Optional[Informatics],
+    ):
+        """
+        Records the instructions of a single well transfer for stamping.
+
+        Only transfers without informatics and tip_type are recorded, see
+        `Protocol.stamp_transfers`.
+
+        Parameters
+        ----------
+        instructions : list(LiquidHandle)
+            The instructions generated for the transfer
+        transfer : tuple
+            The source, destination, volume, method, density and mode of the
+            transfer
+        informatics : Informatics or list(Informatics) or None
+            The Informatics of the transfer
+        """
+        # pylint: disable=protected-access
+        src, des, vol, met, dens, mode = transfer
+        if (
+            not instructions
+            or informatics
+            or met.tip_type
+            or not met._is_single_channel()
+        ):
+            return
+        # the method may be reused and modified by later transfers
+        transfer = (src, des, vol, copy.copy(met), dens, mode)
+        self._single_transfers[id(instructions[0])] = (tuple(instructions), transfer)
+
+    @staticmethod
+    def _stamp_key(
+        method: Transfer, volume: Unit, density: Optional[Unit], mode: Optional[str]
+    ):
+        """
+        Gets the key that single well transfers are stamped together by.
+
+        Parameters
+        ----------
+        method : Transfer
+            The method of the transfer, including its LiquidClasses
+        volume : Unit
+            The volume of the transfer
+        density : Unit or None
+            The density of the transfer
+        mode : str or None
+            The mode of the transfer
+
+        Returns
+        -------
+        tuple or None
+            the stamp key, or None if the transfer can't be stamped
+        """
+        # pylint: disable=protected-access
+        if method.tip_type or not method._is_single_channel():
+            return None
+        try:
+            return _fingerprint((method, volume, density, mode))
+        except (TypeError, RecursionError):
+            return None
+
+    def _stamp_transfers(self, transfers: List[tuple]):
+        """
+        Stamps single well transfers into multi channel transfers.
+
+        Stamped transfers get a copy of their method with the stamp's shape
+        and tip type.
+
+        Parameters
+        ----------
+        transfers : list(tuple)
+            The source, destination, volume, method, density and mode of
+            each transfer
+
+        Returns
+        -------
+        list(tuple(tuple, list(int)))
+            the transfers to generate, each with the positions of the
+            transfers that it replaces
+
+        See Also
+        --------
+        util._plan_stamps : the planning of the stamps
+        """
+        # pylint: disable=protected-access
+        plan = _plan_stamps(
+            [
+                (src, des, self._stamp_key(met, vol, dens, mode))
+                for src, des, vol, met, dens, mode in transfers
+            ]
+        )
+        stamped = []
+        for shape, positions in plan:
+            src, des, vol, met, dens, mode = transfers[positions[0]]
+            if shape is not None:
+                met = copy.copy(met)
+                met._shape = LiquidHandle.builders.shape(**shape)
+                met._transports = []
+                if met._has_calibration():
+                    try:
+                        met._rec_tip_type(vol)
+                    except RuntimeError:
+                        met.tip_type = met._get_sorted_tip_types()[-1].name
+            stamped.append(((src, des, vol, met, dens, mode), positions))
+        return stamped
+
     def evaporate(
         self,
         ref: Container,
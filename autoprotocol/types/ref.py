@@ -5,7 +5,7 @@ from typing import Optional
 
 from autoprotocol import Container
 from autoprotocol.types import asdict
-from autoprotocol.unit import Unit
+from autoprotocol.util import _remove_empty_fields
 
 
 class Location(enum.Enum):
@@ -51,25 +51,7 @@ class RefOpts:
             Dictionary or list without fields with None values
 
         """
-        # We're not checking against the generic not since there are values
-        # such as `0` or False which are valid.
-        def filter_criteria(item):
-            # Workaround for Unit equality comparison issues
-            if isinstance(item, Unit):
-                return False
-            return item is None or item == [] or item == {}
-
-        if isinstance(data, dict):
-            return {
-                k: RefOpts._remove_empty_fields(v)
-                for k, v in data.items()
-                if not filter_criteria(v)
-            }
-        if isinstance(data, list):
-            return [
-                RefOpts._remove_empty_fields(_) for _ in data if not filter_criteria(_)
-            ]
-        return data
+        return _remove_empty_fields(data)
 
 
 @dataclass
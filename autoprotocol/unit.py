@@ -6,17 +6,27 @@ Module containing a Units library
     :license: BSD, see LICENSE for more details
 
 """
-from collections import defaultdict
+import copy
+import functools
+import os
+import pickle
+import stat
+import tempfile
+
+from collections import OrderedDict, defaultdict, namedtuple
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from math import ceil, floor
 from numbers import Number
 from typing import Any, List, Optional, Tuple, Union
 
+import pkg_resources
+
 from pint import UnitRegistry
+from pint import __version__ as pint_version
 from pint.errors import UndefinedUnitError
 from pint.quantity import _Quantity
-from pint.util import UnitsContainer
+from pint.util import ParserHelper, UnitsContainer, to_units_container
 
 
 def to_decimal(number):
@@ -58,6 +68,123 @@ class DecimalUnitRegistry(UnitRegistry):
     converting .to("new_unit").
     """
 
+    #: Registry attributes that are restored from snapshots
+    _SNAPSHOT_ATTRIBUTES = (
+        "_defaults",
+        "_dimensions",
+        "_units",
+        "_units_casei",
+        "_prefixes",
+        "_suffixes",
+        "_dimensional_equivalents",
+        "_root_units_cache",
+        "_dimensionality_cache",
+        "_parse_unit_cache",
+    )
+
+    #: Definition blocks that are parsed again when restoring a snapshot, as
+    #: groups, systems and contexts are built from registry specific classes
+    _SNAPSHOT_BLOCKS = ("@group", "@system", "@context")
+
+    def snapshot(self):
+        """
+        Captures the parsed definitions and caches of a registry built from
+        pint's default definitions file.
+
+        Returns
+        -------
+        dict
+            A picklable snapshot, see DecimalUnitRegistry.from_snapshot
+
+        Raises
+        ------
+        ValueError
+            If the registry was built from another definitions file
+        """
+        if self._filename != "":
+            raise ValueError(
+                "Only registries built from the default definitions can be "
+                "snapshotted."
+            )
+        state = {}
+        for attribute in self._SNAPSHOT_ATTRIBUTES:
+            value = getattr(self, attribute)
+            if isinstance(value, dict):
+                # ParserHelper instances can't be hashed while being unpickled
+                items = [
+                    (UnitsContainer(k) if isinstance(k, ParserHelper) else k, v)
+                    for k, v in value.items()
+                ]
+                value = copy.copy(value)
+                value.clear()
+                value.update(items)
+            state[attribute] = value
+        state["root_units"] = self.get_group("root").non_inherited_unit_names
+        state["blocks"] = self._definition_blocks("default_en.txt")
+        return state
+
+    @classmethod
+    def _definition_blocks(cls, resource):
+        """Lines of the group, system and context blocks of a definitions file"""
+        lines = []
+        in_block = False
+        source = pkg_resources.resource_string("pint", resource).decode("utf-8")
+        for line in source.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("@import"):
+                lines.extend(cls._definition_blocks(stripped[len("@import") :].strip()))
+            elif stripped.startswith(cls._SNAPSHOT_BLOCKS):
+                in_block = True
+            if in_block:
+                lines.append(line)
+            if stripped.startswith("@end"):
+                in_block = False
+        return lines
+
+    @classmethod
+    def from_snapshot(cls, state):
+        """
+        Builds a registry from a snapshot without parsing the definitions file
+        again.
+
+        Parameters
+        ----------
+        state : dict
+            A snapshot from DecimalUnitRegistry.snapshot, taken with the same
+            version of pint
+
+        Returns
+        -------
+        DecimalUnitRegistry
+            A registry equivalent to `DecimalUnitRegistry()`
+        """
+        registry = cls(filename=None)
+        state = dict(state)
+        blocks = state.pop("blocks")
+        root_units = state.pop("root_units")
+        registry.__dict__.update(state)
+        registry._filename = ""
+
+        # units defined within groups are already part of the snapshot
+        parse_group = registry._parsers["@group"]
+        registry._parsers["@group"] = lambda ifile: registry.Group.from_lines(
+            ifile.block_iter(), lambda definition: None
+        )
+        try:
+            registry.load_definitions(blocks)
+        finally:
+            registry._parsers["@group"] = parse_group
+
+        root = registry.get_group("root")
+        root.add_units(*root_units)
+        if "group" in registry._defaults:
+            group = registry.get_group(registry._defaults["group"], True)
+            group.add_units(*root.non_inherited_unit_names)
+        registry._default_system = registry._default_system or registry._defaults.get(
+            "system", None
+        )
+        return registry
+
     def _get_root_units(self, input_units, check_nonmult=True):
         if not input_units:
             return Decimal("1"), UnitsContainer()
@@ -97,8 +224,76 @@ class DecimalUnitRegistry(UnitRegistry):
                     self._get_root_units_recurse(reg.reference, exp2, accumulators)
 
 
+def _is_private(path):
+    """Whether a file or directory is owned by and only writable by the user"""
+    try:
+        status = os.stat(path)
+    except OSError:
+        return False
+    if not hasattr(os, "getuid"):
+        # ownership can't be checked, e.g. on Windows
+        return False
+    return status.st_uid == os.getuid() and not status.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def load_registry(cache_dir=None):
+    """
+    Builds a DecimalUnitRegistry from pint's default definitions file.
+
+    Parsing the definitions file accounts for a large part of the time it
+    takes to import autoprotocol. If a cache directory is specified, the
+    parsed registry is pickled to it, keyed by the version of pint, and later
+    loaded from that snapshot instead. The cache directory is set with the
+    `AUTOPROTOCOL_UNIT_REGISTRY_CACHE` environment variable.
+
+    As unpickling a snapshot can execute arbitrary code, snapshots are only
+    written and loaded if both the cache directory and the snapshot are owned
+    by the current user and can't be written to by anyone else. Otherwise the
+    definitions file is parsed as usual.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory in which registry snapshots are cached.
+
+    Returns
+    -------
+    DecimalUnitRegistry
+        The loaded registry
+    """
+    if not cache_dir:
+        return DecimalUnitRegistry()
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    except OSError:
+        return DecimalUnitRegistry()
+    if not _is_private(cache_dir):
+        return DecimalUnitRegistry()
+
+    path = os.path.join(cache_dir, f"unit_registry-pint-{pint_version}.pickle")
+    if _is_private(path):
+        try:
+            with open(path, "rb") as snapshot:
+                return DecimalUnitRegistry.from_snapshot(pickle.load(snapshot))
+        except Exception:  # pylint: disable=broad-except
+            # the snapshot is outdated or corrupted, so rebuild it
+            pass
+
+    registry = DecimalUnitRegistry()
+    try:
+        # temporary files are only readable and writable by the user
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as snapshot:
+            pickle.dump(registry.snapshot(), snapshot, pickle.HIGHEST_PROTOCOL)
+        os.replace(snapshot.name, path)
+    except OSError:
+        pass
+    return registry
+
+
 # Preload UnitRegistry (Use default Pints definition file as a base)
-_UnitRegistry = DecimalUnitRegistry()
+_UnitRegistry = load_registry(os.environ.get("AUTOPROTOCOL_UNIT_REGISTRY_CACHE"))
 
 """Map string representation of Pint units over to Autoprotocol format"""
 # Map Temperature Unit names
@@ -148,6 +343,441 @@ class UnitUnitsError(UnitError):
     )
 
 
+UnitCacheInfo = namedtuple("UnitCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class UnitCache(object):
+    """
+    A bounded LRU cache of Unit instances parsed from literals such as
+    "5:microliter" or (5, "microliter").
+
+    Instances returned from the cache are shared between all callers that
+    parsed the same literal, so they must be treated as immutable. Arithmetic
+    and conversions already return new Unit instances.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            from autoprotocol.unit import UNIT_CACHE
+
+            UNIT_CACHE.clear()
+            for _ in range(1000):
+                Unit("5:microliter")
+            print(UNIT_CACHE.info())
+
+            # disable caching, e.g. for benchmarking
+            UNIT_CACHE.enabled = False
+
+    Returns
+    -------
+    UnitCacheInfo
+
+        .. code-block:: none
+
+            UnitCacheInfo(hits=999, misses=1, maxsize=1024, currsize=1)
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of distinct literals kept in the cache.
+    enabled : bool, optional
+        Whether Unit construction should use the cache.
+    """
+
+    def __init__(self, maxsize=1024, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._units = OrderedDict()
+
+    @staticmethod
+    def key(value, units=None):
+        """
+        Generates the cache key for a Unit literal.
+
+        Parameters
+        ----------
+        value : str or Number
+            The value passed to the Unit constructor
+        units : str, optional
+            The units passed to the Unit constructor
+
+        Returns
+        -------
+        str or tuple or None
+            The raw string for "value:units" literals, a (value, units) pair
+            for separately specified values and units or None if the literal
+            can't be cached.
+        """
+        if units is None:
+            return value if type(value) is str else None
+        if type(units) is str and type(value) in (str, int, float, Decimal):
+            # the magnitude is parsed from str(value), so this is exact
+            return str(value), units
+        return None
+
+    def get(self, key):
+        """
+        Gets a cached Unit and marks it as the most recently used.
+
+        Parameters
+        ----------
+        key : str or tuple
+            See Also UnitCache.key
+
+        Returns
+        -------
+        Unit or None
+            The cached Unit, if any
+        """
+        try:
+            unit = self._units[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._units.move_to_end(key)
+        self.hits += 1
+        return unit
+
+    def put(self, key, unit):
+        """
+        Adds a Unit to the cache, evicting the least recently used entry if
+        the cache is full.
+
+        Parameters
+        ----------
+        key : str or tuple
+            See Also UnitCache.key
+        unit : Unit
+            The parsed Unit to be shared
+        """
+        if self.maxsize <= 0:
+            return
+        unit._interned = True  # pylint: disable=protected-access
+        self._units[key] = unit
+        if len(self._units) > self.maxsize:
+            self._units.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached Units and resets the hit and miss counters"""
+        self._units.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns
+        -------
+        UnitCacheInfo
+            hits, misses, maxsize and current size of the cache
+        """
+        return UnitCacheInfo(self.hits, self.misses, self.maxsize, len(self._units))
+
+
+# Formatted pint units, which are the same for every Unit with those units
+_UNITS_STRINGS = {}
+
+# Autoprotocol format of formatted pint units, e.g. "meter / second ** 2" to
+# "meter/second^2"
+_AUTOPROTOCOL_UNITS_STRINGS = {}
+
+#: Cache used by the Unit constructor for parsing literals
+UNIT_CACHE = UnitCache()
+
+
+def _converts_in_place(method):
+    """
+    Wraps a pint method that converts a Quantity in place, so that it
+    refuses to convert Units shared through the `UNIT_CACHE`
+    """
+
+    @functools.wraps(method)
+    def converts_in_place(unit, *args, **kwargs):
+        # pylint: disable=protected-access
+        unit._check_mutable("convert the units")
+        return method(unit, *args, **kwargs)
+
+    return converts_in_place
+
+
+class ConversionTable(object):
+    """
+    A precomputed table of exact Decimal conversion factors between the
+    units that Autoprotocol serializes.
+
+    Converting through the registry walks pint's definition graph for every
+    pair of units that wasn't converted before. The table computes the
+    factor for every pair of units within a group once, using the same
+    Decimal math as the registry, so conversions between those units reduce
+    to a dictionary lookup and a multiplication with identical results.
+    Conversions between other units fall back to the registry.
+
+    Offset units (celsius, fahrenheit) are converted as `value * factor +
+    offset`, with the factor and offset computed from the unit definitions.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            from autoprotocol.unit import CONVERSION_TABLE
+
+            Unit("5:microliter").to("nanoliter")  # uses the table
+            Unit("5:microliter").to("gallon")  # uses the registry
+
+            # disable the table, e.g. for benchmarking
+            CONVERSION_TABLE.enabled = False
+
+    Parameters
+    ----------
+    groups : list(list(str)), optional
+        Groups of interconvertible units. Factors are computed between all
+        units within the same group. Defaults to the units Autoprotocol
+        uses for volume, mass, time, temperature, flow rate, acceleration,
+        length and frequency.
+    enabled : bool, optional
+        Whether conversions should use the table.
+    """
+
+    DEFAULT_GROUPS = (
+        ("liter", "milliliter", "microliter", "nanoliter", "picoliter"),
+        ("kilogram", "gram", "milligram", "microgram", "nanogram", "picogram"),
+        (
+            "day",
+            "hour",
+            "minute",
+            "second",
+            "millisecond",
+            "microsecond",
+            "nanosecond",
+        ),
+        ("kelvin", "celsius", "fahrenheit"),
+        (
+            "milliliter / minute",
+            "milliliter / second",
+            "microliter / minute",
+            "microliter / second",
+            "nanoliter / second",
+        ),
+        ("microliter / second ** 2", "milliliter / second ** 2"),
+        ("standard_gravity", "meter / second ** 2", "millimeter / second ** 2"),
+        ("meter", "centimeter", "millimeter", "micrometer", "nanometer"),
+        ("megahertz", "kilohertz", "hertz", "rpm"),
+    )
+
+    def __init__(self, groups=DEFAULT_GROUPS, enabled=True):
+        self.enabled = enabled
+        self._groups = groups
+        self._names = None
+        self._conversions = None
+
+    def _build(self):
+        """Computes the factors for every pair of units within each group"""
+        # pragma pylint: disable=protected-access
+        names = {}
+        conversions = {}
+        for group in self._groups:
+            units = [to_units_container(_, _UnitRegistry) for _ in group]
+            for name, unit in zip(group, units):
+                names[name] = unit
+                names[str(unit)] = unit
+            for src in units:
+                for dst in units:
+                    if src == dst:
+                        conversions[src, dst] = (None, None)
+                        continue
+                    src_offset = _UnitRegistry._validate_and_extract(src)
+                    dst_offset = _UnitRegistry._validate_and_extract(dst)
+                    if src_offset or dst_offset:
+                        conversions[src, dst] = self._offset_conversion(src, dst)
+                    else:
+                        factor, _ = _UnitRegistry._get_root_units(src / dst)
+                        conversions[src, dst] = (to_decimal(factor), None)
+        self._names = names
+        self._conversions = conversions
+
+    @staticmethod
+    def _offset_conversion(src, dst):
+        """Factor and offset between single temperature units"""
+        # pragma pylint: disable=protected-access
+        (src_name,) = src.keys()
+        (dst_name,) = dst.keys()
+        src_converter = _UnitRegistry._units[src_name].converter
+        dst_converter = _UnitRegistry._units[dst_name].converter
+        src_offset = to_decimal(getattr(src_converter, "offset", 0))
+        dst_offset = to_decimal(getattr(dst_converter, "offset", 0))
+        src_scale = to_decimal(src_converter.scale)
+        dst_scale = to_decimal(dst_converter.scale)
+        return src_scale / dst_scale, (src_offset - dst_offset) / dst_scale
+
+    def _resolve(self, units):
+        """Resolves units to a UnitsContainer that's in the table, if any"""
+        # pylint: disable=protected-access
+        if isinstance(units, UnitsContainer):
+            return units
+        if isinstance(units, _Quantity):
+            return units._units
+        if isinstance(units, str):
+            try:
+                return self._names[units]
+            except KeyError:
+                pass
+            try:
+                container = to_units_container(units, _UnitRegistry)
+            except (UndefinedUnitError, ValueError, AttributeError):
+                return None
+            if (container, container) in self._conversions:
+                self._names[units] = container
+            return container
+        return None
+
+    def lookup(self, src, dst):
+        """
+        Looks up the conversion between two units.
+
+        Parameters
+        ----------
+        src : UnitsContainer
+            The pint units to convert from
+        dst : str or UnitsContainer or Unit
+            The units to convert to
+
+        Returns
+        -------
+        tuple(Decimal, Decimal, UnitsContainer) or None
+            The factor, the offset (None for multiplicative units) and the
+            pint units converted to, or None if the conversion isn't in the
+            table and has to be done by the registry. A factor of None means
+            that the units are identical.
+        """
+        # pragma pylint: disable=protected-access
+        if not self.enabled or _UnitRegistry._active_ctx:
+            return None
+        if self._conversions is None:
+            self._build()
+        dst = self._resolve(dst)
+        try:
+            factor, offset = self._conversions[src, dst]
+        except KeyError:
+            return None
+        return factor, offset, dst
+
+    @staticmethod
+    def apply(magnitude, factor, offset):
+        """
+        Applies a conversion from `ConversionTable.lookup` to a magnitude.
+
+        Parameters
+        ----------
+        magnitude : Decimal
+            The magnitude to be converted
+        factor : Decimal or None
+            The conversion factor
+        offset : Decimal or None
+            The conversion offset
+
+        Returns
+        -------
+        Decimal
+            The converted magnitude
+        """
+        if factor is not None:
+            magnitude = magnitude * factor
+        if offset is not None:
+            magnitude = magnitude + offset
+        return magnitude
+
+
+#: Precomputed conversion factors used by Unit.to
+CONVERSION_TABLE = ConversionTable()
+
+
+class FastArithmetic(object):
+    """
+    An opt-in fast path for arithmetic and comparisons between Units with
+    identical units.
+
+    When enabled, adding, subtracting and comparing two Units that have
+    identical units of one of the supported dimensionalities operates on
+    their Decimal magnitudes directly, skipping pint's dimensionality checks
+    and conversions. Units that differ are still handled by pint, so results
+    are exactly equal to the default behavior.
+
+    Only multiplicative dimensionalities are supported, as pint converts
+    offset units such as celsius into delta units when subtracting.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            from autoprotocol.unit import FAST_ARITHMETIC
+
+            FAST_ARITHMETIC.enabled = True
+
+            # or only within a block
+            with FAST_ARITHMETIC:
+                total = sum(volumes, Unit(0, "microliter"))
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether the fast path is used.
+    dimensionalities : list(str), optional
+        Dimensionalities that are eligible for the fast path. Defaults to
+        volume, mass and time.
+    """
+
+    def __init__(
+        self, enabled=False, dimensionalities=("[length] ** 3", "[mass]", "[time]")
+    ):
+        self.enabled = enabled
+        self._dimensionalities = frozenset(
+            _UnitRegistry.get_dimensionality(_) for _ in dimensionalities
+        )
+        self._supported = {}
+        self._previous = []
+
+    def supports(self, units):
+        """
+        Checks whether units are eligible for the fast path.
+
+        Parameters
+        ----------
+        units : UnitsContainer
+            The pint units of a Unit
+
+        Returns
+        -------
+        bool
+            Whether the units have one of the supported dimensionalities
+        """
+        try:
+            return self._supported[units]
+        except KeyError:
+            # pragma pylint: disable=protected-access
+            dimensionality = _UnitRegistry._get_dimensionality(units)
+            # pragma pylint: enable=protected-access
+            supported = dimensionality in self._dimensionalities
+            self._supported[units] = supported
+            return supported
+
+    def __enter__(self):
+        self._previous.append(self.enabled)
+        self.enabled = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.enabled = self._previous.pop()
+
+
+#: Opt-in fast path for same-unit Unit arithmetic
+FAST_ARITHMETIC = FastArithmetic()
+
+
 @dataclass(eq=False)
 class Unit(_Quantity):
     """
@@ -160,6 +790,10 @@ class Unit(_Quantity):
     there are inherent issues when dealing with extremely large/small
     numbers as well as numerical rounding for non-base 2 numbers.
 
+    Units created from literals are shared through the `UNIT_CACHE`, so
+    the magnitude and units of such a Unit can't be modified in place, e.g.
+    with `ito`. In place operators such as `//=` rebind to a new Unit.
+
     Example
     -------
 
@@ -190,6 +824,10 @@ class Unit(_Quantity):
     value: Union[int, float, str]
     units: Optional[str] = None
 
+    _interned = False
+    # (magnitude, units, str) of the last default string representation
+    _string = None
+
     def __new__(cls, value, units=None):
         cls._REGISTRY = _UnitRegistry
         cls.force_ndarray = False
@@ -198,6 +836,14 @@ class Unit(_Quantity):
         if isinstance(value, Unit):
             return value
 
+        key = None
+        if UNIT_CACHE.enabled and cls is Unit:
+            key = UNIT_CACHE.key(value, units)
+            if key is not None:
+                cached = UNIT_CACHE.get(key)
+                if cached is not None:
+                    return cached
+
         # Automatically parse String if no units provided
         if not units:
             if isinstance(value, str):
@@ -212,17 +858,27 @@ class Unit(_Quantity):
                     raise UnitUnitsError(value) from e
 
         try:
-            return super(Unit, cls).__new__(cls, Decimal(str(value)), units)
+            unit = super(Unit, cls).__new__(cls, Decimal(str(value)), units)
         except (ValueError, InvalidOperation) as e:
             raise UnitValueError(value) from e
         except UndefinedUnitError as e:
             raise UnitUnitsError(units) from e
 
+        if key is not None:
+            UNIT_CACHE.put(key, unit)
+        return unit
+
     def __post_init__(self):
         super(Unit, self).__init__()
         self.value = float(self.magnitude)
-        self.unit = self._units.__str__()
-        self.units = self._units.__str__()
+        # shared instances are re-initialized on every cache hit, but their
+        # units were already formatted when they were first parsed
+        if not (self._interned and "unit" in self.__dict__):
+            try:
+                self.unit = _UNITS_STRINGS[self._units]
+            except KeyError:
+                self.unit = _UNITS_STRINGS.setdefault(self._units, str(self._units))
+        self.units = self.unit
 
     def __str__(self, ndigits=12):
         """
@@ -236,12 +892,32 @@ class Unit(_Quantity):
         -------
         str
             This rounds the string presentation to 12 decimal places by default
-            to account for the majority of numerical precision issues
+            to account for the majority of numerical precision issues. The
+            default representation is computed once and reused until the
+            magnitude changes.
         """
+        if ndigits == 12:
+            cached = self._string
+            if (
+                cached is not None
+                and cached[0] is self._magnitude
+                and cached[1] is self._units
+            ):
+                return cached[2]
         rounded_magnitude = round(self.magnitude, ndigits)
         normalized_magnitude = to_decimal(rounded_magnitude).normalize()
-        unit_repr = self.unit.replace("**", "^").replace(" ", "")
-        return f"{normalized_magnitude:f}:{unit_repr:s}"
+        try:
+            unit_repr = _AUTOPROTOCOL_UNITS_STRINGS[self.unit]
+        except KeyError:
+            unit_repr = _AUTOPROTOCOL_UNITS_STRINGS.setdefault(
+                self.unit, self.unit.replace("**", "^").replace(" ", "")
+            )
+        string = f"{normalized_magnitude:f}:{unit_repr:s}"
+        if ndigits == 12:
+            # pint modifies magnitudes in place, e.g. in `ito`, so the
+            # representation is only reused for the same magnitude and units
+            self._string = (self._magnitude, self._units, string)
+        return string
 
     def __repr__(self):
         return f"Unit({self.magnitude:f}, '{self.units:s}')"
@@ -252,6 +928,70 @@ class Unit(_Quantity):
     def __floor__(self):
         return self.__class__(floor(self.magnitude), self.units)
 
+    def _convert_magnitude_not_inplace(self, other, *contexts, **ctx_kwargs):
+        """
+        Converts the magnitude of the Unit to the specified units, which `to`
+        and comparisons with Units in other units are built on.
+
+        Conversions between units in the `CONVERSION_TABLE` skip the
+        registry.
+
+        Parameters
+        ----------
+        other : UnitsContainer
+            Units to convert to
+        contexts : str
+            pint contexts that are enabled for the conversion
+        ctx_kwargs : dict
+            Parameters of the contexts
+
+        Returns
+        -------
+        Decimal
+            the converted magnitude
+        """
+        if not (contexts or ctx_kwargs):
+            conversion = CONVERSION_TABLE.lookup(self._units, other)
+            if conversion is not None:
+                factor, offset, _ = conversion
+                return ConversionTable.apply(self._magnitude, factor, offset)
+        return super(Unit, self)._convert_magnitude_not_inplace(
+            other, *contexts, **ctx_kwargs
+        )
+
+    # pragma pylint: disable=protected-access
+    def _is_fast_path(self, other):
+        """
+        Checks whether an operation with other can skip pint
+
+        See Also FastArithmetic
+        """
+        return (
+            FAST_ARITHMETIC.enabled
+            and isinstance(other, Unit)
+            and self._units == other._units
+            and FAST_ARITHMETIC.supports(self._units)
+        )
+
+    def _add_sub(self, other, op):
+        if self._is_fast_path(other):
+            return self.__class__(op(self._magnitude, other._magnitude), self._units)
+        return super(Unit, self)._add_sub(other, op)
+
+    def compare(self, other, op):
+        if self._is_fast_path(other):
+            return op(self._magnitude, other._magnitude)
+        return super(Unit, self).compare(other, op)
+
+    def __eq__(self, other):
+        if self._is_fast_path(other):
+            return self._magnitude == other._magnitude
+        return super(Unit, self).__eq__(other)
+
+    # pragma pylint: enable=protected-access
+
+    __hash__ = _Quantity.__hash__
+
     def _mul_div(self, other, magnitude_op, units_op=None):
         """
         Extends Pint's base _Quantity multiplication/division
@@ -280,14 +1020,52 @@ class Unit(_Quantity):
 
         return super(Unit, self)._imul_div(other, magnitude_op, units_op)
 
+    def _check_mutable(self, action):
+        """
+        Checks that the Unit isn't shared through the `UNIT_CACHE` before it
+        is modified in place
+
+        Parameters
+        ----------
+        action : str
+            Description of the modification for the error message
+
+        Raises
+        ------
+        RuntimeError
+            If the Unit is shared through the Unit cache
+        """
+        if self._interned:
+            raise RuntimeError(
+                f"Tried to {action} of {self!r}, but it is shared through the "
+                f"Unit cache. Create a new Unit instead."
+            )
+
+    ito = _converts_in_place(_Quantity.ito)
+    ito_root_units = _converts_in_place(_Quantity.ito_root_units)
+    ito_base_units = _converts_in_place(_Quantity.ito_base_units)
+    ito_reduced_units = _converts_in_place(_Quantity.ito_reduced_units)
+
+    def __ifloordiv__(self, other):
+        if self._interned:
+            return self // other
+        return super(Unit, self).__ifloordiv__(other)
+
+    def __imod__(self, other):
+        if self._interned:
+            return self % other
+        return super(Unit, self).__imod__(other)
+
     @property
     def magnitude(self):
         return self._magnitude
 
     @magnitude.setter
     def magnitude(self, magnitude):
+        self._check_mutable("set the magnitude")
         try:
             self._magnitude = to_decimal(magnitude)
+            self._string = None
         except ValueError as e:
             raise RuntimeError(
                 f"Tried to set Unit's magnitude {magnitude} but it was of type "
@@ -337,6 +1115,302 @@ class Unit(_Quantity):
         return self.__round__(ndigits)
 
 
+class UnitList(object):
+    """
+    A list of quantities that share a single unit.
+
+    Magnitudes are kept as a list of Decimals next to one set of units, so
+    units are parsed and converted once per list rather than once per
+    element, and arithmetic, reductions and comparisons loop over plain
+    Decimals without creating a Unit for every element. The loops are
+    still Python loops over exact Decimals, not vectorized. Indexing or
+    iterating over a UnitList returns Units.
+
+    Example
+    -------
+
+        .. code-block:: python
+
+            volumes = UnitList(["5:microliter", "10:microliter", "1:milliliter"])
+            print(volumes)
+            print(volumes.sum())
+            print(volumes * 2)
+            print(volumes < Unit(20, "microliter"))
+
+            p.transfer(source.all_wells(), dest.all_wells(), UnitList(
+                [1, 2, 3] * 32, "microliter"
+            ))
+
+    Returns
+    -------
+    UnitList
+
+        .. code-block:: none
+
+            UnitList([5, 10, 1000], 'microliter')
+            1015:microliter
+            UnitList([10, 20, 2000], 'microliter')
+            [True, True, False]
+
+    Parameters
+    ----------
+    values : list(Unit or str or Number) or UnitList
+        The quantities in the list. Numbers are interpreted in `units`.
+    units : str, optional
+        The units of the list. If not specified, the units of the first
+        value are used.
+
+    Raises
+    ------
+    UnitStringError
+        If a string value isn't formatted as '1:meter'
+    UnitValueError
+        If a value isn't numeric
+    UnitUnitsError
+        If units aren't in the UnitRegistry or weren't specified for Numbers
+    ValueError
+        If the values don't all have the same dimensionality
+    """
+
+    __hash__ = None
+
+    def __init__(self, values, units=None):
+        target = _parse_units(units) if units else None
+        magnitudes = []
+        parsed = []
+        for value in values:
+            if isinstance(value, _Quantity):
+                parsed.append((value._magnitude, value._units))
+            elif isinstance(value, str):
+                try:
+                    mag, unit = value.split(":")
+                except ValueError as e:
+                    raise UnitStringError(value) from e
+                parsed.append((_parse_magnitude(mag), _parse_units(unit)))
+            elif target is not None:
+                parsed.append((_parse_magnitude(value), target))
+            else:
+                raise UnitUnitsError(value)
+        if target is None:
+            target = parsed[0][1] if parsed else UnitsContainer()
+        for magnitude, source in parsed:
+            if source != target:
+                magnitude = _convert_magnitude(magnitude, source, target)
+            magnitudes.append(magnitude)
+
+        self._magnitudes = magnitudes
+        self._units = target
+        self.units = str(target)
+
+    @classmethod
+    def _from_magnitudes(cls, magnitudes, units):
+        # pragma pylint: disable=protected-access
+        unit_list = cls.__new__(cls)
+        unit_list._magnitudes = magnitudes
+        unit_list._units = units
+        unit_list.units = str(units)
+        return unit_list
+
+    @property
+    def magnitudes(self):
+        """list(Decimal): magnitudes of the list in its units"""
+        return list(self._magnitudes)
+
+    @property
+    def dimensionality(self):
+        """UnitsContainer: dimensionality shared by all elements"""
+        # pragma pylint: disable=protected-access
+        return _UnitRegistry._get_dimensionality(self._units)
+
+    def to(self, units):
+        """
+        Converts every element of the list to the specified units
+
+        Parameters
+        ----------
+        units : str
+            Units to convert to
+
+        Returns
+        -------
+        UnitList
+            the converted list
+        """
+        target = _parse_units(units)
+        return self._from_magnitudes(self._converted_magnitudes(target), target)
+
+    def _converted_magnitudes(self, target):
+        if target == self._units:
+            return list(self._magnitudes)
+        conversion = CONVERSION_TABLE.lookup(self._units, target)
+        if conversion is not None:
+            factor, offset, _ = conversion
+            return [ConversionTable.apply(_, factor, offset) for _ in self._magnitudes]
+        return [_UnitRegistry.convert(_, self._units, target) for _ in self._magnitudes]
+
+    def _other_magnitudes(self, other):
+        """Magnitudes of a Unit or UnitList in the units of this list"""
+        # pragma pylint: disable=protected-access
+        if isinstance(other, UnitList):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Can't operate on UnitLists of different lengths "
+                    f"{len(self)} and {len(other)}."
+                )
+            return other._converted_magnitudes(self._units)
+        if isinstance(other, str):
+            other = Unit(other)
+        if isinstance(other, _Quantity):
+            magnitude = other._magnitude
+            if other._units != self._units:
+                magnitude = _convert_magnitude(magnitude, other._units, self._units)
+            return [magnitude] * len(self)
+        return NotImplemented
+
+    def _add_sub(self, other, op):
+        others = self._other_magnitudes(other)
+        if others is NotImplemented:
+            return NotImplemented
+        return self._from_magnitudes(
+            [op(a, b) for a, b in zip(self._magnitudes, others)], self._units
+        )
+
+    def __add__(self, other):
+        return self._add_sub(other, lambda a, b: a + b)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._add_sub(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return self._add_sub(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        if not isinstance(other, Number):
+            return NotImplemented
+        factor = to_decimal(other)
+        return self._from_magnitudes(
+            [_ * factor for _ in self._magnitudes], self._units
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Number):
+            # ratios to Units of the same dimensionality are dimensionless
+            others = self._other_magnitudes(other)
+            if others is NotImplemented:
+                return NotImplemented
+            return self._from_magnitudes(
+                [a / b for a, b in zip(self._magnitudes, others)], UnitsContainer()
+            )
+        divisor = to_decimal(other)
+        return self._from_magnitudes(
+            [_ / divisor for _ in self._magnitudes], self._units
+        )
+
+    def __neg__(self):
+        return self._from_magnitudes([-_ for _ in self._magnitudes], self._units)
+
+    def _compare(self, other, op):
+        others = self._other_magnitudes(other)
+        if others is NotImplemented:
+            return NotImplemented
+        return [op(a, b) for a, b in zip(self._magnitudes, others)]
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __le__(self, other):
+        return self._compare(other, lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return self._compare(other, lambda a, b: a >= b)
+
+    def __eq__(self, other):
+        try:
+            return self._compare(other, lambda a, b: a == b)
+        except ValueError:
+            return False
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if isinstance(result, list):
+            return [not _ for _ in result]
+        return result
+
+    def sum(self):
+        """
+        Returns
+        -------
+        Unit
+            the sum of all elements
+        """
+        return Unit(sum(self._magnitudes, Decimal("0")), self._units)
+
+    def min(self):
+        """
+        Returns
+        -------
+        Unit
+            the smallest element
+        """
+        return Unit(min(self._magnitudes), self._units)
+
+    def max(self):
+        """
+        Returns
+        -------
+        Unit
+            the largest element
+        """
+        return Unit(max(self._magnitudes), self._units)
+
+    def __len__(self):
+        return len(self._magnitudes)
+
+    def __iter__(self):
+        return (Unit(_, self._units) for _ in self._magnitudes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._from_magnitudes(self._magnitudes[key], self._units)
+        return Unit(self._magnitudes[key], self._units)
+
+    def __repr__(self):
+        magnitudes = ", ".join(f"{_.normalize():f}" for _ in self._magnitudes)
+        return f"UnitList([{magnitudes}], '{self.units:s}')"
+
+
+def _convert_magnitude(magnitude, src, dst):
+    conversion = CONVERSION_TABLE.lookup(src, dst)
+    if conversion is None:
+        return _UnitRegistry.convert(magnitude, src, dst)
+    factor, offset, _ = conversion
+    return ConversionTable.apply(magnitude, factor, offset)
+
+
+def _parse_magnitude(value):
+    try:
+        return Decimal(str(value))
+    except (ValueError, InvalidOperation) as e:
+        raise UnitValueError(value) from e
+
+
+def _parse_units(units):
+    # pragma pylint: disable=protected-access
+    if isinstance(units, UnitsContainer):
+        return units
+    try:
+        return _UnitRegistry.parse_units(units)._units
+    except UndefinedUnitError as e:
+        raise UnitUnitsError(units) from e
+
+
 def unit_as_strings_factory(data: List[Tuple[str, Any]]):
     """
     Used as a dict_factory parameter in the dataclasses.asdict
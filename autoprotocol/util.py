@@ -7,8 +7,10 @@ Module containing utility functions
 
 """
 
+import json
+
 from .constants import SBS_FORMAT_SHAPES
-from .unit import Unit, UnitStringError, UnitValueError
+from .unit import Unit, UnitList, UnitStringError, UnitValueError
 
 
 def is_valid_well(well):
@@ -42,6 +44,59 @@ def is_valid_well(well):
     return True
 
 
+# Dimensionalities and parsed base units of accepted unit specs, memoized by
+# spec. See `_accepted_dimensionalities`.
+_ACCEPTED_DIMENSIONALITIES = {}
+
+
+def _accepted_dimensionalities(accepted_unit):
+    """
+    Resolves an accepted unit spec into the dimensionalities it accepts.
+
+    String specs and lists of strings, such as "ul" or ["mg/ml", "M"], are
+    resolved once and memoized. Specs that contain Units are resolved on every
+    call, as Units with different magnitudes hash equally.
+
+    Parameters
+    ----------
+    accepted_unit: Unit or str or list(Unit) or list(str)
+        Accepted unit(s), see `parse_unit`
+
+    Returns
+    -------
+    tuple(frozenset, list(Unit))
+        The accepted dimensionalities and the parsed base units
+    """
+    if isinstance(accepted_unit, list):
+        key = tuple(accepted_unit)
+    else:
+        key = (accepted_unit,)
+    cacheable = all(isinstance(_, str) for _ in key)
+    if cacheable:
+        try:
+            return _ACCEPTED_DIMENSIONALITIES[key]
+        except KeyError:
+            pass
+
+    # Note: This is hacky. We should formalize the concept of base Units
+    # in AP-Py
+    def parse_base_unit(base_unit):
+        if not isinstance(base_unit, Unit):
+            if isinstance(base_unit, str):
+                if ":" not in base_unit:
+                    base_unit = "1:" + base_unit
+        return Unit(base_unit)
+
+    if isinstance(accepted_unit, list):
+        accepted_units = [parse_base_unit(a_u) for a_u in accepted_unit]
+    else:
+        accepted_units = [parse_base_unit(accepted_unit)]
+    resolved = frozenset(_.dimensionality for _ in accepted_units), accepted_units
+    if cacheable:
+        _ACCEPTED_DIMENSIONALITIES[key] = resolved
+    return resolved
+
+
 def parse_unit(unit, accepted_unit=None):
     """
     Parses and checks unit provided and ensures its of valid type and
@@ -55,8 +110,9 @@ def parse_unit(unit, accepted_unit=None):
 
     Parameters
     ----------
-    unit: Unit or str
-        Input to be checked
+    unit: Unit or str or UnitList
+        Input to be checked. A UnitList is checked once for all of its
+        elements.
     accepted_unit: Unit or str or list(Unit) or list(str), optional
         Dimensionality of unit should match against the accepted unit(s).
 
@@ -70,7 +126,7 @@ def parse_unit(unit, accepted_unit=None):
 
     Returns
     -------
-    Unit
+    Unit or UnitList
         Parsed and checked unit
 
     Raises
@@ -78,33 +134,162 @@ def parse_unit(unit, accepted_unit=None):
     TypeError
         Error when input does not match expected type or dimensionality
     """
-    if not isinstance(unit, Unit):
+    if not isinstance(unit, (Unit, UnitList)):
         try:
             unit = Unit(unit)
         except (UnitStringError, UnitValueError) as e:
             raise TypeError(f"{unit} is not of type Unit/str") from e
     if accepted_unit is not None:
-        # Note: This is hacky. We should formalize the concept of base Units
-        # in AP-Py
-        def parse_base_unit(base_unit):
-            if not isinstance(base_unit, Unit):
-                if isinstance(base_unit, str):
-                    if ":" not in base_unit:
-                        base_unit = "1:" + base_unit
-            return Unit(base_unit)
-
-        if isinstance(accepted_unit, list):
-            accepted_unit = [parse_base_unit(a_u) for a_u in accepted_unit]
-        else:
-            accepted_unit = [parse_base_unit(accepted_unit)]
-        if all([unit.dimensionality != a_u.dimensionality for a_u in accepted_unit]):
+        dimensionalities, accepted_units = _accepted_dimensionalities(accepted_unit)
+        if unit.dimensionality not in dimensionalities:
             raise TypeError(
-                f"{unit} is not of the expected dimensionality " f"{accepted_unit}"
+                f"{unit} is not of the expected dimensionality " f"{accepted_units}"
             )
 
     return unit
 
 
+def _as_json_compatible(value):
+    """
+    Converts a value into the plain Python objects it's decoded as after a
+    round-trip through JSON, i.e. `json.loads(json.dumps(value))`, without
+    encoding it.
+
+    Parameters
+    ----------
+    value : dict or list or tuple or str or int or float or bool or None
+        JSON serializable value, possibly nested
+
+    Returns
+    -------
+    dict or list or str or int or float or bool or None
+        A copy of the value with plain dicts and lists, and str keys
+    """
+    if isinstance(value, dict):
+        plain = {}
+        for key, item in value.items():
+            # keys that aren't str are encoded the same way as JSON values
+            if not isinstance(key, str):
+                key = json.dumps(key)
+            plain[key] = _as_json_compatible(item)
+        return plain
+    if isinstance(value, (list, tuple)):
+        return [_as_json_compatible(item) for item in value]
+    return value
+
+
+# types of items that are never empty fields, see `_is_empty_field`
+_NON_EMPTY_FIELD_TYPES = frozenset([str, int, float, bool, Unit])
+
+
+def _is_empty_field(item):
+    """
+    Whether an item is None or an empty list or dict, see
+    `_remove_empty_fields`. Values such as `0` or False are valid.
+    """
+    if item is None:
+        return True
+    item_type = type(item)
+    if item_type is list or item_type is dict:
+        return not item
+    if item_type in _NON_EMPTY_FIELD_TYPES:
+        return False
+    # Workaround for Unit equality comparison issues
+    if isinstance(item, Unit):
+        return False
+    return item == [] or item == {}
+
+
+def _is_kept_field(item, passes):
+    """
+    Whether an item is kept by `_remove_empty_fields` with `passes`, i.e.
+    whether it isn't empty and, for more passes, still has items that are kept
+    with one pass less.
+    """
+    if _is_empty_field(item):
+        return False
+    if passes > 1 and isinstance(item, (dict, list)):
+        return _has_kept_field(item, passes - 1)
+    return True
+
+
+def _has_kept_field(data, passes):
+    """Whether a dict or list has any item that is kept with `passes`"""
+    for item in data.values() if isinstance(data, dict) else data:
+        if item is None:
+            continue
+        item_type = type(item)
+        if item_type in _NON_EMPTY_FIELD_TYPES:
+            return True
+        if _is_kept_field(item, passes):
+            return True
+    return False
+
+
+def _remove_empty_fields(data, passes=1):
+    """
+    Removes items of nested dictionaries and lists that are None or empty
+    dictionaries or lists.
+
+    Dictionaries and lists that only become empty by removing their items are
+    removed by subsequent passes. The result of all passes is built in a
+    single traversal without intermediate copies.
+
+    Parameters
+    ----------
+    data : dict or list
+        Data dictionary or list to remove empty fields from
+    passes : int, optional
+        Number of times to remove empty fields
+
+    Returns
+    -------
+    dict or list
+        Copy of the dictionary or list without empty fields
+    """
+    if isinstance(data, dict):
+        result = {}
+    elif isinstance(data, list):
+        result = []
+    else:
+        return data
+
+    stack = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            items = source.items()
+        else:
+            items = enumerate(source)
+        is_dict = type(target) is dict
+        for key, value in items:
+            if value is None:
+                continue
+            value_type = type(value)
+            if value_type in _NON_EMPTY_FIELD_TYPES:
+                kept = value
+            elif value_type is dict or value_type is list:
+                if not value or (passes > 1 and not _has_kept_field(value, passes - 1)):
+                    continue
+                kept = value_type()
+                stack.append((value, kept))
+            elif not _is_kept_field(value, passes):
+                continue
+            elif isinstance(value, dict):
+                kept = {}
+                stack.append((value, kept))
+            elif isinstance(value, list):
+                kept = []
+                stack.append((value, kept))
+            else:
+                kept = value
+            if is_dict:
+                target[key] = kept
+            else:
+                target.append(kept)
+    return result
+
+
 def _validate_as_instance(item, target_type):
     """
     Validates that the item is an instance of the target_type and if not,
@@ -215,6 +400,92 @@ def _check_container_type_with_shape(container_type, shape):
         )
 
 
+# multi channel shapes that single well transfers are stamped into, largest first
+_STAMP_SHAPES = [
+    (16, 24, "SBS384"),
+    (8, 12, "SBS96"),
+    (8, 1, "SBS96"),
+    (1, 12, "SBS96"),
+]
+
+
+def _plan_stamps(transfers):
+    """
+    Groups single well transfers into multi channel stamps
+
+    Transfers are stamped together if their source and destination wells are
+    laid out in the same full plate, column or row shape and they share the
+    same stamp key, e.g. for the same volume, LiquidClasses and method.
+    Stamps reorder transfers, so nothing is stamped if any well is both a
+    source and a destination.
+
+    Parameters
+    ----------
+    transfers : list(tuple(Well, Well, object))
+        the source, destination and stamp key of each transfer. transfers
+        with a stamp key of None are never stamped.
+
+    Returns
+    -------
+    list(tuple(dict or None, list(int)))
+        the shape and the positions of the transfers of each stamp, or None
+        and the position of each single transfer, ordered by the position of
+        their first transfer
+    """
+    from .instruction import Instruction
+
+    singles = [(None, [position]) for position in range(len(transfers))]
+    sources = set((src.container, src.index) for src, _, _ in transfers)
+    destinations = set((des.container, des.index) for _, des, _ in transfers)
+    if sources & destinations:
+        return singles
+
+    # positions of the transfers by their wells and stamp key, in order
+    unstamped = {}
+    for position, (src, des, key) in enumerate(transfers):
+        if key is not None:
+            pair = (src.container, src.index, des.container, des.index, key)
+            unstamped.setdefault(pair, []).append(position)
+
+    stamps = {}
+    for rows, columns, shape_format in _STAMP_SHAPES:
+        shape = Instruction.builders.shape(rows, columns, shape_format)
+        for position, (src, des, key) in enumerate(transfers):
+            pair = (src.container, src.index, des.container, des.index, key)
+            if key is None or position not in unstamped.get(pair, ()):
+                continue
+            try:
+                _check_container_type_with_shape(src.container.container_type, shape)
+                _check_container_type_with_shape(des.container.container_type, shape)
+                stamp_sources = src.container.wells_from_shape(src.index, shape)
+                stamp_destinations = des.container.wells_from_shape(des.index, shape)
+            except ValueError:
+                continue
+            source_indices = [_.index for _ in stamp_sources]
+            destination_indices = [_.index for _ in stamp_destinations]
+            # smaller containers reference some wells multiple times
+            distinct = min(len(set(source_indices)), len(set(destination_indices)))
+            if distinct < rows * columns:
+                continue
+            stamp_pairs = [
+                (src.container, s, des.container, d, key)
+                for s, d in zip(source_indices, destination_indices)
+            ]
+            if not all(unstamped.get(_) for _ in stamp_pairs):
+                continue
+            positions = [unstamped[_].pop(0) for _ in stamp_pairs]
+            stamps[min(positions)] = (shape, positions)
+
+    stamped = set(_ for _, positions in stamps.values() for _ in positions)
+    plan = []
+    for position in range(len(transfers)):
+        if position in stamps:
+            plan.append(stamps[position])
+        elif position not in stamped:
+            plan.append(singles[position])
+    return plan
+
+
 def _validate_liha_shape(device: str, shape: dict) -> None:
     """Validates LiHa shape for liquid handle dispense.
 
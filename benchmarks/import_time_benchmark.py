@@ -0,0 +1,77 @@
+"""
+Benchmarks the time it takes to `import autoprotocol`, with and without a
+cached unit registry snapshot (see autoprotocol.unit.load_registry).
+
+Each import runs in a fresh interpreter with `python -X importtime`, and the
+median cumulative import times of the slowest modules are reported in
+microseconds.
+
+Usage (with autoprotocol installed, e.g. `pip install -e .`):
+
+    python benchmarks/import_time_benchmark.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from collections import defaultdict
+
+
+MODULES = ("pint", "autoprotocol.unit", "autoprotocol.container", "autoprotocol")
+
+
+def import_times(env):
+    """Cumulative import times in microseconds, by module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import autoprotocol"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def run(runs):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        modes = {
+            "default": {
+                k: v
+                for k, v in os.environ.items()
+                if k != "AUTOPROTOCOL_UNIT_REGISTRY_CACHE"
+            },
+            "snapshot": dict(os.environ, AUTOPROTOCOL_UNIT_REGISTRY_CACHE=cache_dir),
+        }
+        # writes the snapshot
+        import_times(modes["snapshot"])
+
+        print(f"{'module':<26}" + "".join(f"{mode:>12}" for mode in modes))
+        medians = defaultdict(dict)
+        for mode, env in modes.items():
+            samples = defaultdict(list)
+            for _ in range(runs):
+                for module, time in import_times(env).items():
+                    samples[module].append(time)
+            for module in MODULES:
+                medians[module][mode] = statistics.median(samples[module])
+        for module in MODULES:
+            print(
+                f"{module:<26}"
+                + "".join(f"{medians[module][mode]:>12.0f}" for mode in modes)
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    run(parser.parse_args().runs)
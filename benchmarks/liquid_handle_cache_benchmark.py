@@ -0,0 +1,146 @@
+"""
+Benchmarks the caches of LiquidHandleMethods, see TransportsCache and
+TransportTemplate, against generating the transports and tip decisions of
+every well, for transfers of a 384-well plate with the default and a
+calibrated LiquidClass.
+
+Usage (with autoprotocol installed, e.g. `pip install -e .`):
+
+    python benchmarks/liquid_handle_cache_benchmark.py [--number N]
+"""
+import argparse
+import timeit
+
+from autoprotocol.instruction import LiquidHandle
+from autoprotocol.liquid_handle import Transfer
+from autoprotocol.liquid_handle.liquid_class import (
+    LiquidClass,
+    VolumeCalibration,
+    VolumeCalibrationBin,
+)
+from autoprotocol.liquid_handle.liquid_handle_method import (
+    TIP_TYPES_CACHE,
+    TRANSPORT_TEMPLATES,
+    TRANSPORTS_CACHE,
+)
+from autoprotocol.protocol import Protocol
+from autoprotocol.unit import Unit
+
+
+CACHES = [TRANSPORTS_CACHE, TRANSPORT_TEMPLATES, TIP_TYPES_CACHE]
+
+
+def calibrated_liquid():
+    """A LiquidClass calibrated in 10 bins for each of the generic tips"""
+    tip_types = ["generic_1_50", "generic_1_1000", "generic_96_180"]
+
+    def curve(point):
+        return VolumeCalibration(
+            *[(Unit(5 * 2**_, "uL"), point(_)) for _ in range(10)]
+        )
+
+    liquid = LiquidClass()
+    liquid.volume_calibration_curve = {
+        _: curve(lambda i: VolumeCalibrationBin(1.05, Unit(0.1 * i, "uL")))
+        for _ in tip_types
+    }
+    liquid.aspirate_flowrate_calibration_curve = {
+        _: curve(lambda i: LiquidHandle.builders.flowrate(target=Unit(10 + i, "uL/s")))
+        for _ in tip_types
+    }
+    liquid.dispense_flowrate_calibration_curve = {
+        _: curve(lambda i: LiquidHandle.builders.flowrate(target=Unit(20 + i, "uL/s")))
+        for _ in tip_types
+    }
+    return liquid
+
+
+LIQUIDS = {"default": LiquidClass, "calibrated": calibrated_liquid}
+
+
+def entry_points(liquid):
+    """Generates the transports of 384 single well transfers"""
+    # pragma pylint: disable=protected-access
+    method = Transfer(tip_type="generic_1_50")
+    method._shape = LiquidHandle.builders.shape()
+    method._source_liquid = liquid()
+    method._destination_liquid = liquid()
+    for _ in range(384):
+        method._aspirate_transports(Unit(5, "uL"), None)
+        method._dispense_transports(Unit(5, "uL"), None)
+
+
+def compiled_transports(liquid):
+    """Generates the transports of 384 single well transfers of distinct
+    volumes, which share TransportTemplates"""
+    # pragma pylint: disable=protected-access
+    method = Transfer(tip_type="generic_1_50")
+    method._shape = LiquidHandle.builders.shape()
+    method._source_liquid = liquid()
+    method._destination_liquid = liquid()
+    for well in range(384):
+        volume = Unit(5 + well / 100, "uL")
+        method._compiled_transports("_aspirate_transports", volume, None)
+        method._compiled_transports("_dispense_transports", volume, None)
+
+
+def tip_decisions(liquid):
+    """Decides the tip capacity and tip type of 384 single well transfers"""
+    # pragma pylint: disable=protected-access
+    method = Transfer()
+    method._shape = LiquidHandle.builders.shape()
+    method._source_liquid = liquid()
+    method._destination_liquid = liquid()
+    for _ in range(384):
+        method._tip_capacity()
+        method._rec_tip_type(Unit(5, "uL"))
+
+
+def transfer(liquid):
+    """Transfers into every well of a 384-well plate"""
+    protocol = Protocol()
+    source = protocol.ref("source", cont_type="384-flat", discard=True)
+    destination = protocol.ref("destination", cont_type="384-flat", discard=True)
+    source.all_wells().set_volume("50:microliter")
+    protocol.transfer(
+        source.all_wells(),
+        destination.all_wells(),
+        "5:microliter",
+        method=Transfer(tip_type="generic_1_50"),
+        source_liquid=liquid(),
+        destination_liquid=liquid(),
+    )
+
+
+WORKLOADS = {
+    "entry points": entry_points,
+    "compiled transports": compiled_transports,
+    "tip decisions": tip_decisions,
+    "Protocol.transfer": transfer,
+}
+
+
+def run(number):
+    print(f"{'workload':<34}{'uncached (s)':>14}{'cached (s)':>12}{'speedup':>10}")
+    for name, workload in WORKLOADS.items():
+        for liquid_name, liquid in LIQUIDS.items():
+            timings = {}
+            for enabled in (False, True):
+                for cache in CACHES:
+                    cache.clear()
+                    cache.enabled = enabled
+                timings[enabled] = timeit.timeit(
+                    lambda workload=workload, liquid=liquid: workload(liquid),
+                    number=number,
+                )
+            uncached, cached = timings[False], timings[True]
+            print(
+                f"{name + ' ' + liquid_name:<34}{uncached:>14.4f}{cached:>12.4f}"
+                f"{uncached / cached:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5)
+    run(parser.parse_args().number)
@@ -0,0 +1,89 @@
+"""
+Benchmarks the single-pass removal of empty fields against the previous
+recursive implementation, which Instruction applied twice, on the payloads of
+LiquidHandle instructions generated by Protocol.transfer.
+
+Usage (with autoprotocol installed, e.g. `pip install -e .`):
+
+    python benchmarks/remove_empty_fields_benchmark.py [--number N]
+"""
+import argparse
+import timeit
+
+from autoprotocol import instruction
+from autoprotocol.protocol import Protocol
+from autoprotocol.unit import Unit
+from autoprotocol.util import _remove_empty_fields
+
+
+def legacy_remove_empty_fields(data):
+    """The previous implementation of Instruction._remove_empty_fields"""
+
+    def filter_criteria(item):
+        if isinstance(item, Unit):
+            return False
+        return item is None or item == [] or item == {}
+
+    if isinstance(data, dict):
+        return {
+            k: legacy_remove_empty_fields(v)
+            for k, v in data.items()
+            if not filter_criteria(v)
+        }
+    if isinstance(data, list):
+        return [legacy_remove_empty_fields(_) for _ in data if not filter_criteria(_)]
+    return data
+
+
+def liquid_handle_payloads():
+    """Records the data that LiquidHandle instructions are created with"""
+    # pragma pylint: disable=protected-access
+    payloads = []
+
+    def recording_remove_empty_fields(data, passes=1):
+        if isinstance(data, dict) and "locations" in data:
+            payloads.append(data)
+        return _remove_empty_fields(data, passes)
+
+    instruction._remove_empty_fields = recording_remove_empty_fields
+    try:
+        protocol = Protocol()
+        source = protocol.ref("source", cont_type="384-flat", discard=True)
+        destination = protocol.ref("destination", cont_type="96-flat", discard=True)
+        protocol.transfer(
+            source.wells_from(0, 24), destination.wells_from(0, 24), "5:microliter"
+        )
+        protocol.transfer(
+            source.well(0), destination.well(0), "5:microliter", rows=8, columns=12
+        )
+        protocol.mix(destination.wells_from(0, 12), "10:microliter")
+    finally:
+        instruction._remove_empty_fields = _remove_empty_fields
+    return payloads
+
+
+def run(number):
+    payloads = liquid_handle_payloads()
+    for payload in payloads:
+        assert _remove_empty_fields(payload, passes=2) == legacy_remove_empty_fields(
+            legacy_remove_empty_fields(payload)
+        )
+
+    legacy = timeit.timeit(
+        lambda: [
+            legacy_remove_empty_fields(legacy_remove_empty_fields(_)) for _ in payloads
+        ],
+        number=number,
+    )
+    single_pass = timeit.timeit(
+        lambda: [_remove_empty_fields(_, passes=2) for _ in payloads], number=number
+    )
+    print(f"{len(payloads)} LiquidHandle payloads, {number} repetitions")
+    print(f"{'legacy (s)':>12}{'single pass (s)':>18}{'speedup':>10}")
+    print(f"{legacy:>12.4f}{single_pass:>18.4f}{legacy / single_pass:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100)
+    run(parser.parse_args().number)
@@ -0,0 +1,51 @@
+"""
+Benchmarks Unit conversions with and without the precomputed conversion table.
+
+Usage (with autoprotocol installed, e.g. `pip install -e .`):
+
+    python benchmarks/unit_conversion_benchmark.py [--number N]
+"""
+import argparse
+import timeit
+
+from autoprotocol.unit import CONVERSION_TABLE, Unit
+
+
+WORKLOADS = {
+    "volume ul->nl": ("5:microliter", "nanoliter"),
+    "volume ml->ul": ("1.5:milliliter", "ul"),
+    "time minute->s": ("20:minute", "second"),
+    "flow ul/s->ml/min": ("100:microliter/second", "milliliter/minute"),
+    "temperature celsius->kelvin": ("37:celsius", "kelvin"),
+    "acceleration g->mm/s/s": ("1:standard_gravity", "mm/s/s"),
+}
+
+
+def run(number):
+    print(f"{'workload':<30}{'registry (s)':>14}{'table (s)':>12}{'speedup':>10}")
+    for name, (source, target) in WORKLOADS.items():
+        unit = Unit(source)
+        timings = {}
+        for enabled in (False, True):
+            CONVERSION_TABLE.enabled = enabled
+            try:
+                unit.to(target)
+            except TypeError:
+                # offset units can't be converted with Decimals by the registry
+                timings[enabled] = None
+                continue
+            timings[enabled] = timeit.timeit(
+                lambda unit=unit, target=target: unit.to(target), number=number
+            )
+        registry, table = timings[False], timings[True]
+        if registry is None:
+            print(f"{name:<30}{'n/a':>14}{table:>12.4f}{'':>10}")
+        else:
+            print(f"{name:<30}{registry:>14.4f}{table:>12.4f}{registry / table:>9.1f}x")
+    CONVERSION_TABLE.enabled = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    run(parser.parse_args().number)
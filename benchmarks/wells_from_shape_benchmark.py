@@ -0,0 +1,60 @@
+"""
+Benchmarks Container.wells_from_shape with and without the cached well index
+tables on 96-, 384- and 1536-well plates.
+
+Usage (with autoprotocol installed, e.g. `pip install -e .`):
+
+    python benchmarks/wells_from_shape_benchmark.py [--number N]
+"""
+import argparse
+import timeit
+
+from autoprotocol import container
+from autoprotocol.protocol import Protocol
+
+
+WORKLOADS = {
+    "96-flat SBS96 8x12": ("96-flat", 0, dict(rows=8, columns=12)),
+    "96-flat SBS96 8x1": ("96-flat", 5, dict(rows=8)),
+    "384-flat SBS96 8x12": ("384-flat", 25, dict(rows=8, columns=12)),
+    "384-flat SBS384 16x24": (
+        "384-flat",
+        0,
+        dict(rows=16, columns=24, format="SBS384"),
+    ),
+    "1536 SBS96 8x12": ("1536-echo-ldv-beckman-001-6969", 0, dict(rows=8, columns=12)),
+    "1536 SBS384 16x1": (
+        "1536-echo-ldv-beckman-001-6969",
+        3,
+        dict(rows=16, format="SBS384"),
+    ),
+}
+
+
+def run(number):
+    protocol = Protocol()
+    print(f"{'workload':<26}{'uncached (s)':>14}{'cached (s)':>12}{'speedup':>10}")
+    for name, (cont_type, origin, shape) in WORKLOADS.items():
+        plate = protocol.ref(name, cont_type=cont_type, discard=True)
+
+        def uncached(plate=plate, origin=origin, shape=shape):
+            container.clear_shape_indices()
+            plate.wells_from_shape(origin, shape)
+
+        uncached_time = timeit.timeit(uncached, number=number)
+        cached_time = timeit.timeit(
+            lambda plate=plate, origin=origin, shape=shape: plate.wells_from_shape(
+                origin, shape
+            ),
+            number=number,
+        )
+        print(
+            f"{name:<26}{uncached_time:>14.4f}{cached_time:>12.4f}"
+            f"{uncached_time / cached_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    run(parser.parse_args().number)
@@ -1,10 +1,17 @@
 # pragma pylint: disable=missing-docstring,protected-access
 # pragma pylint: disable=attribute-defined-outside-init,no-self-use
+import copy
 import warnings
 
 import pytest
 
-from autoprotocol.container import Container, Well, WellGroup
+from autoprotocol.container import (
+    _SHAPE_INDICES,
+    Container,
+    Well,
+    WellGroup,
+    clear_shape_indices,
+)
 from autoprotocol.instruction import Instruction
 from autoprotocol.unit import Unit
 
@@ -31,6 +38,16 @@ class TestContainerWellRef(HasDummyContainers):
     def test_well_identity(self):
         assert self.c.well("A1") is self.c.well(0)
 
+    def test_wells_are_created_on_access(self):
+        container = Container(None, "96-pcr")
+        assert container._materialized_wells() == []
+        well = container.well("B1")
+        assert container._materialized_wells() == [well]
+        assert container.all_wells()[12] is well
+        assert container.all_wells(columnwise=True)[1] is well
+        assert container.wells_from_shape(0, {"rows": 8, "columns": 12})[12] is well
+        assert len(container._materialized_wells()) == 96
+
     def test_humanize(self):
         assert "A1" == self.c.well(0).humanize()
         assert "B3" == self.c.well(7).humanize()
@@ -202,6 +219,55 @@ class TestWellVolume(HasDummyContainers):
         with pytest.raises(ValueError):
             self.c.well(2).set_volume("1:milliliter")
 
+    def test_set_volume_through_container(self):
+        self.c.set_volume("30:microliter")
+        assert self.c._materialized_wells() == []
+        assert self.c.well(14).volume == Unit(30, "microliter")
+        assert self.c.total_volume() == Unit(450, "microliter")
+        with pytest.raises(ValueError):
+            self.c.set_volume("1:milliliter")
+        with pytest.raises(TypeError):
+            self.c.set_volume(30)
+
+    def test_total_volume(self):
+        assert self.c.total_volume() == Unit(0, "microliter")
+        self.c.well(0).set_volume("20:microliter")
+        self.c.well(3).set_volume("0.1:milliliter")
+        self.c.well(3).volume -= Unit(5, "microliter")
+        assert self.c.total_volume() == Unit(115, "microliter")
+        assert str(self.c.total_volume()) == "115:microliter"
+
+    def test_wells_below_dead_volume(self):
+        assert self.c.wells_below_dead_volume().wells == []
+        self.c.wells(0, 1, 2).set_volume("10:microliter")
+        self.c.well(1).set_volume("15:microliter")
+        assert [w.index for w in self.c.wells_below_dead_volume()] == [0, 2]
+
+    def test_volume_and_mass_are_stored_by_container(self):
+        well = self.c.well(0).set_volume("20:microliter").set_mass("1:mg")
+        well.volume = None
+        assert self.c.well(0).volume is None
+        assert self.c.well(0).mass == Unit(1, "milligram")
+        assert self.c2._well_store is None
+        assert Well(self.c2, 1, volume=Unit(5, "microliter")).volume == Unit(
+            5, "microliter"
+        )
+
+    def test_copies_keep_their_own_volume(self):
+        well = self.c.well(0).set_volume("20:microliter")
+        constructed = Well(self.c, 0, volume=Unit(5, "microliter"))
+        copied = copy.copy(well)
+        deep_copied = copy.deepcopy(well)
+        assert copied.volume == deep_copied.volume == Unit(20, "microliter")
+
+        constructed.set_volume("10:microliter")
+        copied.set_volume("15:microliter")
+        deep_copied.set_volume("25:microliter")
+        assert well.volume == Unit(20, "microliter")
+        assert constructed.volume == Unit(10, "microliter")
+        assert copied.volume == Unit(15, "microliter")
+        assert Well(self.c, 1).volume is None
+
     def test_default_true_max_vol(self, dummy_384, dummy_tube):
         assert (
             dummy_tube.container_type.true_max_vol_ul
@@ -291,6 +357,77 @@ class TestWellGroupList(HasDummyContainers):
             prop_and_val = both_ws.wells_with("property1", val2)
             assert prop_and_val == ws2
 
+    def test_wells_with_property_index(self):
+        self.c.wells(0, 1).set_properties({"sample": {"id": [1, 2]}})
+        self.c.well(2).set_properties({"sample": {"id": [1, 2.0]}})
+        self.c.well(3).set_properties({"sample": {"id": (1, 2)}})
+        self.c.well(4).set_properties({"other": True})
+        assert self.c.wells_with("sample") == self.c.wells(0, 1, 2, 3)
+        assert self.c.wells_with("sample", {"id": [1, 2]}) == self.c.wells(0, 1, 2)
+
+        # the index follows changes to the properties
+        self.c.well(0).set_properties({"other": 1})
+        self.c.well(1).properties["sample"]["id"].append(3)
+        self.c.wells(4, 5).add_properties({"sample": {"id": [1, 2]}})
+        assert self.c.wells_with("sample", {"id": [1, 2]}) == self.c.wells(2, 4, 5)
+        assert self.c.wells_with("other", 1) == self.c.wells(0, 4)
+
+        # unhashable values are compared against every well with the key
+        self.c.well(6).properties["sample"] = {"id": {1, 2}}
+        assert self.c.wells_with("sample", {"id": {1, 2}}) == self.c.wells(6)
+
+        # the wells of a WellGroup are returned in its order
+        ws = self.c.wells(5, 3, 2, 7)
+        assert ws.wells_with("sample", {"id": [1, 2]}) == self.c.wells(5, 2)
+
+        # and their current properties are compared, even if they were
+        # mutated through a reference that was kept across queries
+        properties = self.c.well(7).properties
+        assert ws.wells_with("replicate") == WellGroup([])
+        properties["replicate"] = 1
+        assert ws.wells_with("replicate", 1) == self.c.wells(7)
+        with pytest.raises(TypeError):
+            self.c.wells_with(1)
+
+    def test_wells_with_mutated_properties(self):
+        self.c.wells(0, 1, 2).set_properties({"k": "v"})
+        self.c.well(2).properties["ids"] = [1]
+        assert self.c.wells_with("k", "v") == self.c.wells(0, 1, 2)
+
+        # mutations through references kept across queries are seen
+        deleted = self.c.well(0).properties
+        added = self.c.well(3).properties
+        changed = self.c.well(1).properties
+        assert self.c.wells_with("k") == self.c.wells(0, 1, 2)
+        del deleted["k"]
+        added.update(k="v")
+        changed["k"] = "w"
+        assert self.c.wells_with("k") == self.c.wells(1, 2, 3)
+        assert self.c.wells_with("k", "v") == self.c.wells(2, 3)
+        assert self.c.wells_with("k", "w") == self.c.wells(1)
+        changed.clear()
+        assert self.c.wells_with("k") == self.c.wells(2, 3)
+
+        # as are values mutated in place
+        ids = self.c.well(2).properties["ids"]
+        assert self.c.wells_with("ids", [1, 2]) == WellGroup([])
+        ids.append(2)
+        assert self.c.wells_with("ids", [1, 2]) == self.c.wells(2)
+
+        # and dictionaries that were assigned directly
+        properties = {}
+        self.c.well(4).properties = properties
+        assert self.c.wells_with("k", "v") == self.c.wells(2, 3)
+        properties["k"] = "v"
+        assert self.c.wells_with("k", "v") == self.c.wells(2, 3, 4)
+        assert self.c.well(4).properties is properties
+
+        # copies of the properties aren't tied to their well
+        copied = copy.deepcopy(self.c.well(2).properties)
+        assert type(copied) is dict
+        copied["k"] = "w"
+        assert self.c.wells_with("k", "v") == self.c.wells(2, 3, 4)
+
     def test_pop(self):
         ws = self.c.wells_from("A1", 3)
         assert ws[0] == ws.pop(0)
@@ -310,6 +447,55 @@ class TestWellGroupList(HasDummyContainers):
         assert ws[-1] == insert_wells[2]
         assert len(ws) == 5
 
+        # inserting doesn't change lists of wells shared with the WellGroup
+        wells = [self.c.well("A1"), self.c.well("A2")]
+        group = WellGroup(wells)
+        copied = WellGroup(group)
+        copied.insert(0, self.c.well("B1"))
+        assert wells == [self.c.well("A1"), self.c.well("A2")]
+        assert len(group) == 2
+        assert copied.index(self.c.well("A2")) == 2
+
+    def test_index_and_membership(self):
+        ws = self.c.wells_from("A1", 3)
+        a1, a2, a3 = ws
+        assert a2 in ws and ws.index(a3) == 2
+        assert self.c.well("B1") not in ws
+        with pytest.raises(ValueError):
+            ws.index(self.c.well("B1"))
+
+        # the index follows mutations of the WellGroup
+        ws.append(self.c.well("B1"))
+        ws.extend([a1, self.c.well("B2")])
+        assert ws.index(self.c.well("B1")) == 3
+        assert ws.index(a1) == 0
+        assert ws.index(self.c.well("B2")) == 5
+        ws.insert(0, self.c.well("C1"))
+        assert ws.index(a1) == 1
+        ws[1] = self.c.well("C2")
+        assert ws.index(a1) == 5
+        ws.pop(0)
+        assert ws.index(self.c.well("C2")) == 0
+
+        # and mutations of its list of wells
+        ws.wells.remove(self.c.well("C2"))
+        assert ws.index(a1) == 3
+        shared = WellGroup(ws)
+        shared.append(self.c.well("C3"))
+        assert self.c.well("C3") in ws
+
+        copied = copy.deepcopy(ws)
+        assert copied.index(copied[2]) == 2
+        assert ws[2] not in copied
+
+    def test_add(self):
+        ws = self.c.wells_from("A1", 2) + self.c.well("B1")
+        assert ws == self.c.wells(0, 1, 5)
+        ws = ws + self.c.wells(6, 7)
+        assert ws.index(self.c.well(7)) == 4
+        with pytest.raises(TypeError):
+            ws + [self.c.well(8)]  # pylint: disable=expression-not-assigned
+
 
 class TestWellGroupEquality(HasDummyContainers):
     def test_equality(self):
@@ -425,6 +611,19 @@ class TestAsShapeOrigin(HasDummyContainers):
         with pytest.raises(ValueError):
             dummy_96.wells_from_shape(12, SHAPE(rows=8))
 
+    def test_caches_well_indices(self, dummy_96):
+        dummy_96.wells_from_shape("B1", SHAPE(rows=4, columns=2))
+        key = (96, 12, 12, 4, 2, "SBS96")
+        assert list(_SHAPE_INDICES[key]) == [12, 13, 24, 25, 36, 37, 48, 49]
+        assert dummy_96.wells_from_shape(12, SHAPE(rows=4, columns=2)) == (
+            dummy_96.wells([12, 13, 24, 25, 36, 37, 48, 49])
+        )
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                dummy_96.wells_from_shape(12, SHAPE(rows=8))
+        clear_shape_indices()
+        assert key not in _SHAPE_INDICES
+
     def test_fails_out_of_range_sbs384(self, dummy_384):
         with pytest.raises(ValueError):
             dummy_384.wells_from_shape(3, SHAPE(rows=8, columns=12))
@@ -1,5 +1,7 @@
 import pytest
 
+from autoprotocol.container_type import ContainerType, _well_index_table
+
 
 class TestContainerRobotize(object):
     def test_robotize_decompose(self, dummy_type):
@@ -76,6 +78,27 @@ class TestContainerRobotize(object):
         with pytest.raises(ValueError):
             dummy_type.humanize("A1")
 
+    def test_index_table_matches_parsing(self, dummy_type, dummy_1536):
+        # dummy_1536 is a Container, which delegates to its ContainerType
+        for subject in [dummy_type, dummy_1536]:
+            container_type = getattr(subject, "container_type", subject)
+            args = container_type.well_count, container_type.col_count
+            assert _well_index_table(*args) is _well_index_table(*args)
+            for idx in range(container_type.well_count):
+                # pragma pylint: disable=protected-access
+                name = ContainerType._format_well_ref(idx, *args)
+                assert subject.humanize(idx) == name
+                assert subject.humanize(str(idx)) == name
+                assert subject.robotize(name) == idx
+                assert subject.robotize(name.lower()) == idx
+                assert subject.decompose(name) == divmod(idx, args[1])
+        assert dummy_type.robotize(["A01", "b1", 2]) == [0, 5, 2]
+        assert dummy_type.humanize(["04", 5]) == ["A5", "B1"]
+        with pytest.raises(ValueError):
+            dummy_type.robotize(["A1", "A6"])
+        with pytest.raises(TypeError):
+            dummy_type.robotize(["A1", None])
+
 
 class TestAllContainerTypes(object):
     def test_all_container_types(self):
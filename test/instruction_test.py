@@ -130,6 +130,26 @@ class TestBaseInstruction(object):
         wells = set(cont1.all_wells().wells + cont2.all_wells().wells)
         assert set(inst.get_wells(example_data)) == wells
 
+    def test_get_wells_order_and_index(self):
+        p = Protocol()
+        cont1 = p.ref("cont1", None, "6-flat", discard=True)
+        cont2 = p.ref("cont2", None, "6-flat", discard=True)
+        data = {
+            "a": [cont1.well(3), {"b": cont1.well(1)}],
+            "c": WellGroup([cont1.well(3), cont2.well(0)]),
+            "d": [cont1.well(1), cont1.well(0)],
+        }
+        inst = Instruction(op="test", data=data)
+        expected = [cont1.well(3), cont1.well(1), cont2.well(0), cont1.well(0)]
+        assert inst.get_wells(inst.data) == expected
+        assert inst.get_wells(data) == expected
+
+        # the wells are looked up in the current data
+        inst.data["e"] = cont2.well(5)
+        assert inst.get_wells(inst.data) == expected + [cont2.well(5)]
+        inst.data["d"].append(cont2.well(4))
+        assert inst.get_wells(inst.data) == expected + [cont2.well(4), cont2.well(5)]
+
     def test_info_wells_checker(self):
         p = Protocol()
         cont1 = p.ref("cont1", None, "6-flat", discard=True)
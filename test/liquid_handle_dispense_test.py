@@ -10,7 +10,7 @@ from autoprotocol import Container, ContainerType, Protocol, Well, WellGroup
 from autoprotocol.instruction import LiquidHandle
 from autoprotocol.liquid_handle.dispense import Dispense as DispenseMethod
 from autoprotocol.liquid_handle.liquid_class import LiquidClass
-from autoprotocol.unit import Unit
+from autoprotocol.unit import Unit, UnitList
 
 
 class ProteinBuffer(LiquidClass):
@@ -141,6 +141,17 @@ class TestLiquidHandleUserConfig(LiquidHandleTester):
                     source=source, destination=destination, volume=test_input_type
                 )
 
+    def test_unit_array_volumes(self):
+        volumes = ["5:ul", "0.01:ml", "15:ul"]
+        for volume in ([[Unit(_) for _ in volumes]], [UnitList(volumes)]):
+            self.protocol.liquid_handle_dispense(
+                source=self.src_tube_1,
+                destination=self.flat.wells(0, 1, 2),
+                volume=volume,
+            )
+        from_list, from_array = self.protocol.instructions
+        assert from_array.data == from_list.data
+
     def test_liquid_class_configuration(self):
         test_input_types = [
             (does_not_raise(), LiquidClass()),
@@ -4,7 +4,7 @@ import pytest
 
 from autoprotocol.liquid_handle import DryWellTransfer, Mix
 from autoprotocol.protocol import Protocol
-from autoprotocol.unit import Unit
+from autoprotocol.unit import Unit, UnitList
 
 
 class LiquidHandleTester(object):
@@ -96,6 +96,11 @@ class TestLiquidClassTransfer(LiquidHandleTester):
             == num_wells * transfers_per_well * transports_per_transfer
         )
 
+    def test_accepts_unit_array_volumes(self):
+        volume = UnitList([5, 10, 15], "microliter")
+        self.p.transfer(self.flat.wells(0, 1, 2), self.deep.wells(0, 1, 2), volume)
+        assert [w.volume for w in self.deep.wells(0, 1, 2)] == list(volume)
+
     def test_generates_liquid_handle_with_density(self):
         self.p.transfer(
             self.flat.well(0), self.flat.well(0), "1:uL", density=Unit(1.1, "mg/ml")
@@ -177,6 +182,116 @@ class TestLiquidClassTransferMultiChannel(LiquidHandleTester):
             )
 
 
+class TestStampTransfers(LiquidHandleTester):
+    def test_stamps_column_transfers(self):
+        source_wells = self.flat.wells_from(0, 8, columnwise=True)
+        destination_wells = self.deep.wells_from(1, 8, columnwise=True)
+
+        self.p.transfer(source_wells, destination_wells, "20:uL", stamp=True)
+        assert len(self.p.instructions) == 1
+        assert self.p.instructions[0].shape == {
+            "rows": 8,
+            "columns": 1,
+            "format": "SBS96",
+        }
+        assert all(_.volume == Unit(20, "uL") for _ in destination_wells)
+
+    def test_stamps_full_plate_transfers(self):
+        self.p.transfer(
+            self.flat.all_wells(), self.deep.all_wells(), "20:uL", stamp=True
+        )
+        assert len(self.p.instructions) == 1
+        assert self.p.instructions[0].shape == {
+            "rows": 8,
+            "columns": 12,
+            "format": "SBS96",
+        }
+
+    def test_keeps_unstampable_transfers(self):
+        self.p.transfer(
+            self.flat.wells_from(0, 9, columnwise=True),
+            self.deep.wells_from(0, 9, columnwise=True),
+            "20:uL",
+            stamp=True,
+        )
+        assert [_.shape["rows"] for _ in self.p.instructions] == [8, 1]
+
+    def test_doesnt_stamp_overlapping_wells(self):
+        self.p.transfer(
+            self.flat.wells_from(0, 8, columnwise=True),
+            self.flat.wells_from(0, 8, columnwise=True),
+            "20:uL",
+            stamp=True,
+        )
+        assert len(self.p.instructions) == 8
+
+    def test_doesnt_stamp_different_volumes(self):
+        self.p.transfer(
+            self.flat.wells_from(0, 8, columnwise=True),
+            self.deep.wells_from(0, 8, columnwise=True),
+            ["20:uL"] * 7 + ["10:uL"],
+            stamp=True,
+        )
+        assert len(self.p.instructions) == 8
+
+    def test_stamps_previous_transfers(self):
+        for index in range(8):
+            self.p.transfer(
+                self.flat.well(index * 12),
+                self.deep.well(index * 12),
+                "20:uL",
+                stamp=True,
+            )
+        assert len(self.p.instructions) == 8
+
+        stamps = self.p.stamp_transfers()
+        assert self.p.instructions == stamps
+        assert self.p.instructions[0].shape["rows"] == 8
+        assert self.deep.well(84).volume == Unit(20, "uL")
+
+    def test_doesnt_stamp_unrequested_transfers(self):
+        for index in range(8):
+            self.p.transfer(
+                self.flat.well(index * 12), self.deep.well(index * 12), "20:uL"
+            )
+
+        assert self.p.stamp_transfers() == []
+        assert len(self.p.instructions) == 8
+        assert "_single_transfers" not in repr(self.p)
+
+    def test_doesnt_stamp_across_other_instructions(self):
+        self.p.transfer(self.flat.well(0), self.deep.well(0), "20:uL", stamp=True)
+        self.p.cover(self.deep)
+        self.p.transfer(
+            self.flat.wells_from(12, 7, columnwise=True),
+            self.deep.wells_from(12, 7, columnwise=True),
+            "20:uL",
+            stamp=True,
+        )
+        instructions = list(self.p.instructions)
+
+        assert self.p.stamp_transfers() == []
+        assert self.p.instructions == instructions
+
+    def test_doesnt_stamp_time_constrained_transfers(self):
+        for index in range(8):
+            self.p.transfer(
+                self.flat.well(index * 12),
+                self.deep.well(index * 12),
+                "20:uL",
+                stamp=True,
+            )
+        index = self.p.get_instruction_index()
+        self.p.add_time_constraint(
+            {"mark": index, "state": "end"},
+            {"mark": self.flat, "state": "start"},
+            less_than="1:minute",
+        )
+
+        assert self.p.stamp_transfers() == []
+        assert len(self.p.instructions) == 8
+
+
 class TestLiquidClassMix(LiquidHandleTester):
     def test_produces_liquid_handle(self):
         self.p.mix(self.flat.well(0), "20:uL")
@@ -188,6 +303,13 @@ class TestLiquidClassMix(LiquidHandleTester):
         self.p.mix(self.flat.well(0).set_volume(well_volume), "20:uL")
         assert self.flat.well(0).volume == well_volume
 
+    def test_accepts_unit_array_volumes(self):
+        self.p.mix(self.flat.wells(0, 1), UnitList(["10:uL", "0.02:mL"]))
+        self.p.mix(self.flat.wells(0, 1), ["10:uL", "20:uL"])
+        transports = [_.locations[0]["transports"] for _ in self.p.instructions]
+        assert len(transports) == 4
+        assert transports[:2] == transports[2:]
+
     def test_generates_correct_number_of_transports(self):
         self.p.mix(self.flat.well(0), "20:uL")
         assert len(self.p.instructions[0].locations[0]["transports"]) == 6 + 10 * 2
@@ -10,6 +10,12 @@ from autoprotocol.liquid_handle.liquid_class import (
     VolumeCalibration,
     VolumeCalibrationBin,
 )
+from autoprotocol.liquid_handle.liquid_handle_method import (
+    TIP_TYPES_CACHE,
+    TRANSPORT_TEMPLATES,
+    TRANSPORTS_CACHE,
+    _fingerprint,
+)
 from autoprotocol.liquid_handle.tip_type import TipType
 from autoprotocol.unit import Unit
 
@@ -56,6 +62,27 @@ class TestLiquidClass(LiquidClassTester):
         with pytest.raises(RuntimeError):
             curve.binned_calibration_for_volume("7.0:uL")
 
+    def test_calibration_curve_bins_values_in_other_units(self):
+        curve = VolumeCalibration(
+            ("0.005:mL", self.vol_bin_5), ("1000:nL", self.vol_bin_1)
+        )
+        assert curve.binned_calibration_for_volume("1:uL") == self.vol_bin_1
+        assert curve.binned_calibration_for_volume("0.000002:L") == self.vol_bin_5
+        with pytest.raises(TypeError):
+            curve.binned_calibration_for_volume("1:second")
+
+    def test_calibration_curve_bins_many_values(self):
+        curve = self.vol_calibration_curve
+        volumes = ["0.5:uL", Unit(1, "uL"), Unit(1.5, "uL"), "5:uL"]
+        assert curve.binned_calibrations_for_volumes(volumes) == [
+            self.vol_bin_1,
+            self.vol_bin_1,
+            self.vol_bin_5,
+            self.vol_bin_5,
+        ]
+        with pytest.raises(RuntimeError):
+            curve.binned_calibrations_for_volumes(["1:uL", "7:uL"])
+
     def test_liquid_class_volume_calibration(self):
         assert self.lc._get_calibrated_volume(Unit(1, "ul"), self.tip_type) == Unit(
             6, "ul"
@@ -146,6 +173,36 @@ class TestLiquidHandleMethod(LiquidHandleMethodTester):
 
         assert self.lhm._get_sorted_tip_types() == tip_types[::-1]
 
+    def test_cached_sorted_tip_types(self):
+        class VendorMethod(LiquidHandleMethod):  # pylint: disable=abstract-method
+            def _get_tip_types(self):
+                return [
+                    TipType("vendor_1_200", Unit("200:ul")),
+                    TipType("vendor_1_20", Unit("20:ul")),
+                ]
+
+        def names():
+            return [_.name for _ in method._get_sorted_tip_types()]
+
+        TIP_TYPES_CACHE.clear()
+        method = VendorMethod()
+        method._shape = self.single_shape
+        assert names() == ["vendor_1_20", "vendor_1_200"]
+        cached = TIP_TYPES_CACHE.sorted_tip_types(method)
+        assert TIP_TYPES_CACHE.sorted_tip_types(method) is cached
+
+        # monkey patched tip types are picked up
+        VendorMethod._get_tip_types = lambda self: [TipType("vendor_1_50", "50:ul")]
+        assert names() == ["vendor_1_50"]
+
+        # registered tip types take precedence
+        TIP_TYPES_CACHE.register(self.single_shape, [TipType("vendor_1_10", "10:ul")])
+        try:
+            assert names() == ["vendor_1_10"]
+        finally:
+            TIP_TYPES_CACHE.unregister(self.single_shape)
+        assert names() == ["vendor_1_50"]
+
     def test_is_single_channel(self):
         assert self.lhm._is_single_channel() is True
         self.lhm._shape = LiquidHandle.builders.shape(2)
@@ -412,6 +469,141 @@ class TestTransfer(TransferMethodTester):
     def test_has_calibration_with_no_calibration(self):
         assert self.transfer._has_calibration() is False
 
+    def test_memoized_tip_decisions(self):
+        TIP_TYPES_CACHE.clear()
+        capacity = self.transfer._tip_capacity()
+        assert self.transfer._tip_capacity() is capacity
+        assert self.transfer._rec_tip_type(Unit(20, "uL")) == "generic_1_50"
+        assert self.transfer._rec_tip_type(Unit(20, "uL")) == "generic_1_50"
+        assert TIP_TYPES_CACHE.info().hits == 2
+
+        # the decisions follow changes to the method
+        self.transfer.tip_type = "generic_1_50"
+        assert self.transfer._tip_capacity() < capacity
+
+        # and to its tip set
+        self.transfer.tip_type = None
+        TIP_TYPES_CACHE.register(self.single_shape, [TipType("vendor_1_20", "20:ul")])
+        try:
+            assert self.transfer._rec_tip_type(Unit(5, "uL")) == "vendor_1_20"
+        finally:
+            TIP_TYPES_CACHE.unregister(self.single_shape)
+        assert self.transfer._rec_tip_type(Unit(5, "uL")) == "generic_1_50"
+
+    def test_memoized_transports(self):
+        TRANSPORTS_CACHE.clear()
+        transports = self.transfer._aspirate_transports(Unit(5, "uL"), None)
+        assert self.transfer._transports == transports
+
+        # equivalent methods share transports, but not the lists of them
+        other = Transfer()
+        other._shape = LiquidHandle.builders.shape(1, 1, "SBS96")
+        other._source_liquid = LiquidClass()
+        other._destination_liquid = LiquidClass()
+        assert other._aspirate_transports("5:microliter", None) == transports
+        assert other._aspirate_transports(Unit(5, "uL"), None) is not transports
+        assert TRANSPORTS_CACHE.info().hits == 1
+
+        # the transports follow changes to the method and its liquids
+        other._source_liquid.delay_time = Unit(1, "second")
+        assert other._aspirate_transports(Unit(5, "uL"), None) != transports
+        other.prime = False
+        assert other._aspirate_transports(Unit(5, "uL"), None) != transports
+        assert TRANSPORTS_CACHE.info().hits == 1
+
+    def test_cached_fingerprints(self):
+        self.transfer.tip_type = LiquidClassTester.tip_type
+        liquid = self.transfer._source_liquid
+        liquid.volume_calibration_curve = LiquidClassTester.volume_calibration
+        fingerprint = _fingerprint(self.transfer)
+        assert _fingerprint(self.transfer) is fingerprint
+
+        # assigning attributes of the method or its liquids changes it
+        liquid.delay_time = Unit(1, "second")
+        assert _fingerprint(self.transfer) != fingerprint
+        fingerprint = _fingerprint(self.transfer)
+        self.transfer.blowout = False
+        assert _fingerprint(self.transfer) != fingerprint
+
+        # but not the transports the entry points leave on the method
+        fingerprint = _fingerprint(self.transfer)
+        self.transfer._aspirate_transports(Unit(5, "uL"), None)
+        assert _fingerprint(self.transfer) is fingerprint
+
+    def test_fingerprinted_units(self):
+        # Units are serialized with 12 decimal places, but aren't rounded
+        assert _fingerprint(Unit("1.0000000000001:uL")) != _fingerprint(Unit("1:uL"))
+        assert _fingerprint(Unit("1.0:uL")) != _fingerprint(Unit("1:uL"))
+        assert _fingerprint(Unit("1:uL")) != _fingerprint(Unit("1:mL"))
+        assert _fingerprint(Unit("1:uL")) == _fingerprint(Unit(1, "microliter"))
+
+    def test_memoized_transports_of_subclasses(self):
+        class NoPrimeTransfer(Transfer):
+            def default_prime(self, volume):
+                return Unit(0, "uL")
+
+        method = NoPrimeTransfer()
+        method._shape = self.single_shape
+        method._source_liquid = LiquidClass()
+        transports = self.transfer._aspirate_transports(Unit(5, "uL"), None)
+        assert method._aspirate_transports(Unit(5, "uL"), None) != transports
+
+        # hooks can be replaced after transports were memoized
+        NoPrimeTransfer.default_prime = lambda self, volume: Unit(5, "uL")
+        assert method._aspirate_transports(Unit(5, "uL"), None) == transports
+
+        # so can configuration that hooks read from the class
+        NoPrimeTransfer.prime_volume = Unit(5, "uL")
+        NoPrimeTransfer.default_prime = lambda self, volume: self.prime_volume
+        assert method._aspirate_transports(Unit(5, "uL"), None) == transports
+        NoPrimeTransfer.prime_volume = Unit(0, "uL")
+        assert method._aspirate_transports(Unit(5, "uL"), None) != transports
+
+        # and methods can opt out of memoization
+        NoPrimeTransfer._memoize_transports = False
+        TRANSPORTS_CACHE.clear()
+        method._aspirate_transports(Unit(5, "uL"), None)
+        assert TRANSPORTS_CACHE.info().currsize == 0
+
+    def test_compiled_transports(self):
+        TRANSPORT_TEMPLATES.clear()
+        self.transfer.tip_type = LiquidClassTester.tip_type
+        liquid = self.transfer._source_liquid
+        liquid.volume_calibration_curve = LiquidClassTester.volume_calibration
+        liquid.aspirate_flowrate_calibration_curve = (
+            LiquidClassTester.flowrate_calibration
+        )
+
+        # volumes in the same calibration and blowout bins share templates
+        for volume in ["2:uL", "3:uL", "4.5:uL", "4.5:microliter"]:
+            for entry_point in ["_aspirate_transports", "_dispense_transports"]:
+                compiled = self.transfer._compiled_transports(entry_point, volume, None)
+                generated = getattr(self.transfer, entry_point)(volume, None)
+                assert repr(compiled) == repr(generated)
+        assert TRANSPORT_TEMPLATES.info().currsize == 2
+        assert TRANSPORT_TEMPLATES.info().hits == 6
+
+        # other bins compile their own templates
+        compiled = self.transfer._compiled_transports(
+            "_aspirate_transports", "0.5:uL", None
+        )
+        generated = self.transfer._aspirate_transports("0.5:uL", None)
+        assert repr(compiled) == repr(generated)
+        assert TRANSPORT_TEMPLATES.info().currsize == 3
+
+    def test_compiled_transports_of_subclasses(self):
+        class NoPrimeTransfer(Transfer):
+            def default_prime(self, volume):
+                return Unit(0, "uL")
+
+        TRANSPORT_TEMPLATES.clear()
+        method = NoPrimeTransfer()
+        method._shape = self.single_shape
+        method._source_liquid = LiquidClass()
+        transports = method._compiled_transports("_aspirate_transports", "5:uL", None)
+        assert transports == method._aspirate_transports("5:uL", None)
+        assert TRANSPORT_TEMPLATES.info().currsize == 0
+
 
 class MixMethodTester(object):
     single_shape = LiquidHandle.builders.shape(1, 1, "SBS96")
@@ -424,6 +616,13 @@ class MixMethodTester(object):
 
 
 class TestMix(MixMethodTester):
+    def test_compiled_transports(self):
+        TRANSPORT_TEMPLATES.clear()
+        for volume in ["10:uL", "20:uL", "0.03:mL"]:
+            compiled = self.mix._compiled_transports("_mix_transports", volume)
+            assert repr(compiled) == repr(self.mix._mix_transports(volume))
+        assert TRANSPORT_TEMPLATES.info().currsize == 1
+
     def test_calculate_overage_volume(self):
         transfer_vol = Unit(10, "uL")
         expected_overage = transfer_vol * 0.1
@@ -1,5 +1,7 @@
 # pragma pylint: disable=missing-docstring,protected-access
 # pragma pylint: disable=attribute-defined-outside-init
+import io
+import json
 import warnings
 
 import pytest
@@ -28,7 +30,7 @@ from autoprotocol.instruction import (
 from autoprotocol.liquid_handle.dispense import Dispense as DispenseMethod
 from autoprotocol.protocol import ImageExposure, Protocol, Ref
 from autoprotocol.types.protocol import AgitateModeParams, AutopickGroup
-from autoprotocol.unit import Unit, UnitError
+from autoprotocol.unit import Unit, UnitError, UnitList
 
 
 class TestProtocolMultipleExist(object):
@@ -394,6 +396,24 @@ class TestRefify(object):
         assert "randomstring" == p._refify(s)
         assert 24 == p._refify(i)
 
+    def test_refifying_with_ref_index(self):
+        p = Protocol()
+        plate = p.ref("plate", cont_type="96-flat", discard=True)
+        assert p._refify(plate.well(3)) == "plate/3"
+        assert p._refify(plate.well(3)) == "plate/3"
+
+        # refs that are replaced or added without `ref` are still found
+        other = Container(None, plate.container_type, name="other")
+        p.refs["other"] = Ref("other", p.refs.pop("plate").opts, other)
+        assert p._refify(other.well(3)) == "other/3"
+        p.refs["plate"] = Ref("plate", p.refs.pop("other").opts, other)
+        assert p._refify(other.well(3)) == "plate/3"
+        assert p._refify(plate.well(3)) == "None/3"
+
+        p = Protocol(refs={"plate": Ref("plate", p.refs["plate"].opts, plate)})
+        assert p._refify(plate) == "plate"
+        assert p._refify(plate.wells(0, 1)) == ["plate/0", "plate/1"]
+
     # pragma pylint: enable=protected-access
     def test_serialization(self, dummy_protocol):
         expected = {
@@ -448,6 +468,46 @@ class TestRefify(object):
         expected["outs"] = outs
         assert dummy_protocol.as_dict() == expected
 
+    def test_instruction_serialization_isnt_shared(self):
+        p = Protocol()
+        plate = p.ref("plate", cont_type="96-flat", discard=True)
+        p.provision("rs17gmh5wafm5p", plate.well(0), "5:microliter")
+        p.cover(plate)
+        first = p.as_dict()["instructions"]
+        first[0]["to"][0]["volume"] = "1:microliter"
+        assert p.as_dict()["instructions"][0]["to"][0]["volume"] == "5:microliter"
+
+        # edits of instruction data are serialized
+        p.instructions[1].data["lid"] = "universal"
+        assert p.as_dict()["instructions"][1]["lid"] == "universal"
+
+        p.refs["renamed"] = p.refs.pop("plate")
+        instructions = p.as_dict()["instructions"]
+        assert instructions[0]["to"][0]["well"] == "renamed/0"
+        assert instructions[1]["object"] == "renamed"
+
+    def test_streaming_serialization(self, dummy_protocol):
+        p = dummy_protocol
+        buffer = io.StringIO()
+        p.write_json(buffer)
+        assert buffer.getvalue() == json.dumps(p.as_dict())
+
+        plate = p.ref("plate", cont_type="96-flat", storage="cold_4")
+        tube = p.ref("tube", cont_type="micro-1.5", discard=True)
+        plate.well(0).set_name("source").set_properties({"note": "a\nb"})
+        tube.set_properties({"nested": [1, {}, []]})
+        p.transfer(plate.well(0), plate.wells(1, 2), "5:microliter")
+        p.transfer(tube.well(0), plate.well(0), "5:microliter")
+        p.add_time_constraint(
+            {"mark": 0, "state": "end"}, {"mark": 1, "state": "start"}, ideal="5:second"
+        )
+        for indent in [None, 0, 2, "\t"]:
+            expected = json.dumps(p.as_dict(), indent=indent)
+            assert "".join(p.iter_json_chunks(indent=indent)) == expected
+            buffer = io.StringIO()
+            p.write_json(buffer, indent=indent)
+            assert buffer.getvalue() == expected
+
 
 class TestOuts(object):
     def test_outs(self, dummy_protocol):
@@ -463,6 +523,36 @@ class TestOuts(object):
         assert list(p.as_dict()["outs"].values())[0]["0"]["name"] == "test_well"
         assert list(p.as_dict()["outs"].values())[0]["0"]["properties"]["test"] == "foo"
 
+    def test_outs_of_annotated_wells(self, dummy_protocol):
+        p = dummy_protocol
+        plate = p.ref("plate", None, "1536-echo-ldv-beckman-001-6969", discard=True)
+        plate.all_wells()
+        plate.well(5).set_name("named")
+        plate.well(3).properties["key"] = ("value", {1: None})
+        plate.well(3).ctx_properties["ctx"] = "value"
+        plate.well(7).ctx_properties["ctx"] = "value"
+        assert plate._annotated_wells == {3, 5, 7}
+        assert p.as_dict()["outs"] == {
+            "plate": {
+                "3": {
+                    "properties": {"key": ["value", {"1": None}]},
+                    "contextual_custom_properties": {"ctx": "value"},
+                },
+                "5": {"name": "named"},
+            }
+        }
+        # outs are a copy of the well properties
+        assert p.outs["plate"]["3"]["properties"] is not plate.well(3).properties
+
+    def test_outs_exclude_wells_the_container_didnt_create(self, dummy_protocol):
+        p = dummy_protocol
+        plate = p.ref("plate", None, "96-pcr", discard=True)
+        Well(plate, 10).properties["key"] = "value"
+        Well(plate, 5, name="x")
+        plate.well(3).set_name("named")
+        assert plate._annotated_wells == {3}
+        assert p.as_dict()["outs"] == {"plate": {"3": {"name": "named"}}}
+
 
 class TestInstructionIndex(object):
     def test_instruction_index(self, dummy_protocol):
@@ -477,6 +567,23 @@ class TestInstructionIndex(object):
         assert p.get_instruction_index() == 1
 
 
+class TestWellsWith(object):
+    def test_wells_with(self, dummy_protocol):
+        p = dummy_protocol
+        plate_1 = p.ref("plate_1", None, "96-flat", discard=True)
+        plate_2 = p.ref("plate_2", None, "96-flat", discard=True)
+        plate_1.wells(3, 1).set_properties({"condition": "control"})
+        plate_2.well(0).set_properties({"condition": "control"})
+        plate_2.well(1).set_properties({"condition": "treated"})
+
+        controls = p.wells_with("condition", "control")
+        assert controls == plate_1.wells(1, 3) + plate_2.well(0)
+        assert len(p.wells_with("condition")) == 4
+        assert len(p.wells_with("replicate")) == 0
+        with pytest.raises(TypeError):
+            p.wells_with(None)
+
+
 class TestBatchContainers(object):
     def test_batch_containers(self):
         p = Protocol()
@@ -1332,6 +1439,23 @@ class TestAcousticTransfer(object):
         )
         assert len(p.instructions) == 4
 
+    def test_unit_array_volumes(self, dummy_protocol):
+        p = dummy_protocol
+        echo = p.ref("echo", None, "384-echo", discard=True)
+        dest = p.ref("dest", None, "384-flat", discard=True)
+        source = echo.wells(0, 1).set_volume("20:microliter")
+        volume = UnitList(["1:microliter", "25:nanoliter", "0.5:microliter"])
+        p.acoustic_transfer(source, dest.wells(0, 1, 2), volume, one_source=True)
+        assert [w.volume for w in dest.wells(0, 1, 2)] == list(volume)
+        with pytest.raises(RuntimeError):
+            p.acoustic_transfer(
+                source, dest.wells(0, 1), UnitList([1, 1.01], "microliter")
+            )
+        with pytest.raises(RuntimeError):
+            p.acoustic_transfer(
+                source, dest.wells(0, 1), UnitList([20, 20], "microliter"), True
+            )
+
     @pytest.mark.parametrize(
         "source_vol", ["2:microliter", "50:microliter", "17:microliter"]
     )
@@ -3,7 +3,21 @@ from decimal import Decimal
 import pytest
 
 from autoprotocol.types import asdict
-from autoprotocol.unit import Unit, UnitValueError
+from autoprotocol.unit import (
+    CONVERSION_TABLE,
+    FAST_ARITHMETIC,
+    UNIT_CACHE,
+    DecimalUnitRegistry,
+    Unit,
+    UnitCache,
+    UnitList,
+    UnitStringError,
+    UnitUnitsError,
+    UnitValueError,
+    load_registry,
+)
+from autoprotocol.util import parse_unit
+from pint.errors import UndefinedUnitError
 
 
 class TestUnitType(object):
@@ -154,3 +168,247 @@ class TestUnitMath(object):
         assert Unit(2 * 10**24, "yoctosecond").to("second") == Unit(2, "second")
         assert Unit(2 * 10**21, "zeptosecond").to("second") == Unit(2, "second")
         assert Unit(2 * 10**18, "attosecond").to("second") == Unit(2, "second")
+
+
+class TestUnitString(object):
+    def test_cached_string(self):
+        unit = Unit("1:microliter") + Unit("2:microliter")
+        assert str(unit) == "3:microliter"
+        assert str(unit) is str(unit)
+        unit.magnitude = 4
+        assert str(unit) == "4:microliter"
+        assert unit.__str__(ndigits=0) == "4:microliter"
+
+    def test_rounding(self):
+        unit = Unit("1.23456789012345:meter/second**2")
+        assert str(unit) == "1.234567890123:meter/second^2"
+        assert unit.__str__(ndigits=2) == "1.23:meter/second^2"
+        assert str(unit) == "1.234567890123:meter/second^2"
+
+
+class TestUnitCache(object):
+    def test_shared_instances(self):
+        UNIT_CACHE.clear()
+        u1 = Unit("5:microliter")
+        u2 = Unit("5:microliter")
+        assert u1 is u2
+        assert UNIT_CACHE.info().hits == 1
+        assert UNIT_CACHE.info().misses == 1
+        assert Unit(5, "microliter") is Unit(5, "microliter")
+        assert Unit(5.0, "microliter") is not Unit(5, "microliter")
+        assert Unit(5.0, "microliter") == Unit(5, "microliter")
+
+    def test_cached_instances_are_immutable(self):
+        u = Unit("5:microliter")
+        with pytest.raises(RuntimeError):
+            u.magnitude = 10
+        total = u + Unit("1:microliter")
+        total += Unit("1:microliter")
+        assert u == Unit(5, "microliter")
+        assert total == Unit(7, "microliter")
+        assert str(Unit("5:microliter")) == "5:microliter"
+
+    def test_cached_instances_cant_be_converted_in_place(self):
+        u = Unit("5:microliter")
+        with pytest.raises(RuntimeError):
+            u.ito("milliliter")
+        with pytest.raises(RuntimeError):
+            u.ito_base_units()
+        u //= Unit("2:microliter")
+        assert u == 2
+        assert str(Unit("5:microliter")) == "5:microliter"
+
+        UNIT_CACHE.enabled = False
+        try:
+            u = Unit("5:microliter")
+            u.ito("milliliter")
+            assert u == Unit(5, "microliter")
+            assert Unit("5:microliter").magnitude == 5
+        finally:
+            UNIT_CACHE.enabled = True
+
+    def test_disabled(self):
+        UNIT_CACHE.enabled = False
+        try:
+            assert Unit("5:microliter") is not Unit("5:microliter")
+            u = Unit("5:microliter")
+            u.magnitude = 10
+            assert u == Unit(10, "microliter")
+        finally:
+            UNIT_CACHE.enabled = True
+
+    def test_lru_eviction(self):
+        cache = UnitCache(maxsize=2)
+        for key in ["1:ul", "2:ul", "1:ul", "3:ul"]:
+            if cache.get(key) is None:
+                cache.put(key, Unit(key))
+        assert cache.info() == (1, 3, 2, 2)
+        assert cache.get("2:ul") is None
+        assert cache.get("1:ul") is not None
+
+    def test_uncacheable_literals(self):
+        assert UnitCache.key({"value": 1, "units": "ul"}) is None
+        assert UnitCache.key(Decimal("1.0"), "ul") == ("1.0", "ul")
+        assert Unit({"value": 1, "units": "ul"}) == Unit(1, "microliter")
+
+
+class TestConversionTable(object):
+    def test_matches_registry(self):
+        for group in CONVERSION_TABLE.DEFAULT_GROUPS:
+            if "celsius" in group:
+                # the registry can't convert offset units with Decimals
+                continue
+            for src in group:
+                for dst in group:
+                    for value in ["0", "0.1", "123.456", "-3.3"]:
+                        unit = Unit(value, src)
+                        converted = unit.to(dst)
+                        CONVERSION_TABLE.enabled = False
+                        try:
+                            expected = unit.to(dst)
+                        finally:
+                            CONVERSION_TABLE.enabled = True
+                        assert repr(converted) == repr(expected)
+                        assert converted.magnitude == expected.magnitude
+
+    def test_offset_units(self):
+        assert Unit("1:celsius").to("kelvin") == Unit("274.15:kelvin")
+        assert Unit("274.15:kelvin").to("celsius") == Unit("1:celsius")
+        assert Unit("37:celsius").to("celsius") == Unit("37:celsius")
+
+    def test_falls_back_to_registry(self):
+        # pragma pylint: disable=protected-access
+        assert CONVERSION_TABLE.lookup(Unit("1:week")._units, "day") is None
+        assert Unit("2:week").to("day") == Unit("14:day")
+        assert Unit("1:ul").to(Unit("1:ml")) == Unit("0.001:milliliter")
+        with pytest.raises(ValueError):
+            Unit("1:ul").to("second")
+        with pytest.raises(UndefinedUnitError):
+            Unit("1:ul").to("foo")
+
+
+class TestRegistrySnapshot(object):
+    def test_load_registry(self, tmpdir):
+        built = load_registry(str(tmpdir))
+        assert len(tmpdir.listdir()) == 1
+        loaded = load_registry(str(tmpdir))
+        for name in ("_units", "_prefixes", "_groups", "_systems", "_contexts"):
+            assert getattr(loaded, name).keys() == getattr(built, name).keys()
+        assert loaded.get_group("root").members == built.get_group("root").members
+        assert loaded.Quantity(Decimal("1.5"), "milliliter").to(
+            "microliter"
+        ).magnitude == Decimal("1500")
+        assert str(loaded.Quantity(1, "pound").to_base_units()) == str(
+            built.Quantity(1, "pound").to_base_units()
+        )
+
+    def test_rebuilds_corrupted_snapshot(self, tmpdir):
+        load_registry(str(tmpdir))
+        (snapshot,) = tmpdir.listdir()
+        snapshot.write("corrupted")
+        registry = load_registry(str(tmpdir))
+        assert isinstance(registry, DecimalUnitRegistry)
+        assert snapshot.size() > len("corrupted")
+
+    def test_ignores_snapshots_others_can_write(self, tmpdir):
+        load_registry(str(tmpdir))
+        (snapshot,) = tmpdir.listdir()
+        snapshot.write("corrupted")
+        snapshot.chmod(0o666)
+        assert isinstance(load_registry(str(tmpdir)), DecimalUnitRegistry)
+        assert snapshot.size() > len("corrupted")
+        snapshot.write("corrupted")
+        tmpdir.chmod(0o777)
+        assert isinstance(load_registry(str(tmpdir)), DecimalUnitRegistry)
+        assert snapshot.read() == "corrupted"
+
+
+class TestFastArithmetic(object):
+    def test_matches_default_arithmetic(self):
+        pairs = [
+            (Unit("0.1:microliter"), Unit("0.2:microliter")),
+            (Unit("20:microliter"), Unit("3:milliliter")),
+            (Unit("1.5:mg"), Unit("1.5:mg")),
+            (Unit("90:second"), Unit("1:minute")),
+            (Unit("0:microliter"), Unit("0:nanoliter")),
+        ]
+        for a, b in pairs:
+            default = [a + b, a - b, a < b, a <= b, a == b, a != b, a > b]
+            with FAST_ARITHMETIC:
+                fast = [a + b, a - b, a < b, a <= b, a == b, a != b, a > b]
+            assert [str(_) for _ in default] == [str(_) for _ in fast]
+            assert [repr(_) for _ in default] == [repr(_) for _ in fast]
+
+    def test_unsupported_dimensionalities(self):
+        # pragma pylint: disable=protected-access, expression-not-assigned
+        with FAST_ARITHMETIC:
+            assert not FAST_ARITHMETIC.supports(Unit("1:celsius")._units)
+            assert str(Unit("5:celsius") - Unit("3:celsius")) == "2:delta_celsius"
+            assert FAST_ARITHMETIC.supports(Unit("1:nanoliter")._units)
+            with pytest.raises(ValueError):
+                Unit(20, "microliter") + Unit(30, "second")
+        assert FAST_ARITHMETIC.enabled is False
+
+    def test_hashable(self):
+        with FAST_ARITHMETIC:
+            assert hash(Unit("1:ml")) == hash(Unit("1000:microliter"))
+
+
+class TestUnitList(object):
+    def test_construction(self):
+        volumes = UnitList(["5:microliter", "10:microliter", "1:milliliter"])
+        assert volumes.units == "microliter"
+        assert volumes.magnitudes == [Decimal("5"), Decimal("10"), Decimal("1000")]
+        assert UnitList([1, "2:ul", Unit(3, "nl")], "nanoliter").magnitudes == [
+            Decimal("1"),
+            Decimal("2000"),
+            Decimal("3"),
+        ]
+        assert len(UnitList([])) == 0
+
+    def test_invalid_values(self):
+        with pytest.raises(UnitStringError):
+            UnitList(["1:2:ul"])
+        with pytest.raises(UnitValueError):
+            UnitList(["a:ul"])
+        with pytest.raises(UnitUnitsError):
+            UnitList([1, 2])
+        with pytest.raises(UnitUnitsError):
+            UnitList([1], "foo")
+        with pytest.raises(ValueError):
+            UnitList(["1:ul", "1:second"])
+
+    def test_matches_unit_semantics(self):
+        values = ["0.1:microliter", "0.2:microliter", "3:milliliter"]
+        array = UnitList(values)
+        units = [Unit(_).to("microliter") for _ in values]
+        assert list(array) == units
+        assert list(array.to("nanoliter")) == [_.to("nanoliter") for _ in units]
+        assert list(array + Unit("1:ul")) == [_ + Unit("1:ul") for _ in units]
+        assert list(array - array) == [_ - _ for _ in units]
+        assert list(array * 3) == [_ * 3 for _ in units]
+        assert list(array / 2) == [_ / 2 for _ in units]
+        assert list(array / Unit("0.1:ul")) == [_ / Unit("0.1:ul") for _ in units]
+        assert array.sum() == sum(units, Unit(0, "microliter"))
+        assert array.min() == min(units)
+        assert array.max() == max(units)
+        assert array[0] == units[0]
+        assert list(array[1:]) == units[1:]
+
+    def test_elementwise_comparison(self):
+        # pragma pylint: disable=expression-not-assigned
+        array = UnitList([1, 20, 300], "microliter")
+        assert (array < "20:microliter") == [True, False, False]
+        assert (array >= Unit(0.02, "milliliter")) == [False, True, True]
+        assert (array == UnitList([1, 2, 300], "microliter")) == [True, False, True]
+        assert (array != UnitList([1, 2, 300], "microliter")) == [False, True, False]
+        with pytest.raises(ValueError):
+            array < UnitList([1], "microliter")
+        with pytest.raises(ValueError):
+            array + Unit(1, "second")
+
+    def test_parse_unit(self):
+        array = UnitList([1, 2], "milliliter")
+        assert parse_unit(array, "microliter") is array
+        with pytest.raises(TypeError):
+            parse_unit(array, "second")
@@ -1,3 +1,7 @@
+import json
+
+from collections import defaultdict
+
 import pytest
 
 from autoprotocol.container_type import _CONTAINER_TYPES
@@ -5,7 +9,10 @@ from autoprotocol.instruction import LiquidHandle
 from autoprotocol.protocol import Protocol
 from autoprotocol.unit import Unit
 from autoprotocol.util import (
+    _ACCEPTED_DIMENSIONALITIES,
+    _as_json_compatible,
     _check_container_type_with_shape,
+    _remove_empty_fields,
     _validate_liha_shape,
     parse_unit,
 )
@@ -33,8 +40,50 @@ class TestParseUnit(object):
         with pytest.raises(TypeError):
             parse_unit("1:ul", ["second", "kg"])
 
+    def test_memoized_accepted_units(self):
+        parse_unit("1:ul", ["kg", "ml"])
+        assert ("kg", "ml") in _ACCEPTED_DIMENSIONALITIES
+        parse_unit("1:ul", [Unit("2:ml")])
+        assert not any(isinstance(_[0], Unit) for _ in _ACCEPTED_DIMENSIONALITIES)
+
+        for _ in range(2):
+            with pytest.raises(TypeError) as e:
+                parse_unit("1:ul", ["second", "kg"])
+            assert str(e.value) == (
+                "1 microliter is not of the expected dimensionality "
+                "[Unit(1, 'second'), Unit(1, 'kilogram')]"
+            )
+
 
 class TestUtil(object):
+    def test_remove_empty_fields(self):
+        data = {
+            "a": [None, {}, [], 0, False, Unit(0, "microliter")],
+            "b": {"c": {"d": None}, "e": [{"f": []}]},
+            "g": "",
+        }
+        assert _remove_empty_fields(data) == {
+            "a": [0, False, Unit(0, "microliter")],
+            "b": {"c": {}, "e": [{}]},
+            "g": "",
+        }
+        assert _remove_empty_fields(data, passes=2) == {
+            "a": [0, False, Unit(0, "microliter")],
+            "b": {"e": []},
+            "g": "",
+        }
+        assert _remove_empty_fields(data, passes=3) == {
+            "a": [0, False, Unit(0, "microliter")],
+            "b": {},
+            "g": "",
+        }
+        assert _remove_empty_fields("string") == "string"
+
+    def test_as_json_compatible(self):
+        value = {"a": ({1: True, None: [1.5]}, "b"), "c": defaultdict(dict)}
+        assert _as_json_compatible(value) == json.loads(json.dumps(value))
+        assert type(_as_json_compatible(value)["c"]) is dict
+
     def test_liha_validation(self):
         # asserts that no exception is raised if liha params are valid.
         # Otherwise, raises ValueError
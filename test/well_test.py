@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring,attribute-defined-outside-init
+# pragma pylint: disable=protected-access
 import warnings
 
 import pytest
@@ -109,6 +110,34 @@ class TestAddProperties(HasDummyWell):
         self.well.add_properties({"foo": ["baz"]})
         assert self.well.properties == {"foo": ["bar", "baz"]}
 
+    def test_add_properties_copies_shared_lists(self):
+        wells = self.container.wells(0, 1)
+        wells.add_properties({"foo": ["bar"]})
+        wells.add_properties({"foo": ["baz"]})
+        assert wells[0].properties == wells[1].properties == {"foo": ["bar", "baz"]}
+
+        source = self.container.well(2).set_properties({"foo": ["qux"]})
+        self.well._propagate_properties(source)
+        self.well.add_properties({"foo": ["quux"]})
+        assert source.properties == {"foo": ["qux"]}
+        source.add_properties({"foo": ["corge"]})
+        assert self.well.properties["foo"] == ["bar", "baz", "qux", "quux"]
+
+    def test_propagate_properties(self):
+        source = self.container.well(1).set_properties({"foo": {"bar": [1]}})
+        assert source._validated_properties() == {"foo": {"bar": [1]}}
+        self.well._propagate_properties(source)
+        assert self.well._validated_properties() == {"foo": {"bar": [1]}}
+        # the properties share their values, without copying them
+        assert self.well.properties["foo"] is source.properties["foo"]
+
+        # properties that are handed out could be mutated in place, so they're
+        # validated again
+        source.properties["baz"] = {1}
+        assert source._validated_properties() is None
+        with pytest.raises(TypeError):
+            self.container.well(2)._propagate_properties(source)
+
     def test_add_ctx_properties_appends_lists(self):
         self.well.set_ctx_properties({"foo": ["bar"]})
         self.well.add_ctx_properties({"foo": ["baz"]})